@@ -8,13 +8,16 @@ import geopandas as gpd
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import xarray as xr
 from hydromt.model import Model
 from hydromt.model.steps import hydromt_step
 
 from hydromt_fiat import workflows
 from hydromt_fiat.components.geom import GeomsComponent
-from hydromt_fiat.components.utils import pathing_config, pathing_expand
+from hydromt_fiat.components.utils import pathing_config, pathing_expand, read_vector
 from hydromt_fiat.errors import MissingRegionError
+from hydromt_fiat.gis.raster import cell_index
+from hydromt_fiat.gis.raster_utils import GridSignature, grid_signature
 from hydromt_fiat.gis.utils import crs_representation
 from hydromt_fiat.utils import (
     EXPOSURE,
@@ -33,6 +36,12 @@ __all__ = ["ExposureGeomsComponent"]
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+def _read_csv(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    if columns is None:
+        return pd.read_csv(path)
+    return pd.read_csv(path, usecols=lambda x: x in columns)
+
+
 class ExposureGeomsComponent(GeomsComponent):
     """Exposure geometries component.
 
@@ -57,21 +66,61 @@ class ExposureGeomsComponent(GeomsComponent):
         region_component: str | None = None,
     ):
         self._filename: Path | str = filename
+        self._cell_indices: dict[
+            str, tuple[GridSignature, npt.NDArray[np.int32 | np.int64]]
+        ] = {}
         super().__init__(
             model,
             region_component=region_component,
         )
 
+    ## Private methods
+    def _read_columns(
+        self,
+        path: Path,
+        columns: list[str],
+    ) -> pd.DataFrame:
+        """Read a selection of the attribute columns, including the csv data."""
+        df = read_vector(path, columns=columns, geometry=False)
+        csv_path = path.with_suffix(".csv")
+        if csv_path.is_file():
+            csv_data = _read_csv(csv_path, columns=columns)
+            # Prevent duplicate columns from the vector file
+            dup = [item for item in csv_data.columns if item in df.columns]
+            df = df.drop(columns=[item for item in dup if item != OBJECT__ID])
+            df = df.merge(csv_data, on=OBJECT__ID)
+        return df
+
+    def _source_columns(
+        self,
+        path: Path,
+    ) -> list[str]:
+        """Get the names of the attribute columns, including the csv data."""
+        columns = super()._source_columns(path)
+        csv_path = path.with_suffix(".csv")
+        if csv_path.is_file():
+            columns += [
+                item
+                for item in pd.read_csv(csv_path, nrows=0).columns
+                if item not in columns
+            ]
+        return columns
+
     ## I/O methods
     @hydromt_step
     def read(
         self,
         filename: Path | str | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
         r"""Read exposure geometry files.
 
         Key-word arguments are passed to :py:func:`geopandas.read_file`.
+        Columns that are not read can be fetched later on with
+        :py:meth:`fetch_columns`. Before writing, the columns that were not read
+        are loaded, so the files are written as a whole.
 
         Parameters
         ----------
@@ -80,6 +129,13 @@ class ExposureGeomsComponent(GeomsComponent):
             which will be used to determine the names/keys of the geometries.
             If None, the value(s) is/ are either taken from the model configurations or
             the `_filename` attribute, by default None.
+        columns : list[str], optional
+            The attribute columns to read (besides the geometry and the object
+            identifier). If None, all columns are read unless `lazy` is True.
+            By default None.
+        lazy : bool, optional
+            Whether to only read the geometry, the object identifier and the
+            selected columns, by default False.
         **kwargs : dict
             Additional keyword arguments that are passed to the
             `geopandas.read_file` function.
@@ -95,6 +151,11 @@ class ExposureGeomsComponent(GeomsComponent):
             or pathing_expand(self.root.path, filename=self._filename)
         )
         assert files is not None  # Yh..
+        # The object identifier is always needed to merge the csv data
+        if lazy or columns is not None:
+            columns = [OBJECT__ID] + [
+                item for item in columns or [] if item != OBJECT__ID
+            ]
         # Loop through the found files
         logger.info("Reading the exposure vector data..")
         for read_path, name in zip(*files):
@@ -102,15 +163,21 @@ class ExposureGeomsComponent(GeomsComponent):
                 continue
             logger.info(f"Reading the '{name}' geometry file at {read_path.as_posix()}")
             # Get the data
-            data = cast(gpd.GeoDataFrame, gpd.read_file(read_path, **kwargs))
+            data = cast(
+                gpd.GeoDataFrame,
+                read_vector(read_path, columns=columns, **kwargs),
+            )
             # Check for data in csv file, this has to be merged
             # TODO this should be solved better with help of the config file
             csv_path = read_path.with_suffix(".csv")
             if csv_path.is_file():
-                csv_data = pd.read_csv(csv_path)
+                csv_data = _read_csv(csv_path, columns=columns)
                 data = data.merge(csv_data, on=OBJECT__ID)
             # Set the data
             self.set(data=data, name=name)
+            self._sources[name] = read_path
+            if columns is not None:
+                self._projected.add(name)
 
     @hydromt_step
     def write(
@@ -150,7 +217,9 @@ class ExposureGeomsComponent(GeomsComponent):
 
         # Loop through the datasets
         logger.info("Writing the exposure vector data..")
-        for name, gdf in self.data.items():
+        for name in self.data:
+            # Load the columns that were not read, as to not truncate the files
+            gdf = self._load_columns(name)
             if len(gdf) == 0:
                 logger.warning(f"{name} is empty. Skipping...")
                 continue
@@ -181,6 +250,111 @@ class ExposureGeomsComponent(GeomsComponent):
         # Set the config entries
         self.model.config.set(EXPOSURE_GEOM, cfg)
 
+    ## Action methods
+    def cell_index(
+        self,
+        exposure_name: str,
+        grid: xr.Dataset | xr.DataArray,
+    ) -> npt.NDArray[np.int32 | np.int64]:
+        """Get the (flat) cell index of the objects in a grid.
+
+        The index is computed once and kept with the signature of the grid. It is
+        recomputed for another grid and dropped whenever the dataset is set again
+        (e.g. by :py:meth:`set` or an in place :py:meth:`clip`), making repeated
+        lookups (e.g. for multiple hazard events) O(1) per object. The dataset
+        itself is not altered, edit it in place only followed by :py:meth:`set`.
+
+        Parameters
+        ----------
+        exposure_name : str
+            The name of the existing dataset.
+        grid : xr.Dataset | xr.DataArray
+            The grid, e.g. the hazard data.
+
+        Returns
+        -------
+        npt.NDArray[np.int32 | np.int64]
+            The flat cell index (row * number of columns + column) per object, -1 for
+            objects outside of the grid. Int32 unless the grid is too large.
+        """
+        self._assert_entry(exposure_name)
+        gdf = self.data[exposure_name]
+        key = grid_signature(grid)
+        cached = self._cell_indices.get(exposure_name)
+        if cached is not None and cached[0] == key and len(cached[1]) == len(gdf):
+            return cached[1]
+
+        logger.info(f"Computing the cell index of '{exposure_name}'")
+        geometry = gdf.geometry
+        if grid.raster.crs is not None and gdf.crs is not None:
+            if not gdf.crs.equals(grid.raster.crs):
+                geometry = geometry.to_crs(grid.raster.crs)
+        rows, cols = cell_index(
+            geometry,
+            transform=grid.raster.transform,
+            shape=grid.raster.shape,
+        )
+        dtype = np.int32 if np.prod(grid.raster.shape) < 2**31 else np.int64
+        index = rows.astype(dtype) * grid.raster.shape[1] + cols
+        index[rows < 0] = -1
+
+        # Store the index with the signature of the grid
+        self._cell_indices[exposure_name] = (key, index)
+        return index
+
+    ## Mutating methods
+    @hydromt_step
+    def clear(self) -> None:
+        """Clear the exposure geometry data."""
+        self._cell_indices = {}
+        super().clear()
+
+    @hydromt_step
+    def clip(
+        self,
+        geom: gpd.GeoDataFrame,
+        inplace: bool = False,
+    ) -> dict[str, gpd.GeoDataFrame] | None:
+        """Clip the exposure vector data.
+
+        Geometry needs to be in the same crs (or lack thereof) as the data.
+
+        Parameters
+        ----------
+        geom : gpd.GeoDataFrame
+            The area to clip the data to.
+        inplace : bool, optional
+            Whether to do the clipping in place or return a new dictionary containing
+            the GeoDataFrames, by default False.
+
+        Returns
+        -------
+        dict[str, gpd.GeoDataFrame] | None
+            Return a dataset if the inplace is False.
+        """
+        if inplace:
+            self._cell_indices = {}
+        return super().clip(geom, inplace=inplace)
+
+    def set(
+        self,
+        data: gpd.GeoDataFrame,
+        name: str,
+    ) -> None:
+        """Set data in the exposure geometries component.
+
+        The stored cell index of the dataset (see :py:meth:`cell_index`) is dropped.
+
+        Arguments
+        ---------
+        data : gpd.GeoDataFrame
+            New geometry data to add.
+        name : str
+            Geometry name.
+        """
+        self._cell_indices.pop(name, None)
+        super().set(data=data, name=name)
+
     ## Setup methods
     @hydromt_step
     def setup(
@@ -13,7 +13,6 @@ from hydromt_fiat import workflows
 from hydromt_fiat.components.grid import GridComponent
 from hydromt_fiat.errors import MissingRegionError
 from hydromt_fiat.gis.raster import expand_raster_to_bounds
-from hydromt_fiat.gis.raster_utils import force_ns
 from hydromt_fiat.gis.utils import crs_representation
 from hydromt_fiat.utils import (
     EXPOSURE,
@@ -144,8 +143,8 @@ class ExposureGridComponent(GridComponent):
 
         # Write it in a gdal compliant manner by default
         logger.info(f"Writing the exposure grid data to {write_path.as_posix()}")
-        # Force north south before writing
-        self._data = force_ns(self.data)
+        # Force north south before writing, only flips when necessary
+        self._force_ns()
         write_nc(
             self.data,
             file_path=write_path,
@@ -177,6 +176,7 @@ class ExposureGridComponent(GridComponent):
         exposure_link_fname: Path | str | None = None,
         *,
         expand: bool = True,
+        conservative: bool = False,
         read_kwargs: dict[str, Any] | None = None,
         read_link_kwargs: dict[str, Any] | None = None,
     ) -> None:
@@ -193,6 +193,10 @@ class ExposureGridComponent(GridComponent):
             Whether to expand the hazard data to the bounding box of the model region.
             Nothing is done when the hazard data already covers the region.
             By default True.
+        conservative : bool, optional
+            Whether to regrid the exposure data conserving the totals, e.g. the
+            maximum damage per cell. Integer factor coarsening is done with lazy
+            block sums, other cases are remapped area weighted. By default False.
         read_kwargs : dict, optional
             Optional keyword arguments for reading the `exposure_fnames` data. These
             arguments are passed to the HydroMT
@@ -249,6 +253,7 @@ before setting up exposure grid"
             exposure_data=exposure_data,
             exposure_link=exposure_link,
             vulnerability=self.model.vulnerability.data.identifiers,
+            conservative=conservative,
         )
 
         # Expand if necessary
@@ -264,3 +269,59 @@ before setting up exposure grid"
         # Set the config entries
         logger.info("Setting the model type to 'grid'")
         self.model.config.set(MODEL_TYPE, GRID)
+
+    @hydromt_step
+    def setup_from_geoms(
+        self,
+        exposure_name: str,
+        *,
+        split: bool = False,
+        batch_size: int = 100000,
+    ) -> None:
+        """Set up an exposure grid by rasterizing exposure geometries.
+
+        The maximum potential damage of the objects is summed per cell of the
+        existing exposure grid or, if not present, the hazard grid.
+
+        Warning
+        -------
+        Run :py:meth:`~ExposureGeomsComponent.setup_link_vulnerability` and
+        :py:meth:`~ExposureGeomsComponent.setup_max_damage` beforehand
+        (see exposure geometries component).
+
+        Parameters
+        ----------
+        exposure_name : str
+            The name of the dataset in the exposure geometries component.
+        split : bool, optional
+            Whether to split the value of (polygon) objects over the cells they cover
+            based on the covered area. If False, the value is assigned to the cell
+            containing the centroid of the object. By default False.
+        batch_size : int, optional
+            The number of objects rasterized at once, by default 100000.
+        """
+        logger.info(f"Setting up gridded exposure from '{exposure_name}'")
+        self.model.exposure_geoms._assert_entry(exposure_name)
+
+        # Get the grid to rasterize to
+        grid_like = self.data if self.data.sizes != {} else self.model.hazard.data
+        if grid_like.sizes == {}:
+            raise RuntimeError(
+                "Exposure or hazard grid data is required \
+for rasterizing the exposure geometries"
+            )
+
+        # Execute the workflow function
+        ds = workflows.exposure_grid_rasterize(
+            exposure_data=self.model.exposure_geoms.data[exposure_name],
+            grid_like=grid_like,
+            split=split,
+            batch_size=batch_size,
+        )
+
+        # Set the dataset
+        self.set(ds)
+
+        # Set the config entries
+        logger.info("Setting the model type to 'grid'")
+        self.model.config.set(MODEL_TYPE, GRID)
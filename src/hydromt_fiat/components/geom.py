@@ -2,15 +2,21 @@
 
 import logging
 from abc import abstractmethod
+from pathlib import Path
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
+import pyogrio
 import shapely.geometry as sg
 from hydromt.model import Model
 from hydromt.model.components import SpatialModelComponent
 from hydromt.model.steps import hydromt_step
 from pyproj.crs import CRS
 
+from hydromt_fiat.components.utils import read_vector
+from hydromt_fiat.utils import OBJECT__ID
+
 __all__ = ["GeomsComponent"]
 
 logger = logging.getLogger(f"hydromt.{__name__}")
@@ -28,6 +34,8 @@ class GeomsComponent(SpatialModelComponent):
         region_component: str | None = None,
     ):
         self._data: dict[str, gpd.GeoDataFrame] | None = None
+        self._sources: dict[str, Path] = {}
+        self._projected: set[str] = set()
         super().__init__(
             model=model,
             region_component=region_component,
@@ -44,6 +52,38 @@ class GeomsComponent(SpatialModelComponent):
 i.e. a GeoDataFrame or run the appropriate `setup` method with '{name}' as input"
             )
 
+    def _read_columns(
+        self,
+        path: Path,
+        columns: list[str],
+    ) -> pd.DataFrame:
+        """Read a selection of the attribute columns from a file."""
+        return read_vector(path, columns=columns, geometry=False)
+
+    def _source_columns(
+        self,
+        path: Path,
+    ) -> list[str]:
+        """Get the names of the attribute columns in a file."""
+        return list(pyogrio.read_info(path)["fields"])
+
+    def _load_columns(
+        self,
+        name: str,
+    ) -> gpd.GeoDataFrame:
+        """Load the columns that were not read, so the dataset is complete."""
+        gdf = self.data[name]
+        if name not in self._projected:
+            return gdf
+        missing = [
+            item
+            for item in self._source_columns(self._sources[name])
+            if item not in gdf.columns
+        ]
+        gdf = self.fetch_columns(name, columns=missing)
+        self._projected.discard(name)
+        return gdf
+
     def _initialize(
         self,
         skip_read: bool = False,
@@ -98,8 +138,64 @@ i.e. a GeoDataFrame or run the appropriate `setup` method with '{name}' as input
     def clear(self) -> None:
         """Clear the geometry data."""
         self._data = None
+        self._sources = {}
+        self._projected = set()
         self._initialize(skip_read=True)
 
+    def fetch_columns(
+        self,
+        name: str,
+        columns: list[str] | str,
+    ) -> gpd.GeoDataFrame:
+        """Fetch columns not yet in memory from the file the data was read from.
+
+        Useful after reading with a column selection or in lazy mode. Columns
+        already present are left as is. The data is updated in place.
+
+        Parameters
+        ----------
+        name : str
+            The name of the geometry dataset.
+        columns : list[str] | str
+            The column(s) to fetch.
+
+        Returns
+        -------
+        gpd.GeoDataFrame
+            The geometry dataset including the fetched columns.
+        """
+        self._assert_entry(name)
+        gdf = self.data[name]
+        if isinstance(columns, str):
+            columns = [columns]
+        missing = [item for item in columns if item not in gdf.columns]
+        if len(missing) == 0:
+            return gdf
+        if name not in self._sources:
+            raise RuntimeError(
+                f"No source file known for '{name}', can not fetch columns {missing}"
+            )
+
+        logger.info(f"Fetching columns {missing} of '{name}'")
+        join = OBJECT__ID in gdf.columns
+        # Read only the missing columns (and the identifier to join on)
+        df = self._read_columns(
+            self._sources[name],
+            columns=missing + [OBJECT__ID] if join else missing,
+        )
+        not_found = [item for item in missing if item not in df.columns]
+        if len(not_found) != 0:
+            raise ValueError(f"Columns {not_found} not found in the '{name}' source")
+        # Align either on the object identifier or on the (row number) index
+        if join:
+            df = df.drop_duplicates(OBJECT__ID).set_index(OBJECT__ID)
+            for item in missing:
+                gdf[item] = gdf[OBJECT__ID].map(df[item])
+        else:
+            for item in missing:
+                gdf[item] = df[item].reindex(gdf.index)
+        return gdf
+
     @hydromt_step
     def clip(
         self,
@@ -192,6 +288,9 @@ i.e. a GeoDataFrame or run the appropriate `setup` method with '{name}' as input
     ) -> None:
         """Set data in the geoms component.
 
+        When the data replaces a dataset that was read, the file it was read from
+        is no longer considered its source, i.e. columns can not be fetched anymore.
+
         Arguments
         ---------
         data : gpd.GeoDataFrame
@@ -201,8 +300,17 @@ i.e. a GeoDataFrame or run the appropriate `setup` method with '{name}' as input
         """
         self._initialize()
         assert self._data is not None
-        if name in self._data and id(self._data.get(name)) != id(data):
-            logger.warning(f"Replacing geometry data: {name}")
+        if id(self._data.get(name)) != id(data):
+            if name in self._data:
+                logger.warning(f"Replacing geometry data: {name}")
+            # The rows of the new data need not match the source file
+            self._sources.pop(name, None)
+            if name in self._projected:
+                logger.warning(
+                    f"'{name}' was read with a column selection, the columns \
+not read are not part of the new data"
+                )
+                self._projected.discard(name)
 
         if "fid" in data.columns:
             logger.warning(
@@ -30,6 +30,7 @@ class GridComponent(SpatialModelComponent):
         region_component: str | None = None,
     ):
         self._data: xr.Dataset | None = None
+        self._ns: bool = True
         super().__init__(
             model=model,
             region_component=region_component,
@@ -44,6 +45,17 @@ class GridComponent(SpatialModelComponent):
             if self.root.is_reading_mode() and not skip_read:
                 self.read()
 
+    def _force_ns(self) -> None:
+        """Force the data in north-south orientation.
+
+        The orientation is recorded when setting the data, therefore the data is
+        only flipped (once) when it is known not to be in north-south orientation.
+        """
+        if self._ns or self._data is None or len(self._data.data_vars) == 0:
+            return
+        self._data = force_ns(self._data)
+        self._ns = True
+
     def _check_spatial(self) -> bool:
         try:
             self.data.raster.set_spatial_dims()
@@ -124,6 +136,7 @@ class GridComponent(SpatialModelComponent):
     def clear(self) -> None:
         """Clear the gridded data."""
         self._data = None
+        self._ns = True
         self._initialize(skip_read=True)
 
     @hydromt_step
@@ -204,6 +217,7 @@ class GridComponent(SpatialModelComponent):
         # If inplace, just set the data and return nothing
         if inplace:
             self._data = data
+            self._ns = False  # Orientation unknown, check when needed
             return None
         return data
 
@@ -235,12 +249,34 @@ class GridComponent(SpatialModelComponent):
         if not isinstance(data, xr.Dataset):
             raise TypeError(f"Wrong input data type: '{data.__class__.__name__}'")
 
-        # Force ns orientation
-        data = force_ns(data)
+        # Record the orientation, flipping is deferred until it's needed.
+        # The orientation is determined by the first data set to the component,
+        # other data is aligned on the coordinates
+        if len(self._data.data_vars) == 0 and len(data.data_vars) != 0:
+            self._ns = data.raster.res[1] < 0
         # Set thet data
         for dvar in data.data_vars:
             logger.info(f"Adding {dvar} to {self.__class__.__name__}")
             if dvar in self._data:
                 logger.warning(f"Replacing grid map: '{dvar}'")
+                # Drop the old map together with the dimensions (and their
+                # coordinates, e.g. 'rp' of the events) only it used
+                self._data = self._data.drop_vars([dvar])
+                used = {dim for da in self._data.data_vars.values() for dim in da.dims}
+                self._data = self._data.drop_dims(
+                    [dim for dim in self._data.dims if dim not in used]
+                )
+            # Prevent silently reindexing onto the (non spatial) dimensions in use
+            spatial = (data.raster.y_dim, data.raster.x_dim)
+            for dim in data[dvar].dims:
+                if (
+                    dim not in spatial
+                    and dim in self._data.indexes
+                    and dim in data.indexes
+                    and not self._data.indexes[dim].equals(data.indexes[dim])
+                ):
+                    raise ValueError(
+                        f"Dimension '{dim}' of '{dvar}' doesn't match the grid"
+                    )
             self._data[dvar] = data[dvar]
         self._data.attrs.update(data.attrs)
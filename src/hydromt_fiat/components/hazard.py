@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import xarray as xr
 from hydromt.model import Model
 from hydromt.model.steps import hydromt_step
 from hydromt.readers import open_nc
@@ -13,7 +14,6 @@ from hydromt_fiat import workflows
 from hydromt_fiat.components.grid import GridComponent
 from hydromt_fiat.errors import MissingRegionError
 from hydromt_fiat.gis.raster import expand_raster_to_bounds
-from hydromt_fiat.gis.raster_utils import force_ns
 from hydromt_fiat.gis.utils import crs_representation
 from hydromt_fiat.utils import (
     HAZARD,
@@ -143,8 +143,8 @@ class HazardComponent(GridComponent):
 
         # Write it in a gdal compliant manner by default
         logger.info(f"Writing the hazard data to {write_path.as_posix()}")
-        # Force north south before writing
-        self._data = force_ns(self.data)
+        # Force north south before writing, only flips when necessary
+        self._force_ns()
         write_nc(
             self.data,
             file_path=write_path,
@@ -159,6 +159,7 @@ class HazardComponent(GridComponent):
         # Update the config
         self.model.config.set(HAZARD_FILE, write_path)
         # Check for multiple bands, because gdal and netcdf..
+        # N.b. stacked data (single variable) is read as a multiband grid
         self.model.config.set(f"{HAZARD_SETTINGS}.{VAR_AS_BAND}", False)
         if len(self.data.data_vars) > 1:
             self.model.config.set(f"{HAZARD_SETTINGS}.{VAR_AS_BAND}", True)
@@ -180,6 +181,8 @@ class HazardComponent(GridComponent):
         unit: str = "m",
         expand: bool = True,
         region: bool = True,
+        stack: bool = False,
+        time_reduce: str = "max",
         read_kwargs: dict[str, Any] | None = None,
     ) -> None:
         """Set up hazard maps.
@@ -204,6 +207,15 @@ class HazardComponent(GridComponent):
             By default True.
         region : bool, optional
             Whether or not to use the model region. By default True.
+        stack : bool, optional
+            Whether to stack the hazard maps in a single variable with an 'event'
+            dimension (chunked per event) instead of one variable per map. This is
+            recommended for large (stochastic) event sets. By default False.
+        time_reduce : str, optional
+            The statistic ('max', 'mean', 'min' or 'sum') used to reduce hazard data
+            with a 'time' dimension (e.g. hydrodynamic model output) to a single map.
+            The reduction is done chunk-wise, never loading the full time stack.
+            By default 'max'.
         read_kwargs : dict, optional
             Optional keyword arguments for reading the `hazard_fnames` data. These
             arguments are passed to the HydroMT
@@ -254,6 +266,8 @@ class HazardComponent(GridComponent):
             return_periods=return_periods,
             risk=risk,
             unit=unit,
+            stack=stack,
+            time_reduce=time_reduce,
         )
 
         # Expand if necessary
@@ -270,3 +284,63 @@ class HazardComponent(GridComponent):
         self.model.config.set(MODEL_RISK, risk)
         if risk:
             self.model.config.set(HAZARD_RP, return_periods)
+
+    ## Analysis methods
+    def sample(
+        self,
+        exposure_name: str,
+    ) -> xr.DataArray:
+        """Sample the hazard data at the objects of an exposure dataset.
+
+        Parameters
+        ----------
+        exposure_name : str
+            The name of the exposure dataset in the exposure geometries component.
+
+        Returns
+        -------
+        xr.DataArray
+            The hazard values per object and event, with dimensions (object, event).
+        """
+        if self.data.sizes == {}:
+            raise RuntimeError("No hazard data set, run `setup` first")
+
+        # Use the stored cell index of the objects, recomputed if outdated
+        cells = self.model.exposure_geoms.cell_index(exposure_name, grid=self.data)
+        return workflows.hazard_sample(
+            hazard=self.data,
+            exposure_data=self.model.exposure_geoms.data[exposure_name],
+            cells=cells,
+        )
+
+    def zonal(
+        self,
+        exposure_name: str,
+        *,
+        tile_size: int = 256,
+    ) -> xr.Dataset:
+        """Compute area weighted hazard statistics over an exposure dataset.
+
+        Parameters
+        ----------
+        exposure_name : str
+            The name of the exposure dataset in the exposure geometries component.
+        tile_size : int, optional
+            The size of the tiles (in cells) in which the objects are processed,
+            by default 256.
+
+        Returns
+        -------
+        xr.Dataset
+            The area weighted mean, the maximum and the wet fraction per object
+            and event, with dimensions (object, event).
+        """
+        if self.data.sizes == {}:
+            raise RuntimeError("No hazard data set, run `setup` first")
+        self.model.exposure_geoms._assert_entry(exposure_name)
+
+        return workflows.hazard_zonal(
+            hazard=self.data,
+            exposure_data=self.model.exposure_geoms.data[exposure_name],
+            tile_size=tile_size,
+        )
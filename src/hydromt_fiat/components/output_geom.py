@@ -15,9 +15,15 @@ from hydromt_fiat.components.utils import (
     ensure_path_listing,
     pathing_config,
     pathing_expand,
+    read_vector,
+)
+from hydromt_fiat.utils import (
+    EXPOSURE_GEOM_FILE,
+    GEOMETRY,
+    OBJECT__ID,
+    OUTPUT_GEOM_NAME,
+    POST,
 )
-from hydromt_fiat.gis import create_square_vector_grid
-from hydromt_fiat.utils import EXPOSURE_GEOM_FILE, GEOMETRY, OUTPUT_GEOM_NAME, POST
 
 __all__ = ["OutputGeomsComponent"]
 
@@ -116,14 +122,25 @@ column will be removed"
     def read(
         self,
         filename: str | None = None,
+        columns: list[str] | None = None,
+        lazy: bool = False,
         **kwargs,
     ) -> None:
         """Read the model output geometries.
 
+        Columns that are not read can be fetched later on with
+        :py:meth:`fetch_columns`.
+
         Parameters
         ----------
         filename : str, optional
             The path to a FIAT model output vector file, by default None.
+        columns : list[str], optional
+            The attribute columns to read (besides the geometry). If None, all
+            columns are read unless `lazy` is True. By default None.
+        lazy : bool, optional
+            Whether to only read the geometry and the selected columns (or only the
+            object identifier if no columns are selected), by default False.
         **kwargs : dict
             Additional keyword arguments that are passed to the
             `geopandas.read_file` function.
@@ -164,6 +181,8 @@ column will be removed"
         files = files or pathing_config(outfiles)
         if files is None:
             return
+        if lazy and columns is None:
+            columns = [OBJECT__ID]
 
         # Read the output data
         logger.info("Reading model geometry outputs")
@@ -173,8 +192,14 @@ column will be removed"
                 continue
             logger.info(f"Reading the '{name}' output file at {read_path.as_posix()}")
             # Read the data and set it
-            data = cast(gpd.GeoDataFrame, gpd.read_file(read_path, **kwargs))
+            data = cast(
+                gpd.GeoDataFrame,
+                read_vector(read_path, columns=columns, **kwargs),
+            )
             self.set(data=data, name=name)
+            self._sources[name] = read_path
+            if columns is not None:
+                self._projected.add(name)
 
     def write(
         self,
@@ -234,6 +259,7 @@ column will be removed"
         method: str = "mean",
         areal_mean: bool = False,
         per_area: bool = False,
+        split: bool = False,
         name: str | None = None,
     ):
         """Aggregate data spatially.
@@ -256,6 +282,11 @@ column will be removed"
             Whether or not to calculate per unit area using the aggregation area (True)
             or the combined (based on method) area of the features in the `output_data`.
             By default False.
+        split : bool, optional
+            Whether to split the values of objects crossing the borders of the
+            aggregation areas in proportion to the area (or length) within each area,
+            instead of assigning them based on their centroid. Only supported for
+            the 'sum' and 'mean' methods. By default False.
         name : str, optional
             The name of the new post processed dataset in the `processed` attribute.
             If not provided, 'output_name' is used with the 'sp_aggr' suffix.
@@ -283,11 +314,129 @@ using the '{method}' aggregation method"
             method=method,
             areal_mean=areal_mean,
             per_area=per_area,
+            split=split,
         )
 
         # Set the data
         self._set(data=aggregated_data, name=name or f"{output_name}_sp_aggr")
 
+    @hydromt_step
+    def spatial_stream_aggregate(
+        self,
+        output_fname: Path | str,
+        aggregation_areas_fname: str | gpd.GeoDataFrame,
+        *,
+        method: str | list[str] = "mean",
+        batch_size: int = 100000,
+        name: str | None = None,
+    ) -> None:
+        """Aggregate a FIAT output vector file spatially without loading it.
+
+        The file is read in batches of features, keeping the memory usage fixed
+        regardless of the size of the output. The objects are assigned to an area
+        based on their centroid.
+
+        Parameters
+        ----------
+        output_fname : Path | str
+            The path to the FIAT output vector file. A relative path is taken
+            relative to the output directory of the model.
+        aggregation_areas_fname : str | gpd.GeoDataFrame
+            The dataset with areas over which to aggregate the data.
+        method : str | list[str], optional
+            The method(s) of aggregation, choose from 'sum', 'count', 'min', 'max'
+            and 'mean'. With multiple methods, the resulting columns are suffixed with
+            the method. By default "mean".
+        batch_size : int, optional
+            The number of features to read at once, by default 100000.
+        name : str, optional
+            The name of the new post processed dataset in the `processed` attribute.
+            If not provided, the stem of 'output_fname' is used with the 'sp_aggr'
+            suffix. By default None.
+        """
+        output_fname = Path(output_fname)
+        if not output_fname.is_absolute():
+            output_fname = Path(self.model.config.output_dir, output_fname)
+        if not output_fname.is_file():
+            raise FileNotFoundError(output_fname.as_posix())
+
+        logger.info(
+            f"Streaming spatial aggregate of '{output_fname.as_posix()}' over a \
+provided dataset using the '{method}' aggregation method"
+        )
+        # Get the aggregation area from the data catalog
+        aggregation_areas = self.data_catalog.get_geodataframe(
+            data_like=aggregation_areas_fname,
+        )
+        # Aggregation in batches
+        aggregated_data = workflows.aggregate_stream(
+            path=output_fname,
+            aggregation_areas=aggregation_areas,
+            method=method,
+            batch_size=batch_size,
+        )
+
+        # Set the data
+        self._set(data=aggregated_data, name=name or f"{output_fname.stem}_sp_aggr")
+
+    @hydromt_step
+    def spatial_multi_aggregate(
+        self,
+        output_name: str,
+        aggregation_areas_fnames: dict[str, str | gpd.GeoDataFrame],
+        *,
+        methods: list[str] | None = None,
+        name: str | None = None,
+    ) -> None:
+        """Aggregate data spatially over multiple sets of areas and methods at once.
+
+        The output data is prepared once and all methods are computed in one go per
+        set of aggregation areas.
+
+        Parameters
+        ----------
+        output_name : str
+            The name of the dataset in the data of the component, this can either be raw
+            FIAT model output data or already processed data in the `processed`
+            data attribute.
+        aggregation_areas_fnames : dict[str, str | gpd.GeoDataFrame]
+            The datasets with areas over which to aggregate the data, with a (short)
+            name per dataset as keys, e.g. {'municipality': 'municipalities'}.
+        methods : list[str], optional
+            The methods of aggregation. The resulting columns are suffixed with the
+            method, e.g. 'max_damage_content_sum'. By default ['sum', 'mean', 'count'].
+        name : str, optional
+            The prefix of the new post processed datasets in the `processed` attribute,
+            these are named '{name}_{key}_sp_aggr'. If not provided, 'output_name' is
+            used. By default None.
+        """
+        # Check the output_name's existence
+        self._assert_output_entry(output_name)
+        methods = methods or ["sum", "mean", "count"]
+
+        logger.info(
+            f"Spatial aggregate of '{output_name}' over \
+{list(aggregation_areas_fnames)} using the {methods} aggregation methods"
+        )
+        # Get the aggregation areas from the data catalog
+        aggregation_areas = {
+            key: self.data_catalog.get_geodataframe(data_like=item)
+            for key, item in aggregation_areas_fnames.items()
+        }
+        # Call the workflow methods, the output data is only prepped once
+        output_data = workflows.prep_data_for_aggregation(
+            output_data=self.combined_data[output_name],
+        )
+        aggregated_data = workflows.aggregate_layers(
+            output_data=output_data,
+            aggregation_areas=aggregation_areas,
+            methods=methods,
+        )
+
+        # Set the data
+        for key, data in aggregated_data.items():
+            self._set(data=data, name=f"{name or output_name}_{key}_sp_aggr")
+
     @hydromt_step
     def spatial_square_aggregate(
         self,
@@ -296,10 +445,15 @@ using the '{method}' aggregation method"
         res: float | int = 1,
         unit: str = "km",
         method: str = "mean",
+        keep_empty: bool = False,
         name: str | None = None,
     ) -> None:
         """Aggregate FIAT vector output data to a square cell grid.
 
+        The resulting dataset contains the geometry of the cells, a 'square_id'
+        column (the row-major number of the cell in the grid) and the aggregated
+        values. By default, only the cells containing objects are kept.
+
         Parameters
         ----------
         output_name : str
@@ -312,6 +466,9 @@ using the '{method}' aggregation method"
             The unit of the res variables. By default 'km'.
         method : str, optional
             The method of aggregation, by default "mean".
+        keep_empty : bool, optional
+            Whether to keep the grid cells without any objects (i.e. the full grid).
+            By default False, i.e. only the occupied cells are returned.
         name : str, optional
             The name of the new post processed dataset in the `processed` attribute.
             If not provided, 'output_name' is used with the 'sq_aggr' suffix.
@@ -329,19 +486,13 @@ using the '{method}' aggregation method"
             output_data=self.combined_data[output_name],
         )
 
-        # Create a square vector grid
-        aggregation_areas = create_square_vector_grid(
-            bbox=output_data.total_bounds,
-            crs=output_data.crs,
-            res=res,
-            unit=unit,
-        )
-
         # Call the aggregation function
-        aggregated_data = workflows.aggregate_spatially(
+        aggregated_data = workflows.aggregate_square(
             output_data=output_data,
-            aggregation_areas=aggregation_areas,
+            res=res,
+            unit=unit,
             method=method,
+            keep_empty=keep_empty,
         )
 
         # Clip based on the region
@@ -1,10 +1,13 @@
 """Component utilities."""
 
 import re
+from importlib.util import find_spec
 from os.path import relpath
 from pathlib import Path
 from typing import Any
 
+import geopandas as gpd
+import pandas as pd
 from hydromt._utils.naming_convention import _expand_uri_placeholders
 
 MOUNT_PATTERN = re.compile(r"(^\/(\w+)\/|^(\w+):\/).*$")
@@ -128,3 +131,24 @@ def pathing_config(
     # Remove entries with no files and get the names of the remaining ones
     n = [item.stem for item in ep]
     return ep, n
+
+
+## Vector data related
+def read_vector(
+    path: Path,
+    columns: list[str] | None = None,
+    geometry: bool = True,
+    **kwargs,
+) -> gpd.GeoDataFrame | pd.DataFrame:
+    """Read (a selection of the columns of) a vector file.
+
+    When a selection of the columns is read, the data is read through Arrow if
+    available (i.e. pyarrow is installed and the engine is pyogrio).
+    """
+    if columns is not None:
+        kwargs["columns"] = columns
+        if find_spec("pyarrow") is not None and kwargs.get("engine") != "fiona":
+            kwargs.setdefault("use_arrow", True)
+    if not geometry:
+        kwargs["ignore_geometry"] = True
+    return gpd.read_file(path, **kwargs)
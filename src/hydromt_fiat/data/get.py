@@ -1,19 +1,28 @@
 """Download data from minio s3 bucket."""
 
+import hashlib
 import json
 import logging
+import math
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
 
 import requests
-import urllib3
-from minio import Minio, datatypes
 
 from hydromt_fiat.data.unpack import _is_archive, untar, unzip
 from hydromt_fiat.data.utils import file_hash
 from hydromt_fiat.utils import PATH, REGISTRY, VERSION
 
+if TYPE_CHECKING:
+    from minio import Minio, datatypes
+
 __all__ = ["fetch_data"]
 
 # Settings
@@ -23,30 +32,11 @@ ENDPOINT = "s3.deltares.nl"  # "10.255.255.1:900" non routable for testing
 HASH_ALGORITM = "md5"
 HASHKEY = "hash"
 LIB_DATA_DIR = Path(__file__).parent
+MAX_WORKERS = 4  # Number of concurrent (ranged) requests per download
+MIRRORS_ENV = "HYDROMT_FIAT_MIRRORS"  # Comma separated mirrors
+PART_SIZE = 50 * 1024**2  # Size of the ranged requests
 REMOTE_REGISTRY = "https://raw.githubusercontent.com/Deltares/hydromt_fiat/refs/heads/main/src/hydromt_fiat/data/registry.json"
 
-# Keys
-with open(Path(LIB_DATA_DIR, "access.key"), "r") as reader:
-    ACCESS_KEY = reader.read().strip()
-with open(Path(LIB_DATA_DIR, "secret.key"), "r") as reader:
-    SECRET_KEY = reader.read().strip()
-
-# Client
-HTTPS_CLIENT = urllib3.PoolManager(
-    timeout=urllib3.Timeout(
-        connect=10.0,  # max time to establish connection
-        read=300.0,  # max time to read response
-    ),
-    retries=False,
-)
-CLIENT = Minio(
-    endpoint=ENDPOINT,
-    access_key=ACCESS_KEY,
-    secret_key=SECRET_KEY,
-    http_client=HTTPS_CLIENT,
-    secure=True,
-    region="eu-west-1",
-)
 # Unpack dictionary
 UNPACK = {
     0: untar,
@@ -56,15 +46,214 @@ UNPACK = {
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+@cache
+def get_client(
+    endpoint: str | None = None,
+    secure: bool = True,
+    access_key: str | None = None,
+    secret_key: str | None = None,
+) -> "Minio":
+    """Get the client of the minio bucket.
+
+    Created on first use (per endpoint), as it is not needed when importing the
+    package. Only the default endpoint uses the keys that come with the package,
+    other endpoints (mirrors) use their own keys or are accessed anonymously.
+
+    Parameters
+    ----------
+    endpoint : str, optional
+        The (S3 compatible) endpoint. If None, the default 's3.deltares.nl' is used.
+        By default None.
+    secure : bool, optional
+        Whether to use https, by default True.
+    access_key : str, optional
+        The access key of the endpoint, by default None.
+    secret_key : str, optional
+        The secret key of the endpoint, by default None.
+
+    Returns
+    -------
+    Minio
+        The client.
+    """
+    import urllib3
+    from minio import Minio
+
+    region = None
+    if endpoint is None:
+        endpoint = ENDPOINT
+        region = "eu-west-1"
+        # Keys
+        with open(Path(LIB_DATA_DIR, "access.key"), "r") as reader:
+            access_key = reader.read().strip()
+        with open(Path(LIB_DATA_DIR, "secret.key"), "r") as reader:
+            secret_key = reader.read().strip()
+
+    https_client = urllib3.PoolManager(
+        timeout=urllib3.Timeout(
+            connect=10.0,  # max time to establish connection
+            read=300.0,  # max time to read response
+        ),
+        maxsize=MAX_WORKERS,  # Allow for the concurrent ranged requests
+        retries=False,
+    )
+    return Minio(
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        http_client=https_client,
+        secure=secure,
+        region=region,
+    )
+
+
+def _local_path(mirror: str) -> Path | None:
+    """Get the path of a local mirror, None for an S3 mirror."""
+    url = urlparse(mirror)
+    if url.scheme == "file":
+        return Path(url2pathname(url.path))
+    if url.scheme in ("s3", "s3+http"):
+        return None
+    return Path(mirror)
+
+
+def _s3_client(mirror: str) -> "Minio":
+    """Get the client of an S3 mirror, with the credentials in its url (if any)."""
+    url = urlparse(mirror)
+    endpoint = url.netloc.rsplit("@", 1)[-1]
+    if endpoint == ENDPOINT and url.username is None:
+        return get_client()
+    return get_client(
+        endpoint,
+        url.scheme == "s3",
+        unquote(url.username) if url.username is not None else None,
+        unquote(url.password) if url.password is not None else None,
+    )
+
+
+def _display(mirror: str) -> str:
+    """Get the mirror without the credentials, for logging."""
+    url = urlparse(mirror)
+    if url.password is None and url.username is None:
+        return mirror
+    return url._replace(netloc=url.netloc.rsplit("@", 1)[-1]).geturl()
+
+
+def get_mirrors(
+    mirrors: list[str] | str | None = None,
+) -> list[str]:
+    """Get the mirrors in order of priority.
+
+    A mirror is either a local directory (path or 'file://' url), a registry file
+    ('file://' url to a json file) or an S3 compatible endpoint ('s3://host:port' or
+    's3+http://host:port' without tls) holding the same bucket. The credentials of
+    an endpoint are part of the url ('s3://access_key:secret_key@host:port'),
+    without them the endpoint is accessed anonymously. The data are
+    expected under the same keys as in the bucket, i.e. '<path>/<version>/<file>',
+    and the registry (if any) as 'registry.json' in a local directory.
+
+    Parameters
+    ----------
+    mirrors : list[str] | str, optional
+        The mirrors, preceding the ones set in the 'HYDROMT_FIAT_MIRRORS'
+        environment variable (comma separated). By default None.
+
+    Returns
+    -------
+    list[str]
+        The mirrors.
+    """
+    if isinstance(mirrors, str):
+        mirrors = [mirrors]
+    env = os.environ.get(MIRRORS_ENV, "").split(",")
+    return [*(mirrors or []), *[item.strip() for item in env if item.strip()]]
+
+
+def _probe(mirror: str, obj: str) -> float | None:
+    """Get the response time of a mirror for an object, None if unreachable."""
+    start = time.perf_counter()
+    path = _local_path(mirror)
+    try:
+        if path is not None:
+            if not Path(path, obj).is_file():
+                return None
+        else:
+            _s3_client(mirror).stat_object(BUCKET, obj)
+    except Exception as err:  # Whatever the reason, it is not usable
+        logger.debug(f"Mirror {_display(mirror)} is not reachable: {err}")
+        return None
+    return time.perf_counter() - start
+
+
+def select_mirrors(
+    obj: str,
+    mirrors: list[str],
+) -> list[str]:
+    """Select the mirrors to fetch an object from.
+
+    The mirrors are probed concurrently (stat or HEAD request). The reachable ones
+    are returned fastest first, followed by the default bucket as fallback.
+
+    Parameters
+    ----------
+    obj : str
+        The object, i.e. '<path>/<version>/<file>'.
+    mirrors : list[str]
+        The mirrors in order of priority.
+
+    Returns
+    -------
+    list[str]
+        The mirrors to try in order.
+    """
+    default = f"s3://{ENDPOINT}"
+    if len(mirrors) == 0:
+        return [default]
+    with ThreadPoolExecutor(max_workers=len(mirrors)) as pool:
+        latency = list(pool.map(lambda item: _probe(item, obj), mirrors))
+    # Sorting is stable, so equally fast mirrors keep their priority
+    reachable = sorted(
+        [(item, mirror) for item, mirror in zip(latency, mirrors) if item is not None],
+        key=lambda item: item[0],
+    )
+    logger.info(
+        f"Reachable mirror(s) for '{obj}': {[_display(item[1]) for item in reachable]}"
+    )
+    return [*[item[1] for item in reachable], default]
+
+
+def _mirror_registry(mirrors: list[str]) -> str | None:
+    """Read the registry of the first local mirror that has one."""
+    for mirror in mirrors:
+        path = _local_path(mirror)
+        if path is None:
+            continue
+        if path.suffix != ".json":
+            path = Path(path, f"{REGISTRY}.json")
+        if path.is_file():
+            logger.info(f"Using the registry from {path.as_posix()}")
+            with open(path, "r") as f:
+                return f.read()
+    return None
+
+
 def get_registry(
     local: bool = True,
+    mirrors: list[str] | str | None = None,
 ) -> dict[str, dict[str, Any]]:
-    """Get the registry."""
-    # Get the data either from the local repo or remote repo
+    """Get the registry.
+
+    The non local registry is taken from the first local mirror that has one,
+    otherwise from the remote repository.
+    """
+    # Get the data either from the local repo, a mirror or remote repo
+    data: str | None = None
     if local:
         with open(LIB_DATA_DIR / f"{REGISTRY}.json", "r") as f:
             data = f.read()
     else:
+        data = _mirror_registry(get_mirrors(mirrors))
+    if data is None:
         r = requests.get(REMOTE_REGISTRY, timeout=5)
         data = r.text
 
@@ -87,7 +276,7 @@ def get_entry(
 
 
 def assert_remote_hash(
-    stat: datatypes.Object,
+    stat: "datatypes.Object",
     known_hash: str,
 ) -> None:
     """Check remote hash match.
@@ -100,35 +289,223 @@ def assert_remote_hash(
         )
 
 
+def _stamp_path(file: Path) -> Path:
+    return file.with_name(f"{file.name}.stamp")
+
+
+def write_stamp(
+    file: Path,
+    hash: str,
+) -> None:
+    """Write a stamp of a verified file.
+
+    The stamp records the size, modification time and hash of the file, so that
+    the file does not need to be hashed again as long as it is unchanged.
+    """
+    stat = file.stat()
+    with open(_stamp_path(file), "w") as writer:
+        json.dump(
+            {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, HASHKEY: hash},
+            writer,
+        )
+
+
 def check_local_hash(
     file: Path,
     hash: str,
 ) -> bool:
     """Check local hash match.
 
-    Done between a local file and the known hash from the registry.
+    Done between a local file and the known hash from the registry. The file is
+    only hashed if its stamp is missing or stale.
     """
     logger.info(
         f"Checking whether '{file.name}' is already locally cached \
 with correct hash"
     )
+    stamp_path = _stamp_path(file)
     if not file.exists():
+        stamp_path.unlink(missing_ok=True)
         return False
+    # Check the stamp first, which is valid if the file is unchanged
+    if stamp_path.is_file():
+        with open(stamp_path, "r") as reader:
+            stamp = json.load(reader)
+        stat = file.stat()
+        if stamp == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, HASHKEY: hash}:
+            logger.info(f"Existing file: '{file.name}' has a valid stamp for {hash}")
+            return True
     flag = file_hash(file, hash_alg=HASH_ALGORITM) == hash
     if not flag:
         os.unlink(file)
+        stamp_path.unlink(missing_ok=True)
         return flag
+    write_stamp(file, hash)
     logger.info(f"Existing file: '{file.name}' matches the hash {hash}")
     return flag
 
 
+def _download_part(
+    client: "Minio",
+    obj: str,
+    start: int,
+    length: int,
+    part_path: Path,
+    on_chunk: Callable[[int, bytes], None] | None = None,
+) -> None:
+    """Download a byte range of an object into the (preallocated) file.
+
+    The callback (if any) receives the position and content of every chunk, after
+    it has been written to the file.
+    """
+    response = client.get_object(BUCKET, obj, offset=start, length=length)
+    try:
+        with open(part_path, "r+b") as writer:
+            writer.seek(start)
+            for chunk in response.stream(1024**2):
+                position = writer.tell()
+                writer.write(chunk)
+                if on_chunk is not None:
+                    writer.flush()  # Visible to the hashing of later chunks
+                    on_chunk(position, chunk)
+            if writer.tell() != start + length:
+                raise requests.RequestException(
+                    f"Incomplete part received for '{obj}' at offset {start}"
+                )
+    finally:
+        response.close()
+        response.release_conn()
+
+
+def _download_ranged(
+    client: "Minio",
+    obj: str,
+    etag: str | None,
+    size: int,
+    part_path: Path,
+    part_size: int,
+    max_workers: int,
+) -> str:
+    """Download an object in concurrent ranged parts, hashing while downloading."""
+    file = Path(obj).name
+    # Sort out the partial download (if any)
+    sidecar_path = part_path.with_name(f"{part_path.name}.json")
+    state = {"etag": etag, "size": size, "part_size": part_size}
+    done: set[int] = set()
+    if sidecar_path.is_file() and part_path.is_file():
+        with open(sidecar_path, "r") as reader:
+            sidecar = json.load(reader)
+        if all(sidecar.get(key) == value for key, value in state.items()):
+            done = set(sidecar["done"])
+    if len(done) == 0:
+        # Preallocate the file
+        with open(part_path, "wb") as writer:
+            writer.truncate(size)
+
+    nparts = math.ceil(size / part_size)
+    todo = [idx for idx in range(nparts) if idx not in done]
+    if len(done) != 0:
+        logger.info(f"Resuming the download of {file}, {len(todo)} part(s) left")
+    else:
+        logger.info(f"Downloading {file}..")
+
+    lock = threading.Lock()
+    hash_lock = threading.Lock()
+    hasher = getattr(hashlib, HASH_ALGORITM)()
+    hashed = [0]  # Number of bytes that have been hashed
+    # Number of bytes written per part, the resumed parts are complete
+    written = [
+        min(part_size, size - idx * part_size) if idx in done else 0
+        for idx in range(nparts)
+    ]
+
+    def _catch_up() -> None:
+        # Read back what was written out of order, now contiguous with the hashed
+        # bytes. Unbuffered, as the bytes beyond it may not be written yet
+        with open(part_path, "rb", buffering=0) as reader:
+            while hashed[0] < size:
+                idx = hashed[0] // part_size
+                end = idx * part_size + written[idx]
+                if end <= hashed[0]:
+                    break
+                reader.seek(hashed[0])
+                hasher.update(reader.read(end - hashed[0]))
+                hashed[0] = end
+
+    def _on_chunk(position: int, chunk: bytes) -> None:
+        with hash_lock:
+            written[position // part_size] += len(chunk)
+            if position != hashed[0]:
+                return  # Out of order, read back later
+            # Straight from the response
+            hasher.update(chunk)
+            hashed[0] += len(chunk)
+            _catch_up()
+
+    def _part(idx: int) -> None:
+        start = idx * part_size
+        _download_part(
+            client,
+            obj,
+            start,
+            min(part_size, size - start),
+            part_path,
+            on_chunk=_on_chunk,
+        )
+        # Keep track of the finished parts
+        with lock:
+            done.add(idx)
+            with open(sidecar_path, "w") as writer:
+                json.dump({**state, "done": sorted(done)}, writer)
+
+    with hash_lock:
+        _catch_up()  # Resumed parts
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consume the results to raise errors of the workers
+        list(pool.map(_part, todo))
+    sidecar_path.unlink(missing_ok=True)
+    return hasher.hexdigest()
+
+
+def _download_single(
+    client: "Minio",
+    obj: str,
+    part_path: Path,
+) -> str:
+    """Download an object in a single request, hashing while downloading."""
+    hasher = getattr(hashlib, HASH_ALGORITM)()
+    response = client.get_object(BUCKET, obj)
+    try:
+        with open(part_path, "wb") as writer:
+            for chunk in response.stream(1024**2):
+                writer.write(chunk)
+                hasher.update(chunk)
+    finally:
+        response.close()
+        response.release_conn()
+    return hasher.hexdigest()
+
+
 def download(
     file: str,
     entry: dict[str, str],
     write_path: Path,
-):
+    part_size: int = PART_SIZE,
+    max_workers: int = MAX_WORKERS,
+    client: "Minio | None" = None,
+) -> str:
     """Download data from the minio bucket.
 
+    The file is downloaded in parts with concurrent ranged requests, which are
+    written into a preallocated '.part' file. The finished parts are tracked in a
+    sidecar file, so that an interrupted download resumes where it stopped.
+    The hash is computed during the download, directly from the received chunks
+    when they are in order. Bytes received out of order (i.e. ahead of the ones
+    hashed) are read back from the file once the preceding bytes are in. If the
+    server does not report the size of the file, it is downloaded in a single
+    request instead. The hash is verified afterwards, after which a stamp is
+    written.
+
     Parameters
     ----------
     file : str
@@ -137,31 +514,143 @@ def download(
         The entry from the registry corresponding to the file.
     write_path : Path
         The path to which to write the file.
+    part_size : int, optional
+        The size of the parts in bytes, by default 50 MB.
+    max_workers : int, optional
+        The maximum number of concurrent requests, by default 4.
+    client : Minio, optional
+        The client of the (mirror) bucket. If None, the default bucket is used.
+        By default None.
+
+    Returns
+    -------
+    str
+        The hash of the downloaded file.
     """
+    obj = Path(entry[PATH], entry[VERSION], file).as_posix()
+    client = client or get_client()
     # Checking for the remote hash match
-    assert_remote_hash(
-        CLIENT.stat_object(
-            BUCKET,
-            Path(entry[PATH], entry[VERSION], file).as_posix(),
-        ),
-        known_hash=entry[HASHKEY],
-    )
+    stat = client.stat_object(BUCKET, obj)
+    assert_remote_hash(stat, known_hash=entry[HASHKEY])
 
-    logger.info(f"Downloading {file}..")
-    # Get and write the as a stream from the bucket
-    respone = CLIENT.get_object(
-        BUCKET,
-        Path(entry[PATH], entry[VERSION], file).as_posix(),
-    )
-    logger.info(f"Writing file to '{write_path.as_posix()}'")
-    # Read chunks of the data and write those chunks
-    with open(write_path, "wb") as writer:
-        for chunk in respone.stream(50 * 1024**2):
+    part_path = write_path.with_name(f"{write_path.name}.part")
+    if stat.size is None:
+        # Without the size there are no ranges to request
+        logger.warning(f"Unknown size of '{obj}', downloading it in a single part")
+        digest = _download_single(client, obj, part_path)
+    else:
+        digest = _download_ranged(
+            client,
+            obj,
+            stat.etag,
+            stat.size,
+            part_path,
+            part_size=part_size,
+            max_workers=max_workers,
+        )
+
+    # Verify the download
+    part_path.replace(write_path)
+    if digest != entry[HASHKEY]:
+        os.unlink(write_path)
+        raise requests.RequestException(
+            "Downloaded file does not match the hash from the registry",
+        )
+    logger.info(f"Written file to '{write_path.as_posix()}'")
+    write_stamp(write_path, digest)
+    return digest
+
+
+def copy_local(
+    source: Path,
+    entry: dict[str, str],
+    write_path: Path,
+) -> str:
+    """Copy data from a local mirror.
+
+    The hash is computed while copying and verified afterwards, after which a
+    stamp is written.
+
+    Parameters
+    ----------
+    source : Path
+        The path of the file in the mirror.
+    entry : dict[str, str]
+        The entry from the registry corresponding to the file.
+    write_path : Path
+        The path to which to write the file.
+
+    Returns
+    -------
+    str
+        The hash of the copied file.
+    """
+    part_path = write_path.with_name(f"{write_path.name}.part")
+    hasher = getattr(hashlib, HASH_ALGORITM)()
+    with open(source, "rb") as reader, open(part_path, "wb") as writer:
+        for chunk in iter(lambda: reader.read(1024**2), b""):
+            hasher.update(chunk)
             writer.write(chunk)
+    digest = hasher.hexdigest()
+    if digest != entry[HASHKEY]:
+        os.unlink(part_path)
+        raise requests.RequestException(
+            "Mirrored file does not match the hash from the registry",
+        )
+    part_path.replace(write_path)
+    logger.info(f"Written file to '{write_path.as_posix()}'")
+    write_stamp(write_path, digest)
+    return digest
+
+
+def fetch_file(
+    file: str,
+    entry: dict[str, str],
+    write_path: Path,
+    mirrors: list[str] | str | None = None,
+) -> str:
+    """Fetch a file from the mirrors, with the default bucket as fallback.
+
+    Parameters
+    ----------
+    file : str
+        The file to fetch.
+    entry : dict[str, str]
+        The entry from the registry corresponding to the file.
+    write_path : Path
+        The path to which to write the file.
+    mirrors : list[str] | str, optional
+        The mirrors, see :py:func:`get_mirrors`. By default None.
 
-    # Close off
-    respone.close()
-    respone.release_conn()
+    Returns
+    -------
+    str
+        The hash of the fetched file.
+    """
+    from minio.error import MinioException
+    from urllib3.exceptions import HTTPError
+
+    obj = Path(entry[PATH], entry[VERSION], file).as_posix()
+
+    def _fetch(mirror: str) -> str:
+        path = _local_path(mirror)
+        if path is not None:
+            logger.info(f"Copying {file} from the mirror at {path.as_posix()}")
+            return copy_local(Path(path, obj), entry, write_path)
+        return download(
+            file=file,
+            entry=entry,
+            write_path=write_path,
+            client=_s3_client(mirror),
+        )
+
+    *candidates, default = select_mirrors(obj, get_mirrors(mirrors))
+    for mirror in candidates:
+        try:
+            return _fetch(mirror)
+        except (HTTPError, MinioException, OSError) as err:
+            logger.warning(f"Fetching {file} from {_display(mirror)} failed: {err}")
+    return _fetch(default)
 
 
 def fetch_data(
@@ -170,9 +659,14 @@ def fetch_data(
     sub_dir: bool = True,
     cache_dir: Path | str | None = None,
     output_dir: Path | str | None = None,
+    members: list[str] | str | None = None,
+    mirrors: list[str] | str | None = None,
 ) -> Path:
     """Fetch data by simply calling this function.
 
+    Unpacking is skipped if the contents are already present in the output
+    directory (according to the unpack manifest).
+
     Parameters
     ----------
     name : str
@@ -193,6 +687,15 @@ def fetch_data(
         The output directory to store the unpacked data.
         If None, the data will be stored in ~/.cache/hydromt_fiat/<data>.
         By default None.
+    members : list[str] | str, optional
+        Glob pattern(s) of the members of the archive to unpack, e.g. 'exposure/*'.
+        If None, all members are unpacked. By default None.
+    mirrors : list[str] | str, optional
+        Mirrors (local directories, a registry file or S3 compatible endpoints) to
+        fetch the data and registry from, preceding the ones set in the
+        'HYDROMT_FIAT_MIRRORS' environment variable. The fastest reachable mirror
+        is used, the default bucket is the fallback. See :py:func:`get_mirrors`.
+        By default None.
 
     Returns
     -------
@@ -201,7 +704,7 @@ def fetch_data(
     """
     logger.info(f"Requesting the '{name}' file from the {BUCKET} s3 bucket")
     # Get the registy
-    registry = get_registry(local=local_registry)
+    registry = get_registry(local=local_registry, mirrors=mirrors)
     # Get the data entry from the registry
     file, entry = get_entry(name=name, registry=registry)
     # Use common cache directory or a user provided one
@@ -220,11 +723,12 @@ def fetch_data(
         hash=entry[HASHKEY],
     ):
         logger.info("File not locally cached, trying to download")
-        # If not, download
-        download(
+        # If not, download (or copy from a mirror)
+        fetch_file(
             file=file,
             entry=entry,
             write_path=write_path,
+            mirrors=mirrors,
         )
 
     # Unpack the data
@@ -234,6 +738,7 @@ def fetch_data(
         UNPACK[archive_flag.index(True)](  # type: ignore
             file=write_path,
             output_dir=output_dir,
+            members=members,
         )
     # Return the output directory
     return output_dir
@@ -1,13 +1,21 @@
 """Small module for unpacking archives."""
 
+import json
+import shutil
 import tarfile
 import zipfile
-from pathlib import Path
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path, PurePosixPath
 from tarfile import TarInfo
-from typing import Callable
+from typing import Any, Callable
 
 __all__ = ["untar", "unzip"]
 
+MANIFEST = ".{name}.manifest.json"
+CHUNK_SIZE = 1024 * 1024
+
 
 def _is_archive(
     file: Path,
@@ -21,13 +29,112 @@ def _dummy_filter(tarinfo, path=None):
     return tarinfo
 
 
+def _selected(name: str, members: list[str] | str | None) -> bool:
+    """Check whether a member matches (one of) the glob pattern(s)."""
+    if members is None:
+        return True
+    if isinstance(members, str):
+        members = [members]
+    return any(fnmatch(name, item) for item in members)
+
+
+def _crc32(path: Path) -> int:
+    """Get the CRC-32 checksum of a file, like the one stored in zip archives."""
+    crc = 0
+    with open(path, "rb") as reader:
+        while chunk := reader.read(CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _member_path(output_dir: Path, name: str) -> Path:
+    """Get the path of an archive member, without leaving the output directory."""
+    parts = PurePosixPath(name.replace("\\", "/")).parts
+    return Path(output_dir, *[item for item in parts if item not in ("/", "..")])
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Get the modification time of a file, if present."""
+    return path.stat().st_mtime_ns if path.is_file() else None
+
+
+def _read_manifest(file: Path, output_dir: Path) -> dict[str, dict[str, Any]]:
+    """Read the unpack manifest, only if it belongs to the same archive."""
+    manifest_path = Path(output_dir, MANIFEST.format(name=file.name))
+    if not manifest_path.is_file():
+        return {}
+    with open(manifest_path, "r") as reader:
+        manifest = json.load(reader)
+    stat = file.stat()
+    if manifest.get("size") != stat.st_size or manifest.get("mtime_ns") != (
+        stat.st_mtime_ns
+    ):
+        return {}
+    return manifest["members"]
+
+
+def _is_unpacked(
+    output_dir: Path,
+    manifest: dict[str, dict[str, Any]],
+    members: list[str] | str | None,
+) -> bool:
+    """Check whether the (selected) files are present according to the manifest.
+
+    The checksum of a file is only computed when its modification time differs
+    from the one in the manifest.
+    """
+    if len(manifest) == 0:
+        return False
+    for name, entry in manifest.items():
+        if not _selected(name, members):
+            continue
+        path = _member_path(output_dir, name)
+        if not path.is_file():
+            return False
+        stat = path.stat()
+        if stat.st_size != entry.get("size"):
+            return False
+        if entry.get("mtime_ns") == stat.st_mtime_ns:
+            continue
+        if entry.get("crc") is None or _crc32(path) != entry["crc"]:
+            return False
+    return True
+
+
+def _write_manifest(
+    file: Path,
+    output_dir: Path,
+    manifest: dict[str, dict[str, Any]],
+) -> None:
+    """Write the unpack manifest, with the size, checksum and time of all files."""
+    stat = file.stat()
+    with open(Path(output_dir, MANIFEST.format(name=file.name)), "w") as writer:
+        json.dump(
+            {
+                "archive": file.name,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "members": manifest,
+            },
+            writer,
+        )
+
+
 def untar(
     file: Path,
     filter: Callable[[TarInfo, str], TarInfo | None] | None = None,
     output_dir: Path | None = None,
+    members: list[str] | str | None = None,
 ) -> Path:
     """Unpack a tar archive.
 
+    A manifest of the files in the archive, with their sizes, checksums and
+    modification times, is written to the output directory. If all (selected) files
+    are already present and match the manifest, nothing is extracted and the
+    archive is not even read. Files are only checksummed again when their
+    modification time has changed.
+    With a custom filter, the archive is always extracted.
+
     Parameters
     ----------
     file : Path
@@ -39,6 +146,9 @@ def untar(
         The output directory in which to extract the contents. If not provided,
         the contents are extracted in the same directory as the archive.
         By default None.
+    members : list[str] | str, optional
+        Glob pattern(s) of the members to extract, e.g. 'exposure/*'. If None, all
+        members are extracted. By default None.
 
     Returns
     -------
@@ -51,18 +161,49 @@ def untar(
     # Ensure the output directory
     output_dir = output_dir or file.parent
     output_dir.mkdir(parents=True, exist_ok=True)
+    # Listing a (compressed) tar archive means reading it, so check the manifest
+    manifest = _read_manifest(file, output_dir)
+    if filter is None and _is_unpacked(output_dir, manifest, members):
+        return output_dir
     # Untar it
     with tarfile.open(file) as archive:
-        archive.extractall(path=output_dir, filter=(filter or _dummy_filter))
+        infos = archive.getmembers()
+        archive.extractall(
+            path=output_dir,
+            members=[item for item in infos if _selected(item.name, members)],
+            filter=(filter or _dummy_filter),
+        )
+    # Checksum the extracted files, keep the known entries of the others
+    entries = {}
+    for item in infos:
+        if not item.isfile():
+            continue
+        path = _member_path(output_dir, item.name)
+        entry = manifest.get(item.name, {})
+        crc, mtime_ns = entry.get("crc"), entry.get("mtime_ns")
+        if _selected(item.name, members):
+            crc, mtime_ns = None, None
+            if path.is_file() and path.stat().st_size == item.size:
+                crc, mtime_ns = _crc32(path), _mtime_ns(path)
+        entries[item.name] = {"size": item.size, "crc": crc, "mtime_ns": mtime_ns}
+    _write_manifest(file, output_dir, entries)
     return output_dir
 
 
 def unzip(
     file: Path,
     output_dir: Path | None = None,
+    members: list[str] | str | None = None,
+    max_workers: int = 4,
 ) -> Path:
     """Unpack a zip archive.
 
+    The members are extracted concurrently. A manifest of the files in the archive,
+    with their sizes, checksums and modification times, is written to the output
+    directory. If all (selected) files are already present and match the manifest,
+    nothing is extracted. Files are only checksummed again when their modification
+    time has changed.
+
     Parameters
     ----------
     file : Path
@@ -71,6 +212,11 @@ def unzip(
         The output directory in which to extract the contents. If not provided,
         the contents are extracted in the same directory as the archive.
         By default None.
+    members : list[str] | str, optional
+        Glob pattern(s) of the members to extract, e.g. 'exposure/*'. If None, all
+        members are extracted. By default None.
+    max_workers : int, optional
+        The maximum number of threads extracting members, by default 4.
 
     Returns
     -------
@@ -83,7 +229,47 @@ def unzip(
     # Ensure the output directory
     output_dir = output_dir or file.parent
     output_dir.mkdir(parents=True, exist_ok=True)
-    # Untar it
+    manifest = _read_manifest(file, output_dir)
+    if _is_unpacked(output_dir, manifest, members):
+        return output_dir
     with zipfile.ZipFile(file, mode="r") as archive:
-        archive.extractall(path=output_dir)
+        files = [item for item in archive.infolist() if not item.is_dir()]
+    infos = [item for item in files if _selected(item.filename, members)]
+
+    # Create the directories up front, the threads only write the files
+    for item in infos:
+        _member_path(output_dir, item.filename).parent.mkdir(
+            parents=True, exist_ok=True
+        )
+
+    def _extract(group: list[zipfile.ZipInfo]) -> None:
+        # Every thread its own file handle
+        with zipfile.ZipFile(file, mode="r") as archive:
+            for item in group:
+                with (
+                    archive.open(item) as reader,
+                    open(_member_path(output_dir, item.filename), "wb") as writer,
+                ):
+                    shutil.copyfileobj(reader, writer, CHUNK_SIZE)
+
+    # Unzip it, the largest members spread over the threads
+    infos = sorted(infos, key=lambda item: item.file_size, reverse=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(
+            pool.map(_extract, [infos[idx::max_workers] for idx in range(max_workers)])
+        )
+    # The checksums are known, keep the times of the files not extracted
+    extracted = {item.filename for item in infos}
+    entries = {}
+    for item in files:
+        entry = manifest.get(item.filename, {})
+        mtime_ns = entry.get("mtime_ns") if entry.get("crc") == item.CRC else None
+        if item.filename in extracted:
+            mtime_ns = _mtime_ns(_member_path(output_dir, item.filename))
+        entries[item.filename] = {
+            "size": item.file_size,
+            "crc": item.CRC,
+            "mtime_ns": mtime_ns,
+        }
+    _write_manifest(file, output_dir, entries)
     return output_dir
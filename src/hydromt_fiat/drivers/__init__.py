@@ -1,7 +1,8 @@
 """Custom HydroMT drivers."""
 
 from .osm_driver import OSMDriver
+from .osm_extract_driver import OSMExtractDriver
 
-__all__ = ["OSMDriver"]
+__all__ = ["OSMDriver", "OSMExtractDriver"]
 
-__hydromt_eps__ = ["OSMDriver"]
+__hydromt_eps__ = ["OSMDriver", "OSMExtractDriver"]
@@ -1,36 +1,237 @@
 """Driver to read OSM data with the OSMnx API."""
 
+import hashlib
+import json
 import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any, ClassVar, Set
 
 import geopandas as gpd
-import osmnx as ox
+import numpy as np
+import pandas as pd
+import shapely
 from hydromt.data_catalog.drivers import GeoDataFrameDriver
 from hydromt.typing import StrPath
-from osmnx._errors import InsufficientResponseError
 from pyproj.crs import CRS
-from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry import MultiPolygon, Polygon, box
 
 from hydromt_fiat.data import CACHE_DIR
 
 __all__ = ["OSMDriver", "osm_request"]
 
 OSM_CACHE_DIR = Path(CACHE_DIR, "osmnx")
-OSM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-ox.settings.cache_folder = OSM_CACHE_DIR
+OSM_RESULT_CACHE_DIR = Path(CACHE_DIR, "osm_results")
+OSM_TILE_CACHE_DIR = Path(CACHE_DIR, "osm_tiles")
+# Maximum age of cached results in seconds (one week)
+OSM_CACHE_MAX_AGE = 7 * 24 * 3600
+# Shapely type ids of the single part geometries per geometry type
+OSM_PART_TYPES = {
+    "Point": 0,
+    "MultiPoint": 0,
+    "LineString": 1,
+    "MultiLineString": 1,
+    "Polygon": 3,
+    "MultiPolygon": 3,
+}
 
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+@cache
+def _osmnx() -> ModuleType:
+    """Import OSMnx on first use (it is slow) and set its cache directory."""
+    import osmnx
+
+    OSM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    osmnx.settings.cache_folder = OSM_CACHE_DIR
+    return osmnx
+
+
+def _cache_path(directory: Path, **key) -> Path:
+    """Get the path of a cached (GeoParquet) file based on a hash of the key."""
+    text = json.dumps(key, sort_keys=True, default=str)
+    return Path(directory, f"{hashlib.sha256(text.encode()).hexdigest()}.parquet")
+
+
+def _cache_valid(path: Path, max_age: float | None) -> bool:
+    """Check whether a cached file exists and has not expired."""
+    if not path.is_file():
+        return False
+    return max_age is None or time.time() - path.stat().st_mtime <= max_age
+
+
+def _cache_dirs(cache_dir: Path | str | None) -> tuple[Path, Path]:
+    """Get the directories of the cached final results and tiles."""
+    if cache_dir is None:
+        return OSM_RESULT_CACHE_DIR, OSM_TILE_CACHE_DIR
+    return Path(cache_dir, "osm_results"), Path(cache_dir, "osm_tiles")
+
+
+def _cache_write(path: Path, items: gpd.GeoDataFrame) -> None:
+    """Write data to the cache, which is skipped if not supported by GeoParquet."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        items.to_parquet(path)
+    except (TypeError, ValueError) as err:
+        logger.warning(f"Could not cache OSM data at {path.as_posix()}: {err}")
+
+
+def _geometry_parts(
+    geometry: np.ndarray,
+    geom_type: list[str],
+) -> np.ndarray:
+    """Keep only the parts of the wanted type of geometry collections."""
+    out = geometry.copy()
+    wanted = [OSM_PART_TYPES[item] for item in geom_type if item in OSM_PART_TYPES]
+    for idx in np.flatnonzero(shapely.get_type_id(geometry) == 7):
+        # Twice to also split the multi part geometries within the collection
+        parts = shapely.get_parts(shapely.get_parts(geometry[idx]))
+        parts = parts[np.isin(shapely.get_type_id(parts), wanted)]
+        if len(parts) == 0:
+            continue
+        family = np.unique(shapely.get_type_id(parts))
+        if len(parts) == 1:
+            out[idx] = parts[0]
+        elif len(family) > 1:
+            out[idx] = shapely.geometrycollections(parts)
+        else:
+            multi = {0: shapely.multipoints, 1: shapely.multilinestrings}
+            out[idx] = multi.get(family[0], shapely.multipolygons)(parts)
+    return out
+
+
+def _slim(
+    items: gpd.GeoDataFrame,
+    tag_keys: list[str],
+    geom_type: list[str] | None,
+    reduce: bool,
+    precision: float | None,
+) -> gpd.GeoDataFrame:
+    """Reduce the columns and the geometries as early as possible."""
+    if reduce:
+        items = items[[item for item in tag_keys if item in items] + ["geometry"]]
+    geometry = items.geometry.values
+    if geom_type is not None:
+        geometry = _geometry_parts(geometry, geom_type)
+    if precision is not None:
+        geometry = shapely.set_precision(geometry, precision)
+    items = items.set_geometry(geometry)
+    # Snapping could have collapsed some
+    return items.loc[~shapely.is_empty(geometry)]
+
+
+def _osm_features(
+    polygon: MultiPolygon | Polygon,
+    tags: dict[str, Any],
+) -> gpd.GeoDataFrame:
+    """Get the OSM features within a polygon (indexed by element and id)."""
+    ox = _osmnx()
+    from osmnx._errors import InsufficientResponseError
+
+    try:
+        items = ox.features.features_from_polygon(polygon, tags)
+    except InsufficientResponseError as err:
+        logger.error(f"No OSM data retrieved with the following tags: {tags}")
+        raise err
+    return items
+
+
+def _osm_tile(
+    tile: tuple[int, int],
+    tile_size: float,
+    tags: dict[str, Any],
+    geom_type: list[str] | None,
+    reduce: bool,
+    precision: float | None,
+    cache: bool,
+    cache_dir: Path,
+    max_age: float | None,
+) -> gpd.GeoDataFrame:
+    """Get the OSM features of a single tile, either from the cache or the API."""
+    path = _cache_path(
+        cache_dir,
+        tile=[*tile, tile_size],
+        tags=tags,
+        geom_type=geom_type,
+        reduce=reduce,
+        precision=precision,
+    )
+    if cache and _cache_valid(path, max_age):
+        return gpd.read_parquet(path)
+
+    ix, iy = tile
+    bbox = box(
+        ix * tile_size,
+        iy * tile_size,
+        (ix + 1) * tile_size,
+        (iy + 1) * tile_size,
+    )
+    ox = _osmnx()
+    from osmnx._errors import InsufficientResponseError
+
+    try:
+        items = ox.features.features_from_polygon(bbox, tags)
+        items = _slim(items, list(tags), geom_type, reduce, precision)
+        if geom_type is not None:
+            items = items.loc[items.geometry.type.isin(geom_type)]
+        # Keep the osm element and id as columns for the deduplication
+        items = items.reset_index()
+    except InsufficientResponseError:
+        # Tiles without any features are perfectly normal
+        items = gpd.GeoDataFrame(
+            columns=["element", "id", "geometry"],
+            geometry="geometry",
+            crs=CRS.from_epsg(4326),
+        )
+
+    if cache:
+        _cache_write(path, items)
+    return items
+
+
+def _osm_tiles(
+    polygon: MultiPolygon | Polygon,
+    tile_size: float,
+) -> list[tuple[int, int]]:
+    """Get the tiles of a fixed grid (anchored at the origin) hit by a polygon."""
+    xmin, ymin, xmax, ymax = polygon.bounds
+    grid_x, grid_y = np.meshgrid(
+        np.arange(math.floor(xmin / tile_size), math.ceil(xmax / tile_size)),
+        np.arange(math.floor(ymin / tile_size), math.ceil(ymax / tile_size)),
+    )
+    ix, iy = grid_x.ravel(), grid_y.ravel()
+    boxes = shapely.box(
+        ix * tile_size,
+        iy * tile_size,
+        (ix + 1) * tile_size,
+        (iy + 1) * tile_size,
+    )
+    hit = shapely.intersects(boxes, polygon)
+    return [(int(x), int(y)) for x, y in zip(ix[hit], iy[hit])]
+
+
 def osm_request(
     polygon: MultiPolygon | Polygon,
     tags: dict[str, Any],
     geom_type: list[str] | None = None,
     reduce: bool = True,
+    tile_size: float | None = None,
+    max_workers: int = 2,
+    cache: bool = True,
+    precision: float | None = None,
+    cache_dir: Path | str | None = None,
+    max_age: float | None = OSM_CACHE_MAX_AGE,
 ) -> gpd.GeoDataFrame:
     """Retrieve OSM data with the OSMnx api.
 
+    The retrieved features are reduced right away (unneeded tag columns, parts of
+    geometry collections of other types than `geom_type`) to limit the memory usage.
+
     Parameters
     ----------
     polygon : MultiPolygon | Polygon
@@ -43,6 +244,26 @@ def osm_request(
     reduce : bool, optional
         Whether or not to reduce the output geodataframe to the columns corresponding
         to the tags and (of course) the geometry column. By default True.
+    tile_size : float, optional
+        If provided, the polygon is split into tiles of this size (in degrees) on a
+        fixed grid, which are requested concurrently and merged afterwards. By
+        default None, i.e. a single request.
+    max_workers : int, optional
+        The maximum number of concurrent tile requests, by default 2.
+    cache : bool, optional
+        Whether to cache the final result and (if tiled) the results per tile, so
+        that they can be reused for other (overlapping) regions. The final result
+        is keyed by the polygon, tags, geometry types and `reduce`. Cached files
+        older than `max_age` are requested again. By default True.
+    precision : float, optional
+        If provided, the coordinates are snapped to a grid of this size (in
+        degrees), e.g. 1e-7. By default None.
+    cache_dir : Path | str, optional
+        The directory of the cached results, by default None, i.e. the cache
+        directory of HydroMT-FIAT.
+    max_age : float, optional
+        The maximum age of the cached results in seconds. If None, they never
+        expire. By default one week.
 
     Returns
     -------
@@ -53,13 +274,60 @@ def osm_request(
     if not isinstance(polygon, (Polygon, MultiPolygon)):
         raise TypeError("Given geometry is not a (multi)polygon")
 
-    try:
-        items = ox.features.features_from_polygon(polygon, tags)
-    except InsufficientResponseError as err:
-        logger.error(f"No OSM data retrieved with the following tags: {tags}")
-        raise err
+    # Look for the final result in the cache, using a canonical form of the polygon
+    result_dir, tile_dir = _cache_dirs(cache_dir)
+    path = _cache_path(
+        result_dir,
+        polygon=shapely.normalize(shapely.set_precision(polygon, 1e-9)).wkb_hex,
+        tags=tags,
+        geom_type=geom_type,
+        reduce=reduce,
+        precision=precision,
+    )
+    if cache and _cache_valid(path, max_age):
+        logger.info(f"Reading cached OSM data from {path.as_posix()}")
+        return gpd.read_parquet(path)
 
     tag_keys = list(tags.keys())
+    if tile_size is None:
+        items = _osm_features(polygon, tags)
+        items = _slim(items, tag_keys, geom_type, reduce, precision)
+    else:
+        tiles = _osm_tiles(polygon, tile_size)
+        logger.info(f"Retrieving OSM data in {len(tiles)} tile(s)")
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(
+                pool.map(
+                    lambda tile: _osm_tile(
+                        tile,
+                        tile_size,
+                        tags,
+                        geom_type,
+                        reduce,
+                        precision,
+                        cache,
+                        tile_dir,
+                        max_age,
+                    ),
+                    tiles,
+                )
+            )
+        items = gpd.GeoDataFrame(
+            pd.concat(parts, ignore_index=True),
+            geometry="geometry",
+            crs=CRS.from_epsg(4326),
+        )
+        # Features crossing tiles are found multiple times
+        items = items.drop_duplicates(subset=["element", "id"])
+        items = items.loc[items.intersects(polygon)].set_index(["element", "id"])
+        if items.empty:
+            # Same as a single request without any features
+            from osmnx._errors import InsufficientResponseError
+
+            logger.error(f"No OSM data retrieved with the following tags: {tags}")
+            raise InsufficientResponseError(
+                "No matching features. Check query location, tags, and log."
+            )
 
     if items.empty:
         logger.warning(f"No {tag_keys} features found for polygon")
@@ -73,17 +341,55 @@ def osm_request(
     # Remove multi index
     items = items.reset_index(drop=True)
     if reduce:
-        return items[[*tag_keys, "geometry"]]
+        items = items[[*tag_keys, "geometry"]]
+    if cache:
+        _cache_write(path, items)
     return items
 
 
 class OSMDriver(GeoDataFrameDriver):
-    """Driver to read OSM data with the OSMnx API."""
+    """Driver to read OSM data with the OSMnx API.
+
+    The retrieved data is cached as GeoParquet. The cache is controlled with the
+    'cache' (whether to use it, by default True), 'cache_dir' (its directory) and
+    'max_age' (the maximum age of cached results in seconds, by default one week,
+    None for no expiry) driver options.
+    """
 
     name = "osm"
     supports_writing = True
     _supported_extensions: ClassVar[Set[str]] = {".gpkg", ".shp", ".geojson", ".fgb"}
 
+    def _mask_polygon(
+        self,
+        uris: list[str],
+        mask: gpd.GeoDataFrame | gpd.GeoSeries,
+    ) -> tuple[str, MultiPolygon | Polygon]:
+        """Check the uri and the mask, returning the mask as one polygon in WGS84."""
+        if len(uris) > 1:
+            raise ValueError("Cannot use multiple uris for reading OSM data.")
+
+        if mask is None:
+            raise ValueError("Mask is required to retrieve OSM data")
+
+        if not isinstance(mask, (gpd.GeoDataFrame, gpd.GeoSeries)):
+            raise TypeError(
+                f"Wrong type: {type(mask)} -> should be GeoDataFrame or GeoSeries"
+            )
+        uri = uris[0]
+        if len(mask) > 1:
+            logger.warning(
+                "Received multiple geometries for mask, geometries will "
+                "be dissolved into single geometry."
+            )
+            mask = mask.dissolve()
+
+        # Quick check on the crs. If not in WGS84, reproject
+        crs = CRS.from_epsg(4326)
+        if not mask.crs.equals(crs):
+            mask = mask.to_crs(crs)  # WGS84
+        return uri, mask.geometry.iloc[0]
+
     def read(
         self,
         uris: list[str],
@@ -91,10 +397,18 @@ class OSMDriver(GeoDataFrameDriver):
         *,
         tags: dict[str, Any] | None = None,
         geom_type: list[str] | None = None,
+        tile_size: float | None = None,
+        max_workers: int | None = None,
+        precision: float | None = None,
         **kwargs,
     ) -> gpd.GeoDataFrame:
         """Read OSM data with the OSMnx api.
 
+        By default the data is retrieved in a single request. If `tile_size` is
+        set, the mask is split into tiles on a fixed grid which are retrieved
+        concurrently and cached separately. This way the cache is reused when the
+        region changes.
+
         Parameters
         ----------
         uris : list[str]
@@ -106,40 +420,28 @@ class OSMDriver(GeoDataFrameDriver):
         geom_type : list[str], optional
             List of geometry types to filter data with,
             i.e. ['MultiPolygon', 'Polygon'], by default None.
+        tile_size : float, optional
+            The size of the tiles in degrees, e.g. 0.05. By default None, i.e. a
+            single request.
+        max_workers : int, optional
+            The maximum number of concurrent tile requests, by default 2.
+        precision : float, optional
+            The grid size (in degrees) to snap the coordinates to, by default None.
 
         Returns
         -------
         gpd.GeoDataFrame
             The resulting data.
         """
-        if len(uris) > 1:
-            raise ValueError("Cannot use multiple uris for reading OSM data.")
-
-        if mask is None:
-            raise ValueError("Mask is required to retrieve OSM data")
-
-        if not isinstance(mask, (gpd.GeoDataFrame, gpd.GeoSeries)):
-            raise TypeError(
-                f"Wrong type: {type(mask)} -> should be GeoDataFrame or GeoSeries"
-            )
-        uri = uris[0]
-        if len(mask) > 1:
-            logger.warning(
-                "Received multiple geometries for mask, geometries will "
-                "be dissolved into single geometry."
-            )
-            mask = mask.dissolve()
-
-        # Quick check on the crs. If not in WGS84, reproject
-        crs = CRS.from_epsg(4326)
-        if not mask.crs.equals(crs):
-            mask = mask.to_crs(crs)  # WGS84
-        polygon = mask.geometry[0]
+        uri, polygon = self._mask_polygon(uris, mask)
 
         # If tags and geom_types are none check if these are supplied as driver options
         options = self.options.to_dict()
         geom_type = geom_type or options.get("geom_type")
         tags = {uri: tags or options.get("tags") or True}
+        tile_size = tile_size or options.get("tile_size")
+        max_workers = max_workers or options.get("max_workers") or 2
+        precision = precision or options.get("precision")
 
         # Get and return the data
         logger.info("Retrieving %s data from OSM API", uri)
@@ -147,6 +449,12 @@ class OSMDriver(GeoDataFrameDriver):
             polygon=polygon,
             tags=tags,
             geom_type=geom_type,
+            tile_size=tile_size,
+            max_workers=max_workers,
+            cache=options.get("cache", True),
+            precision=precision,
+            cache_dir=options.get("cache_dir"),
+            max_age=options.get("max_age", OSM_CACHE_MAX_AGE),
         )
 
     def write(
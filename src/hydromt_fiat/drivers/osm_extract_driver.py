@@ -0,0 +1,290 @@
+"""Driver to read OSM data from local extracts."""
+
+import json
+import logging
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+import pandas as pd
+import pyogrio
+import shapely
+from pyproj import Transformer
+from pyproj.crs import CRS
+from shapely.geometry import MultiPolygon, Polygon
+
+from hydromt_fiat.drivers.osm_driver import OSMDriver
+
+__all__ = ["OSMExtractDriver", "osm_extract_read"]
+
+# The layers of the GDAL OSM driver per geometry type
+OSM_LAYERS = {
+    "Point": "points",
+    "MultiPoint": "points",
+    "LineString": "lines",
+    "MultiLineString": "multilinestrings",
+    "Polygon": "multipolygons",
+    "MultiPolygon": "multipolygons",
+}
+OSM_OTHER_TAGS = "other_tags"
+WGS84 = CRS.from_epsg(4326)
+
+logger = logging.getLogger(f"hydromt.{__name__}")
+
+
+def _other_tag(other_tags: pd.Series, key: str) -> pd.Series:
+    """Get the value of a tag from the 'other_tags' (hstore) column of GDAL."""
+    pattern = rf'"{re.escape(key)}"=>"((?:[^"\\]|\\.)*)"'
+    return other_tags.astype("string").str.extract(pattern, expand=False)
+
+
+def _select(
+    gdf: gpd.GeoDataFrame,
+    polygon: MultiPolygon | Polygon,
+    tags: dict[str, Any],
+    geom_type: list[str] | None,
+    predicate: str,
+) -> gpd.GeoDataFrame:
+    """Select the features matching any of the tags, the type and the mask."""
+    # Get the tags that are not a column of their own
+    for key in tags:
+        if key not in gdf and OSM_OTHER_TAGS in gdf:
+            gdf[key] = _other_tag(gdf[OSM_OTHER_TAGS], key)
+
+    # Like the Overpass query, features matching any of the tags
+    hit = pd.Series(False, index=gdf.index)
+    for key, value in tags.items():
+        if key not in gdf:
+            continue
+        if value is True:
+            hit |= gdf[key].notna()
+        elif isinstance(value, str):
+            hit |= gdf[key] == value
+        else:
+            hit |= gdf[key].isin(value)
+    gdf = gdf.loc[hit.values]
+
+    # Single part multipolygons (closed ways) are polygons according to OSMnx
+    geom = gdf.geometry.values
+    single = (shapely.get_type_id(geom) == 6) & (shapely.get_num_geometries(geom) == 1)
+    if single.any():
+        gdf.loc[single, gdf.geometry.name] = shapely.get_geometry(geom[single], 0)
+    if geom_type is not None:
+        gdf = gdf.loc[gdf.geometry.type.isin(geom_type)]
+    return gdf.loc[getattr(shapely, predicate)(gdf.geometry.values, polygon)]
+
+
+def _to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Reproject the features to WGS84, like the area of interest."""
+    if gdf.crs is None or gdf.crs.equals(WGS84):
+        return gdf
+    return gdf.to_crs(WGS84)
+
+
+def _bbox_in(
+    polygon: MultiPolygon | Polygon,
+    crs: CRS,
+) -> tuple[float, float, float, float]:
+    """Get the bounding box of the area of interest (WGS84) in the crs of a file."""
+    if crs.equals(WGS84):
+        return polygon.bounds
+    xmin, ymin, xmax, ymax = polygon.bounds
+    transformer = Transformer.from_crs(WGS84, crs, always_xy=True)
+    return transformer.transform_bounds(xmin, ymin, xmax, ymax, densify_pts=21)
+
+
+def _read_batches(
+    path: Path,
+    layers: list[str | None],
+    polygon: MultiPolygon | Polygon,
+    columns: list[str] | None,
+    batch_size: int,
+) -> Iterator[gpd.GeoDataFrame]:
+    """Read an extract in batches, GeoParquet directly and others through GDAL.
+
+    The features are filtered on the bounding box of the area of interest in the
+    crs of the file and returned in WGS84.
+    """
+    if path.suffix == ".parquet":
+        # Import pyarrow on first use, it is slow
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pf = pq.ParquetFile(path)
+        meta = json.loads(pf.schema_arrow.metadata[b"geo"])
+        name = meta["primary_column"]
+        # No crs in the metadata means OGC:CRS84 (i.e. WGS84)
+        crs = meta["columns"][name].get("crs")
+        crs = CRS.from_json_dict(crs) if crs else WGS84
+        bbox = shapely.box(*_bbox_in(polygon, crs))
+        if columns is not None:
+            columns = [item for item in pf.schema_arrow.names if item in columns]
+            columns.append(name)
+        for batch in pf.iter_batches(batch_size=batch_size, columns=columns):
+            geom = shapely.from_wkb(batch.column(name).to_numpy(zero_copy_only=False))
+            # Cheap bounding box filter before converting the attributes
+            keep = shapely.intersects(geom, bbox)
+            if not keep.any():
+                continue
+            data = batch.drop_columns([name]).filter(pa.array(keep)).to_pandas()
+            yield _to_wgs84(gpd.GeoDataFrame(data, geometry=geom[keep], crs=crs))
+        return
+
+    for layer in layers:
+        # Only read the wanted attributes
+        info = pyogrio.read_info(path, layer=layer)
+        fields = info["fields"]
+        if columns is not None:
+            fields = [item for item in fields if item in columns]
+        crs = CRS.from_user_input(info["crs"] or WGS84)
+        with pyogrio.open_arrow(
+            path,
+            layer=layer,
+            columns=list(fields),
+            bbox=_bbox_in(polygon, crs),
+            batch_size=batch_size,
+            use_pyarrow=True,
+        ) as (meta, reader):
+            name = meta["geometry_name"] or "wkb_geometry"
+            for batch in reader:
+                geom = shapely.from_wkb(
+                    batch.column(name).to_numpy(zero_copy_only=False)
+                )
+                data = batch.drop_columns([name]).to_pandas()
+                yield _to_wgs84(gpd.GeoDataFrame(data, geometry=geom, crs=crs))
+
+
+def osm_extract_read(
+    path: Path | str,
+    polygon: MultiPolygon | Polygon,
+    tags: dict[str, Any],
+    geom_type: list[str] | None = None,
+    predicate: str = "intersects",
+    reduce: bool = True,
+    batch_size: int = 65536,
+) -> gpd.GeoDataFrame:
+    """Retrieve OSM data from a local extract.
+
+    The extract is either an OSM (PBF) file read with the GDAL OSM driver or a
+    GeoParquet file, e.g. converted from such an extract. It is read in batches
+    which are filtered directly, so the extract is never loaded as a whole.
+
+    Parameters
+    ----------
+    path : Path | str
+        The path to the extract.
+    polygon : MultiPolygon | Polygon
+        Area of interest in WGS84.
+    tags : dict
+        OSM tag to filter data with, i.e. {'building': True}.
+    geom_type : list[str], optional
+        List of geometry types to filter data with,
+        i.e. ['MultiPolygon', 'Polygon'].
+    predicate : str, optional
+        The spatial predicate between the features and the area of interest,
+        by default 'intersects'.
+    reduce : bool, optional
+        Whether or not to reduce the output geodataframe to the columns corresponding
+        to the tags and (of course) the geometry column. By default True.
+    batch_size : int, optional
+        The number of features read at once, by default 65536.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        GeoDataFrame with OSM data.
+    """
+    if not isinstance(polygon, (Polygon, MultiPolygon)):
+        raise TypeError("Given geometry is not a (multi)polygon")
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(path.as_posix())
+
+    # Layers of the GDAL OSM driver for the wanted geometry types
+    layers: list[str | None] = [None]
+    if path.suffix == ".pbf" or path.name.endswith(".osm"):
+        layers = list(dict.fromkeys(OSM_LAYERS.values()))
+        if geom_type is not None:
+            layers = list(dict.fromkeys(OSM_LAYERS[item] for item in geom_type))
+    tag_keys = list(tags.keys())
+    columns = [*tag_keys, OSM_OTHER_TAGS] if reduce else None
+
+    logger.info(f"Reading {tag_keys} features from the OSM extract {path.as_posix()}")
+    parts = [
+        _select(gdf, polygon, tags, geom_type, predicate)
+        for gdf in _read_batches(path, layers, polygon, columns, batch_size)
+    ]
+    parts = [item for item in parts if len(item) != 0]
+
+    if len(parts) == 0:
+        logger.warning(f"No {tag_keys} features found for polygon")
+        return None
+    items = pd.concat(parts, ignore_index=True)
+    logger.info(f"Number of {tag_keys} items found in the OSM extract: {len(items)}")
+
+    if reduce:
+        return items[[*tag_keys, "geometry"]]
+    return items
+
+
+class OSMExtractDriver(OSMDriver):
+    """Driver to read OSM data from local (PBF or GeoParquet) extracts.
+
+    The path to the extract is set with the 'path' driver option. The uri
+    is the OSM asset type, like with the :py:class:`OSMDriver`, so the two are
+    interchangeable in a data catalog.
+    """
+
+    name = "osm_extract"
+
+    def read(
+        self,
+        uris: list[str],
+        mask: gpd.GeoDataFrame | gpd.GeoSeries,
+        *,
+        tags: dict[str, Any] | None = None,
+        geom_type: list[str] | None = None,
+        path: Path | str | None = None,
+        **kwargs,
+    ) -> gpd.GeoDataFrame:
+        """Read OSM data from a local extract.
+
+        Parameters
+        ----------
+        uris : list[str]
+            List containing single OSM asset type.
+        mask : gpd.GeoDataFrame | gpd.GeoSeries
+            GeoDataFrame containing the region of interest.
+        tags : dict[str, Any], optional
+            Additional tags to filter the OSM data by, by default None.
+        geom_type : list[str], optional
+            List of geometry types to filter data with,
+            i.e. ['MultiPolygon', 'Polygon'], by default None.
+        path : Path | str, optional
+            The path to the extract, if not set as driver option. By default None.
+
+        Returns
+        -------
+        gpd.GeoDataFrame
+            The resulting data.
+        """
+        uri, polygon = self._mask_polygon(uris, mask)
+
+        # If not supplied directly, check the driver options
+        options = self.options.to_dict()
+        geom_type = geom_type or options.get("geom_type")
+        tags = {uri: tags or options.get("tags") or True}
+        path = path or options.get("path")
+        if path is None:
+            raise ValueError("The path to the OSM extract is required ('path' option)")
+
+        # Get and return the data
+        return osm_extract_read(
+            path=path,
+            polygon=polygon,
+            tags=tags,
+            geom_type=geom_type,
+            predicate=options.get("predicate", "intersects"),
+        )
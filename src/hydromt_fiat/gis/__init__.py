@@ -1,9 +1,19 @@
 """GIS submodule."""
 
-from .raster import expand_raster_to_bounds
+from .raster import (
+    cell_index,
+    cell_window,
+    conservative_regrid,
+    coverage_fraction,
+    expand_raster_to_bounds,
+)
 from .vector import create_square_vector_grid
 
 __all__ = [
+    "cell_index",
+    "cell_window",
+    "conservative_regrid",
+    "coverage_fraction",
     "create_square_vector_grid",
     "expand_raster_to_bounds",
 ]
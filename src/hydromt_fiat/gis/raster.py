@@ -3,15 +3,358 @@
 import logging
 import math
 
+import geopandas as gpd
 import numpy as np
+import numpy.typing as npt
+import shapely
 import xarray as xr
 from affine import Affine
+from pyproj import Transformer
 
-__all__ = ["expand_raster_to_bounds"]
+__all__ = [
+    "cell_index",
+    "cell_window",
+    "conservative_regrid",
+    "coverage_fraction",
+    "expand_raster_to_bounds",
+]
 
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+def cell_index(
+    geometry: gpd.GeoSeries,
+    transform: Affine,
+    shape: tuple[int, int],
+) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+    """Get the raster cell index of geometries based on their centroid.
+
+    The index is computed in bulk from the transform of the raster, i.e. the raster
+    should not be rotated. Geometries outside of the raster get an index of -1.
+
+    Parameters
+    ----------
+    geometry : gpd.GeoSeries
+        The geometries, in the same crs as the raster.
+    transform : Affine
+        The transform of the raster.
+    shape : tuple[int, int]
+        The shape of the raster (rows, columns).
+
+    Returns
+    -------
+    tuple[npt.NDArray[np.int32], npt.NDArray[np.int32]]
+        The row and column indices.
+    """
+    # Get the centroids of the geometries
+    points = shapely.centroid(np.asarray(geometry.values))
+    x = shapely.get_x(points)
+    y = shapely.get_y(points)
+    # Convert to cell index directly from the transform
+    col = np.floor((x - transform.c) / transform.a)
+    row = np.floor((y - transform.f) / transform.e)
+    # Set everything outside of the raster to -1
+    outside = ~(
+        (col >= 0) & (col < shape[1]) & (row >= 0) & (row < shape[0])
+    )  # NaN's are outside as well
+    col[outside] = -1
+    row[outside] = -1
+    return row.astype(np.int32), col.astype(np.int32)
+
+
+def cell_window(
+    geometry: gpd.GeoSeries,
+    transform: Affine,
+    shape: tuple[int, int],
+) -> npt.NDArray[np.int64]:
+    """Get the raster cell window covering the bounding box of geometries.
+
+    Parameters
+    ----------
+    geometry : gpd.GeoSeries
+        The geometries, in the same crs as the raster.
+    transform : Affine
+        The transform of the raster.
+    shape : tuple[int, int]
+        The shape of the raster (rows, columns).
+
+    Returns
+    -------
+    npt.NDArray[np.int64]
+        The window per geometry as (row start, row stop, col start, col stop),
+        clipped to the raster. Geometries outside of the raster get an empty window.
+    """
+    bounds = shapely.bounds(np.asarray(geometry.values))
+    # Cell coordinates of the bounding box, sorted for any orientation
+    ra = (bounds[:, 1] - transform.f) / transform.e
+    rb = (bounds[:, 3] - transform.f) / transform.e
+    ca = (bounds[:, 0] - transform.c) / transform.a
+    cb = (bounds[:, 2] - transform.c) / transform.a
+    window = np.stack(
+        [
+            np.floor(np.fmin(ra, rb)),
+            np.ceil(np.fmax(ra, rb)),
+            np.floor(np.fmin(ca, cb)),
+            np.ceil(np.fmax(ca, cb)),
+        ],
+        axis=1,
+    )
+    window = np.nan_to_num(window, nan=0)  # Empty geometries
+    window[:, :2] = np.clip(window[:, :2], 0, shape[0])
+    window[:, 2:] = np.clip(window[:, 2:], 0, shape[1])
+    return window.astype(np.int64)
+
+
+def coverage_fraction(
+    geometry: gpd.GeoSeries,
+    transform: Affine,
+    shape: tuple[int, int],
+) -> tuple[
+    npt.NDArray[np.int64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.int64],
+    npt.NDArray[np.float64],
+]:
+    """Get the exact fraction of the raster cells covered by (polygon) geometries.
+
+    All cells within the bounding box of a geometry are intersected with that
+    geometry in one vectorized operation. Only the cells that are covered are
+    returned, as sparse (geometry, row, column, fraction) entries.
+
+    Parameters
+    ----------
+    geometry : gpd.GeoSeries
+        The geometries, in the same crs as the raster.
+    transform : Affine
+        The transform of the raster.
+    shape : tuple[int, int]
+        The shape of the raster (rows, columns).
+
+    Returns
+    -------
+    tuple[npt.NDArray[np.int64], ...]
+        The positional index of the geometry, the row index, the column index and
+        the fraction (0 - 1] of the cell that is covered by the geometry.
+    """
+    geoms = np.asarray(geometry.values)
+    window = cell_window(geometry, transform=transform, shape=shape)
+    nrows = window[:, 1] - window[:, 0]
+    ncols = window[:, 3] - window[:, 2]
+    counts = np.maximum(nrows, 0) * np.maximum(ncols, 0)
+
+    # All candidate cells per geometry
+    idx = np.repeat(np.arange(len(geoms)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    row = window[idx, 0] + local // ncols[idx]
+    col = window[idx, 2] + local % ncols[idx]
+
+    # Intersect the cells with the geometries
+    x0 = transform.c + col * transform.a
+    y0 = transform.f + row * transform.e
+    cells = shapely.box(
+        np.fmin(x0, x0 + transform.a),
+        np.fmin(y0, y0 + transform.e),
+        np.fmax(x0, x0 + transform.a),
+        np.fmax(y0, y0 + transform.e),
+    )
+    area = shapely.area(shapely.intersection(geoms[idx], cells))
+    fraction = area / abs(transform.a * transform.e)
+
+    # Only return the covered cells
+    covered = fraction > 0
+    return idx[covered], row[covered], col[covered], fraction[covered]
+
+
+def _pad_to_bounds(
+    da: xr.DataArray,
+    bbox: tuple[float, float, float, float],
+) -> xr.DataArray:
+    """Pad a raster with zeros to (beyond) the borders of a bounding box."""
+    left, bottom, right, top = da.raster.bounds
+    xres, yres = da.raster.res
+    # Number of cells per side, i.e. (start, end) of the coordinates
+    west = max(math.ceil((left - bbox[0]) / abs(xres)), 0)
+    east = max(math.ceil((bbox[2] - right) / abs(xres)), 0)
+    south = max(math.ceil((bottom - bbox[1]) / abs(yres)), 0)
+    north = max(math.ceil((bbox[3] - top) / abs(yres)), 0)
+    pad = {
+        da.raster.x_dim: (west, east) if xres > 0 else (east, west),
+        da.raster.y_dim: (north, south) if yres < 0 else (south, north),
+    }
+    if sum(sum(item) for item in pad.values()) == 0:
+        return da
+
+    # Pad the data and extend the coordinates
+    coords = {}
+    for dim, res in zip((da.raster.x_dim, da.raster.y_dim), (xres, yres)):
+        values = da[dim].values
+        before, after = pad[dim]
+        coords[dim] = np.concatenate(
+            [
+                values[0] - res * np.arange(before, 0, -1),
+                values,
+                values[-1] + res * np.arange(1, after + 1),
+            ]
+        )
+    da = da.drop_vars(list(da.coords)).pad(pad, constant_values=0)
+    return da.assign_coords(coords)
+
+
+def _block_factors(
+    da: xr.DataArray,
+    grid_like: xr.Dataset | xr.DataArray,
+) -> tuple[int, int, int, int] | None:
+    """Get the integer block size and offset of a grid relative to a finer grid."""
+    if da.raster.crs != grid_like.raster.crs:
+        return None
+    src, dst = da.raster.transform, grid_like.raster.transform
+    if src.b != 0 or src.d != 0 or dst.b != 0 or dst.d != 0:
+        return None
+    # Factors (x, y) and offsets (x, y) in cells of the finer grid
+    factors = np.array(
+        [
+            dst.a / src.a,
+            dst.e / src.e,
+            (dst.c - src.c) / src.a,
+            (dst.f - src.f) / src.e,
+        ]
+    )
+    rounded = np.round(factors)
+    if not np.allclose(factors, rounded, atol=1e-6) or (rounded[:2] < 1).any():
+        return None
+    fx, fy, ox, oy = (int(item) for item in rounded)
+    return fx, fy, ox, oy
+
+
+def _cell_area(
+    grid: xr.Dataset | xr.DataArray,
+) -> xr.DataArray | float:
+    """Get the (true) area of the cells of a grid in square meters."""
+    if grid.raster.crs.is_geographic:
+        return grid.raster.area_grid(dtype=np.float64)
+    unit = grid.raster.crs.axis_info[0].unit_conversion_factor
+    return abs(grid.raster.res[0] * grid.raster.res[1]) * unit**2
+
+
+def _within_grid(
+    da: xr.DataArray,
+    grid_like: xr.Dataset | xr.DataArray,
+) -> xr.DataArray:
+    """Get the cells of a raster with their centre within the bounds of a grid."""
+    xs, ys = np.meshgrid(da.raster.xcoords.values, da.raster.ycoords.values)
+    transformer = Transformer.from_crs(
+        da.raster.crs, grid_like.raster.crs, always_xy=True
+    )
+    xs, ys = transformer.transform(xs, ys)
+    xmin, ymin, xmax, ymax = grid_like.raster.bounds
+    y_dim, x_dim = da.raster.y_dim, da.raster.x_dim
+    return xr.DataArray(
+        (xs >= xmin) & (xs <= xmax) & (ys >= ymin) & (ys <= ymax),
+        coords={y_dim: da[y_dim], x_dim: da[x_dim]},
+        dims=(y_dim, x_dim),
+    )
+
+
+def conservative_regrid(
+    da: xr.DataArray,
+    grid_like: xr.Dataset | xr.DataArray,
+) -> xr.DataArray:
+    """Regrid a raster of extensive values (e.g. damage per cell) conserving totals.
+
+    When the target grid is an integer multiple of the raster, aligned and in the
+    same crs, the cells are summed in blocks via (lazy) coarsening. Otherwise the
+    values are remapped area-weighted, i.e. averaging the value per unit area and
+    multiplying by the target cell area. When the crs differs, the true cell areas
+    (in square meters) are used and the result is scaled to the total of the
+    cells within the target grid, as the areas of both grids are not exactly
+    consistent. Nodata is treated as zero value.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        The input raster.
+    grid_like : xr.Dataset | xr.DataArray
+        The target grid.
+
+    Returns
+    -------
+    xr.DataArray
+        The regridded raster. Cells without any valid input are set to nodata.
+    """
+    nodata = da.raster.nodata
+    fill = nodata if nodata is not None else np.nan
+    valid = da.notnull()
+    if nodata is not None:
+        valid &= da != nodata
+    values = da.where(valid, 0).astype(np.float64)
+    y_dim, x_dim = da.raster.y_dim, da.raster.x_dim
+
+    factors = _block_factors(da, grid_like)
+    if factors is not None:
+        # Select (and pad where needed) the cells covering the target grid
+        fx, fy, ox, oy = factors
+        values = values.drop_vars(list(values.coords))
+        valid = valid.drop_vars(list(valid.coords))
+        for dim, offset, factor, size in zip(
+            (y_dim, x_dim), (oy, ox), (fy, fx), grid_like.raster.shape
+        ):
+            length = size * factor
+            stop = min(offset + length, da.sizes[dim])
+            window = slice(max(offset, 0), max(stop, 0))
+            before = min(max(-offset, 0), length)
+            after = length - before - max(stop - max(offset, 0), 0)
+            values = values.isel({dim: window}).pad({dim: (before, after)})
+            valid = valid.isel({dim: window}).pad({dim: (before, after)})
+            values = values.fillna(0)
+            valid = valid.fillna(False).astype(bool)
+        # Sum the blocks
+        count = valid.coarsen({y_dim: fy, x_dim: fx}).sum()
+        out = values.coarsen({y_dim: fy, x_dim: fx}).sum()
+        out = out.where(count > 0, fill)
+        out = out.assign_coords(
+            {
+                y_dim: grid_like[grid_like.raster.y_dim].values,
+                x_dim: grid_like[grid_like.raster.x_dim].values,
+            }
+        )
+        out.raster.set_crs(grid_like.raster.crs)
+    else:
+        # Area weighted remapping of the value per unit area, padded with zeros
+        # to cover the target grid so partially covered cells are conserved
+        src_area = abs(da.raster.res[0] * da.raster.res[1])
+        dst_area = abs(grid_like.raster.res[0] * grid_like.raster.res[1])
+        if da.raster.crs != grid_like.raster.crs:
+            # Cell sizes in crs units are not comparable, use the true areas
+            src_area = _cell_area(da)
+            dst_area = _cell_area(grid_like)
+        density = _pad_to_bounds(
+            values / src_area,
+            bbox=grid_like.raster.transform_bounds(da.raster.crs),
+        )
+        density.raster.set_crs(da.raster.crs)
+        density.raster.set_nodata(np.nan)
+        out = density.raster.reproject_like(grid_like, method="average") * dst_area
+        if da.raster.crs != grid_like.raster.crs:
+            # Scale to the total within the grid, per layer
+            total = values.where(_within_grid(da, grid_like), 0).sum((y_dim, x_dim))
+            dst_dims = (grid_like.raster.y_dim, grid_like.raster.x_dim)
+            out_total = out.sum(dst_dims)
+            out = out * (total / out_total.where(out_total > 0)).fillna(1)
+        # Only the cells overlapping the input raster are valid
+        xmin, ymin, xmax, ymax = da.raster.transform_bounds(grid_like.raster.crs)
+        xs, ys = grid_like.raster.xcoords.values, grid_like.raster.ycoords.values
+        dx, dy = (abs(item) / 2 for item in grid_like.raster.res)
+        overlap = np.outer(
+            (ys + dy > ymin) & (ys - dy < ymax),
+            (xs + dx > xmin) & (xs - dx < xmax),
+        )
+        out = out.fillna(0).where(overlap, fill)
+
+    out = out.rename(da.name).assign_attrs(da.attrs)
+    out.raster.set_nodata(nodata)
+    return out
+
+
 def expand_raster_to_bounds(
     ds: xr.Dataset,
     bbox: tuple[float] | np.ndarray,
@@ -1,8 +1,19 @@
 """Raster utility."""
 
+from typing import NamedTuple
+
 import xarray as xr
 
 
+class GridSignature(NamedTuple):
+    """Hashable signature of the grid of a raster."""
+
+    crs: str | None
+    transform: tuple[float, ...]
+    shape: tuple[int, ...]
+    dims: tuple[str, str]
+
+
 def force_ns(
     ds: xr.Dataset,
 ) -> xr.Dataset:
@@ -21,3 +32,36 @@ def force_ns(
     if ds.raster.res[1] > 0:
         ds = ds.raster.flipud()
     return ds
+
+
+def grid_signature(
+    ds: xr.Dataset | xr.DataArray,
+    decimals: int = 6,
+) -> GridSignature:
+    """Create a hashable signature of the grid of a raster.
+
+    The signature consists of the crs, the transform, the shape and the names
+    of the spatial dimensions. Two rasters with an equal signature can be
+    combined without regridding.
+
+    Parameters
+    ----------
+    ds : xr.Dataset | xr.DataArray
+        The input raster.
+    decimals : int, optional
+        The number of decimals to round the transform to, by default 6.
+
+    Returns
+    -------
+    GridSignature
+        The signature of the grid.
+    """
+    crs = ds.raster.crs
+    return GridSignature(
+        crs=crs.to_wkt() if crs is not None else None,
+        transform=tuple(
+            round(float(item), decimals) for item in ds.raster.transform[:6]
+        ),
+        shape=tuple(ds.raster.shape),
+        dims=(ds.raster.y_dim, ds.raster.x_dim),
+    )
@@ -1,9 +1,12 @@
 """HydroMT-FIAT utility."""
 
 import logging
+from functools import cache
+from typing import TYPE_CHECKING
 
-from pint import Quantity, UnitRegistry
-from pint.facets.plain import PlainQuantity
+if TYPE_CHECKING:
+    from pint import Quantity, UnitRegistry
+    from pint.facets.plain import PlainQuantity
 
 __all__ = ["create_query"]
 
@@ -26,6 +29,7 @@ HAZARD = "hazard"
 ID = "id"
 IMPACT = "impact"
 MAX = "max"
+METHOD = "method"
 MODEL = "model"
 NAME = "name"
 OBJECT = "object"
@@ -78,12 +82,29 @@ OBJECT__TYPE = f"{OBJECT}_{TYPE}"
 OBJECT__ID = f"{OBJECT}_{ID}"
 SQUARE__ID = f"{SQUARE}_{ID}"
 
-# Unit database init
-UNIT_REGISTRY: UnitRegistry = UnitRegistry()  # type: ignore[type-arg]
-
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+@cache
+def unit_registry() -> "UnitRegistry":  # type: ignore[type-arg]
+    """Get the unit registry, built on first use as this is slow."""
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+@cache
+def _standard_unit(
+    unit: str,
+    default: str | None,
+) -> tuple["PlainQuantity", "PlainQuantity"]:  # type: ignore[type-arg]
+    """Get the quantity of a unit and converted to the default (memoized)."""
+    registry = unit_registry()
+    quantity = registry(unit)
+    default = default or str(registry.get_base_units(unit)[1])
+    return quantity, quantity.to(default)
+
+
 def create_query(**kwargs) -> str:
     """Generate a query for a pandas DataFrame.
 
@@ -112,7 +133,7 @@ def create_query(**kwargs) -> str:
 def standard_unit(
     unit: str,
     default: str | None = None,
-) -> PlainQuantity | Quantity:  # type: ignore[type-arg]
+) -> "PlainQuantity | Quantity":  # type: ignore[type-arg]
     """Translate unit to standard unit for category.
 
     Parameters
@@ -129,9 +150,7 @@ def standard_unit(
         Quantity holding the standard unit and conversion magnitude.
     """
     # Check for the dafault unit
-    quantity = UNIT_REGISTRY(unit)
-    default = default or str(UNIT_REGISTRY.get_base_units(unit)[1])
-    default_quantity = quantity.to(default)
+    quantity, default_quantity = _standard_unit(unit, default)
     if default_quantity.magnitude == 1:
         return quantity
 
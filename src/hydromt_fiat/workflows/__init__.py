@@ -1,14 +1,20 @@
 """HydroMT-FIAT workflow function."""
 
-from .aggregate import aggregate_spatially, prep_data_for_aggregation
+from .aggregate import (
+    aggregate_layers,
+    aggregate_spatially,
+    aggregate_square,
+    aggregate_stream,
+    prep_data_for_aggregation,
+)
 from .damage import max_monetary_damage
 from .exposure_geom import (
     exposure_geoms_add_columns,
     exposure_geoms_link_vulnerability,
     exposure_geoms_setup,
 )
-from .exposure_grid import exposure_grid_setup
-from .hazard import hazard_setup
+from .exposure_grid import exposure_grid_rasterize, exposure_grid_setup
+from .hazard import hazard_sample, hazard_setup, hazard_zonal
 from .vulnerability import (
     merge_vulnerability_curves,
     merge_vulnerability_identifiers,
@@ -17,12 +23,18 @@ from .vulnerability import (
 )
 
 __all__ = [
+    "aggregate_layers",
     "aggregate_spatially",
+    "aggregate_square",
+    "aggregate_stream",
     "exposure_geoms_add_columns",
     "exposure_geoms_link_vulnerability",
     "exposure_geoms_setup",
+    "exposure_grid_rasterize",
     "exposure_grid_setup",
+    "hazard_sample",
     "hazard_setup",
+    "hazard_zonal",
     "max_monetary_damage",
     "merge_vulnerability_curves",
     "merge_vulnerability_identifiers",
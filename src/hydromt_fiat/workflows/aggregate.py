@@ -1,20 +1,139 @@
 """Some functions for aggregation."""
 
 import logging
-import uuid
+import math
+from collections.abc import Iterator
+from pathlib import Path
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyogrio
+import shapely
 from hydromt.gis import utm_crs
+from pyproj.crs import CRS
 
-from hydromt_fiat.utils import AREA__SQM, GEOMETRY
+from hydromt_fiat.utils import AREA__SQM, GEOMETRY, SQUARE__ID, standard_unit
 
 __all__ = [
+    "aggregate_layers",
     "aggregate_spatially",
+    "aggregate_square",
+    "aggregate_stream",
     "prep_data_for_aggregation",
 ]
 
 logger = logging.getLogger(f"hydromt.{__name__}")
 
+STREAM_METHODS = ["sum", "count", "min", "max", "mean"]
+
+
+def _object_data(
+    output_data: gpd.GeoDataFrame,
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Get the attributes (with the area) and centroids, leaving the input as is."""
+    data = pd.DataFrame(output_data.drop(columns=output_data.geometry.name))
+    data[AREA__SQM] = output_data.area.values
+    return data, output_data.centroid.values
+
+
+def _aggregate_points(
+    data: pd.DataFrame,
+    points: np.ndarray,
+    aggregation_areas: gpd.GeoDataFrame,
+    method: str | list[str],
+) -> gpd.GeoDataFrame:
+    """Aggregate the object data per area based on the object centroids."""
+    # Label the objects with the aggregation areas in bulk using the spatial index
+    # Points on a shared border are counted for all touching areas
+    obj_idx, area_idx = aggregation_areas.sindex.query(points, predicate="intersects")
+
+    # Aggregate per area, no geometry union needed
+    aggregated = data.iloc[obj_idx].groupby(area_idx).agg(method)
+    if isinstance(aggregated.columns, pd.MultiIndex):
+        aggregated.columns = [f"{col}_{func}" for col, func in aggregated.columns]
+
+    # Merge back
+    aggregation_areas = aggregation_areas.reset_index(drop=True)
+    return aggregation_areas.loc[:, [GEOMETRY]].join(aggregated)
+
+
+def _aggregate_split(
+    data: pd.DataFrame,
+    geometry: np.ndarray,
+    points: np.ndarray,
+    aggregation_areas: gpd.GeoDataFrame,
+    method: str,
+) -> gpd.GeoDataFrame:
+    """Aggregate the object data per area, weighted by the overlap with the areas."""
+    if method not in ["mean", "sum"]:
+        raise ValueError(
+            f"Method '{method}' not supported for splitting, choose 'mean' or 'sum'"
+        )
+    geometry = np.asarray(geometry)
+    areas = aggregation_areas.geometry.values
+    # The size of the objects, area for polygons and length for lines
+    polygon = shapely.get_dimensions(geometry) == 2
+    size = np.where(polygon, shapely.area(geometry), shapely.length(geometry))
+
+    # Only split the objects of which the bounding box hits multiple areas
+    obj_idx, area_idx = aggregation_areas.sindex.query(geometry)
+    crossing = (np.bincount(obj_idx, minlength=len(geometry)) > 1) & (size > 0)
+    obj_idx, area_idx = obj_idx[crossing[obj_idx]], area_idx[crossing[obj_idx]]
+    parts = shapely.intersection(geometry[obj_idx], areas[area_idx])
+    weight = (
+        np.where(polygon[obj_idx], shapely.area(parts), shapely.length(parts))
+        / size[obj_idx]
+    )
+    covered = weight > 0
+
+    # The others are assigned based on the centroid
+    rest = np.flatnonzero(~crossing)
+    rest_idx, rest_area_idx = aggregation_areas.sindex.query(
+        points[rest], predicate="intersects"
+    )
+    obj_idx = np.concatenate([obj_idx[covered], rest[rest_idx]])
+    area_idx = np.concatenate([area_idx[covered], rest_area_idx])
+    weight = np.concatenate([weight[covered], np.ones(len(rest_idx))])
+
+    # Weighted aggregation per area
+    aggregated = data.iloc[obj_idx].mul(weight, axis=0).groupby(area_idx).sum()
+    if method == "mean":
+        total = pd.Series(weight).groupby(area_idx).sum()
+        aggregated = aggregated.div(total, axis=0)
+
+    # Merge back
+    aggregation_areas = aggregation_areas.reset_index(drop=True)
+    return aggregation_areas.loc[:, [GEOMETRY]].join(aggregated)
+
+
+def _accumulate(
+    acc: dict[str, pd.DataFrame] | None,
+    data: pd.DataFrame,
+    area_idx: np.ndarray,
+) -> dict[str, pd.DataFrame]:
+    """Update the running sum, count, min and max per area with a batch."""
+    grouped = data.groupby(area_idx)
+    batch = {
+        "sum": grouped.sum(),
+        "count": grouped.count(),
+        "min": grouped.min(),
+        "max": grouped.max(),
+    }
+    if acc is None:
+        return batch
+    acc["sum"] = acc["sum"].add(batch["sum"], fill_value=0)
+    acc["count"] = acc["count"].add(batch["count"], fill_value=0)
+    # Missing entries are NaN, which are skipped by fmin and fmax
+    index = acc["min"].index.union(batch["min"].index)
+    for key, func in (("min", np.fmin), ("max", np.fmax)):
+        acc[key] = pd.DataFrame(
+            func(acc[key].reindex(index).values, batch[key].reindex(index).values),
+            index=index,
+            columns=acc[key].columns,
+        )
+    return acc
+
 
 def prep_data_for_aggregation(
     output_data: gpd.GeoDataFrame,
@@ -56,6 +175,7 @@ def aggregate_spatially(
     method: str,
     areal_mean: bool = False,
     per_area: bool = False,
+    split: bool = False,
 ) -> gpd.GeoDataFrame:
     """Aggregate data on a square vector grid.
 
@@ -77,6 +197,11 @@ def aggregate_spatially(
         Whether or not to calculate per unit area using the aggregation area (True) or
         the combined (based on method) area of the features in the `output_data`.
         By default False.
+    split : bool, optional
+        Whether to split the values of objects crossing the borders of the
+        aggregation areas in proportion to their area (or length for lines) within
+        each area. Only supported for the 'sum' and 'mean' methods. If False, the
+        objects are assigned to an area based on their centroid. By default False.
 
     Returns
     -------
@@ -84,22 +209,22 @@ def aggregate_spatially(
         The vector grid with aggregated values.
     """
     logger.info("Aggregating spatially..")
-    # Set the data to points (centroids)
-    output_data[AREA__SQM] = output_data.area
-    output_data.geometry = output_data.centroid
-
-    column = str(uuid.uuid1())
-    aggregation_areas = aggregation_areas.reset_index(names=[column])
-    aggregation_areas = aggregation_areas.loc[:, [GEOMETRY, column]]
-
-    # Overlay with the fiat output
-    output_data = output_data.overlay(aggregation_areas, how="intersection")
-    output_data = output_data.dissolve(by=column, aggfunc=method)
-    output_data.drop(GEOMETRY, axis=1, inplace=True)
-
-    # Merge back
-    aggregation_areas = aggregation_areas.merge(output_data, on=column, how="left")
-    aggregation_areas.drop([column], axis=1, inplace=True)
+    data, points = _object_data(output_data)
+    if split:
+        aggregation_areas = _aggregate_split(
+            data=data,
+            geometry=output_data.geometry.values,
+            points=points,
+            aggregation_areas=aggregation_areas,
+            method=method,
+        )
+    else:
+        aggregation_areas = _aggregate_points(
+            data=data,
+            points=points,
+            aggregation_areas=aggregation_areas,
+            method=method,
+        )
 
     # Check if one wants a areal mean (spatial average), if not return directly
     if not areal_mean:
@@ -119,3 +244,229 @@ def aggregate_spatially(
 
     # Return the aggregation dataset
     return aggregation_areas
+
+
+def aggregate_layers(
+    output_data: gpd.GeoDataFrame,
+    aggregation_areas: dict[str, gpd.GeoDataFrame],
+    methods: list[str],
+) -> dict[str, gpd.GeoDataFrame]:
+    """Aggregate data over multiple sets of areas with multiple methods at once.
+
+    The areas and centroids of the objects are determined once, after which the
+    objects are labelled per set of areas in bulk and all methods are computed in
+    a single grouped operation.
+
+    Warning
+    -------
+    Run :py:func:`~prep_data_for_aggregation` beforehand.
+
+    Parameters
+    ----------
+    output_data : gpd.GeoDataFrame
+        The output vector data set from FIAT, made ready for aggregation.
+    aggregation_areas : dict[str, gpd.GeoDataFrame]
+        The datasets with areas over which to aggregate the data, per name.
+    methods : list[str]
+        The methods of aggregation, e.g. ['sum', 'mean', 'count'].
+
+    Returns
+    -------
+    dict[str, gpd.GeoDataFrame]
+        The areas with the aggregated values per name. The columns are named after
+        the original column and the method, e.g. 'max_damage_content_sum'.
+    """
+    logger.info(f"Aggregating spatially over {list(aggregation_areas)} using {methods}")
+    data, points = _object_data(output_data)
+
+    aggregated = {}
+    for name, areas in aggregation_areas.items():
+        if areas.crs is not None and output_data.crs is not None:
+            areas = areas.to_crs(output_data.crs)
+        aggregated[name] = _aggregate_points(
+            data=data,
+            points=points,
+            aggregation_areas=areas,
+            method=methods,
+        )
+    return aggregated
+
+
+def aggregate_square(
+    output_data: gpd.GeoDataFrame,
+    res: float,
+    unit: str,
+    method: str,
+    keep_empty: bool = False,
+) -> gpd.GeoDataFrame:
+    """Aggregate data on a square grid.
+
+    The grid starts at the upper left corner of the bounding box of the data. The
+    cell of each object is computed directly from the coordinates of its centroid
+    and only the occupied cells are turned into polygons (unless `keep_empty`).
+    Every cell gets a 'square_id' column, its row-major number in the full grid.
+
+    Warning
+    -------
+    Run :py:func:`~prep_data_for_aggregation` beforehand.
+
+    Parameters
+    ----------
+    output_data : gpd.GeoDataFrame
+        The output vector data set from FIAT, made ready for aggregation.
+    res : float
+        The resolution of the grid. This defines both the y and x direction of the data.
+    unit : str
+        The unit of the resolution variable, e.g. m, ft, km etc..
+    method : str
+        The method of aggregation.
+    keep_empty : bool, optional
+        Whether to keep the cells without any objects (i.e. the full grid).
+        By default False, i.e. only the occupied cells are returned.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The square cells with the geometry, the 'square_id' and the aggregated
+        values.
+    """
+    logger.info("Aggregating on a square grid..")
+    # Convert the unit
+    conversion = standard_unit(unit=unit, default="m")
+    res *= conversion.magnitude
+
+    # Get the shape of the grid based on the bounding box of the data
+    xmin, ymin, xmax, ymax = output_data.total_bounds
+    nrows = max(math.ceil((ymax - ymin) / res), 1)
+    ncols = max(math.ceil((xmax - xmin) / res), 1)
+
+    # Get the area and the cell index of the centroid of the objects
+    data, points = _object_data(output_data)
+    rows = np.clip(np.floor((ymax - shapely.get_y(points)) / res), 0, nrows - 1)
+    cols = np.clip(np.floor((shapely.get_x(points) - xmin) / res), 0, ncols - 1)
+    cells = (rows * ncols + cols).astype(np.int64)
+
+    # Aggregate per cell
+    aggregated = data.groupby(cells).agg(method)
+    if keep_empty:
+        aggregated = aggregated.reindex(range(nrows * ncols))
+
+    # Create the polygons of the cells
+    rows, cols = np.divmod(aggregated.index.values, ncols)
+    x0 = xmin + cols * res
+    y0 = ymax - rows * res
+    aggregated = aggregated.reset_index(names=SQUARE__ID)
+    aggregated = gpd.GeoDataFrame(
+        aggregated,
+        geometry=shapely.box(x0, y0 - res, x0 + res, y0),
+        crs=output_data.crs,
+    )
+
+    # Return the aggregated data with the geometry first
+    return aggregated[[GEOMETRY] + aggregated.columns.drop(GEOMETRY).tolist()]
+
+
+def _read_batches(
+    path: Path | str,
+    batch_size: int,
+    **kwargs,
+) -> Iterator[gpd.GeoDataFrame]:
+    """Read a vector file in batches of features, opening it only once."""
+    with pyogrio.open_arrow(
+        path, batch_size=batch_size, use_pyarrow=True, **kwargs
+    ) as (meta, reader):
+        name = meta["geometry_name"] or "wkb_geometry"
+        crs = CRS.from_user_input(meta["crs"]) if meta["crs"] else None
+        for batch in reader:
+            geom = shapely.from_wkb(batch.column(name).to_numpy(zero_copy_only=False))
+            data = batch.drop_columns([name]).to_pandas()
+            yield gpd.GeoDataFrame(data, geometry=geom, crs=crs)
+
+
+def aggregate_stream(
+    path: Path | str,
+    aggregation_areas: gpd.GeoDataFrame,
+    method: str | list[str],
+    batch_size: int = 100000,
+    **kwargs,
+) -> gpd.GeoDataFrame:
+    """Aggregate the data of a vector file without loading it entirely.
+
+    The file is opened once and read in batches of features (as arrow record
+    batches). Each batch is labelled with the
+    aggregation areas based on the centroids of the objects, after which running
+    accumulators per area are updated. The memory usage is therefore bound by the
+    batch size and the number of aggregation areas.
+
+    Parameters
+    ----------
+    path : Path | str
+        The path to the FIAT output vector file.
+    aggregation_areas : gpd.GeoDataFrame
+        The dataset with areas over which to aggregate the data.
+    method : str | list[str]
+        The method(s) of aggregation, choose from 'sum', 'count', 'min', 'max'
+        and 'mean'.
+    batch_size : int, optional
+        The number of features to read at once, by default 100000.
+    **kwargs : dict
+        Additional keyword arguments that are passed to the
+        `pyogrio.open_arrow` function, e.g. 'layer'.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        The areas with the aggregated values. If multiple methods are provided, the
+        columns are named after the original column and the method,
+        e.g. 'max_damage_content_sum'.
+    """
+    methods = [method] if isinstance(method, str) else method
+    unknown = [item for item in methods if item not in STREAM_METHODS]
+    if len(unknown) != 0:
+        raise ValueError(
+            f"Method(s) {unknown} not supported for streaming, \
+choose from {STREAM_METHODS}"
+        )
+
+    logger.info(f"Streaming aggregation of {Path(path).as_posix()} using {methods}")
+    acc = None
+    crs = None
+    for batch in _read_batches(path, batch_size=batch_size, **kwargs):
+        if len(batch) == 0:
+            continue
+        # Sort out the crs once, based on the first batch and the areas
+        if crs is None:
+            crs = batch.crs
+            if crs is not None and aggregation_areas.crs is not None:
+                aggregation_areas = aggregation_areas.to_crs(crs)
+            if crs is not None and crs.is_geographic:
+                logger.warning(
+                    "CRS of data was geographic, reprojecting to projected crs"
+                )
+                crs = utm_crs(aggregation_areas.total_bounds)
+                aggregation_areas = aggregation_areas.to_crs(crs)
+        batch = batch.select_dtypes(include=[float, "geometry"])
+        if batch.crs is not None and batch.crs != crs:
+            batch = batch.to_crs(crs)
+
+        # Label the objects in bulk and update the accumulators
+        data, points = _object_data(batch)
+        obj_idx, area_idx = aggregation_areas.sindex.query(
+            points, predicate="intersects"
+        )
+        acc = _accumulate(acc, data.iloc[obj_idx], area_idx)
+
+    aggregation_areas = aggregation_areas.reset_index(drop=True).loc[:, [GEOMETRY]]
+    if acc is None:
+        return aggregation_areas
+
+    # Finalize the results
+    acc["mean"] = acc["sum"].div(acc["count"].where(acc["count"] > 0))
+    aggregated = pd.concat([acc[item] for item in methods], axis=1, keys=methods)
+    if len(methods) == 1:
+        aggregated = aggregated.droplevel(0, axis=1)
+    else:
+        columns = acc["sum"].columns
+        aggregated = aggregated.loc[:, [(f, c) for c in columns for f in methods]]
+        aggregated.columns = [f"{col}_{func}" for col in columns for func in methods]
+    return aggregation_areas.join(aggregated)
@@ -1,20 +1,29 @@
 """Exposure workflows."""
 
 import logging
+from collections import Counter
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 import xarray as xr
+from affine import Affine
+from pyproj.crs import CRS
 
+from hydromt_fiat.gis.raster import cell_index, coverage_fraction
 from hydromt_fiat.utils import (
     CURVE,
     EXPOSURE__TYPE,
+    FN,
     FN_CURVE,
     IMPACT__SUBTYPE,
+    MAX,
     OBJECT__TYPE,
 )
 from hydromt_fiat.workflows.utils import _merge_dataarrays, _process_dataarray
 
-__all__ = ["exposure_grid_setup"]
+__all__ = ["exposure_grid_rasterize", "exposure_grid_setup"]
 
 logger = logging.getLogger(f"hydromt.{__name__}")
 
@@ -24,6 +33,7 @@ def exposure_grid_setup(
     exposure_data: dict[str, xr.DataArray],
     vulnerability: pd.DataFrame,
     exposure_link: pd.DataFrame | None = None,
+    conservative: bool = False,
 ) -> xr.Dataset:
     """Read and transform exposure grid data.
 
@@ -40,6 +50,10 @@ def exposure_grid_setup(
     exposure_link : pd.DataFrame, optional
         Table containing the names of the exposure files and corresponding
         vulnerability curves.
+    conservative : bool, optional
+        Whether to regrid the exposure data conserving the totals per grid, i.e.
+        block sums for integer factors and area weighted remapping otherwise.
+        By default False.
 
     Returns
     -------
@@ -101,4 +115,171 @@ defaulting to the name of the exposure layer"
     if len(exposure_dataarrays) == 0:
         return xr.Dataset()
 
-    return _merge_dataarrays(grid_like=grid_like, dataarrays=exposure_dataarrays)
+    return _merge_dataarrays(
+        grid_like=grid_like,
+        dataarrays=exposure_dataarrays,
+        conservative=conservative,
+    )
+
+
+def _rasterize_weights(
+    geometry: gpd.GeoSeries,
+    transform: Affine,
+    shape: tuple[int, int],
+    split: bool,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the (object, flat cell, weight) triplets of geometries in a grid."""
+    rows, cols = cell_index(geometry, transform=transform, shape=shape)
+    idx = np.flatnonzero(rows >= 0)
+    cells = rows[idx].astype(np.int64) * shape[1] + cols[idx]
+    weight = np.ones(len(idx))
+    if not split:
+        return idx, cells, weight
+
+    # Split the objects with an area over the cells they cover, by the share of
+    # their area, so the part outside of the grid is not accounted for
+    obj, row, col, frac = coverage_fraction(geometry, transform=transform, shape=shape)
+    area = shapely.area(np.asarray(geometry.values))
+    share = frac * abs(transform.a * transform.e) / np.where(area > 0, area, 1)[obj]
+    # Objects without area (e.g. points) fall back to the centroid
+    centroid = area[idx] == 0
+    return (
+        np.concatenate([obj, idx[centroid]]),
+        np.concatenate([row.astype(np.int64) * shape[1] + col, cells[centroid]]),
+        np.concatenate([share, weight[centroid]]),
+    )
+
+
+def _accumulate(
+    keys: np.ndarray,
+    values: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Sum the values per (sorted, unique) key, sparsely."""
+    keys, inverse = np.unique(keys, return_inverse=True)
+    return keys, np.bincount(inverse, weights=values, minlength=keys.size)
+
+
+def exposure_grid_rasterize(
+    exposure_data: gpd.GeoDataFrame,
+    grid_like: xr.Dataset | xr.DataArray,
+    *,
+    split: bool = False,
+    batch_size: int = 100000,
+) -> xr.Dataset:
+    """Rasterize exposure geometries into an exposure grid.
+
+    The maximum potential damage columns (e.g. 'max_damage_structure') are summed
+    per cell of the grid, one layer per object type and vulnerability curve (the
+    corresponding 'fn_' column). When an object type is linked to more than one
+    curve, the curve is added to the name of its layers. The objects are processed
+    in batches and the sums are kept sparse (only the cells covered by objects per
+    batch), until they are reduced once when the output grid is created.
+
+    Parameters
+    ----------
+    exposure_data : gpd.GeoDataFrame
+        The exposure data, linked to the vulnerability and with maximum potential
+        damage columns.
+    grid_like : xr.Dataset | xr.DataArray
+        The grid to rasterize to, e.g. the hazard data.
+    split : bool, optional
+        Whether to split the value of (polygon) objects over the cells they cover
+        based on the share of their area within each cell. Parts outside of the
+        grid are discarded. If False, the value is assigned to the cell
+        containing the centroid of the object. By default False.
+    batch_size : int, optional
+        The number of objects processed at once, by default 100000.
+
+    Returns
+    -------
+    xr.Dataset
+        The exposure grid, aligned with `grid_like`.
+    """
+    # Get the columns with the maximum damage and their vulnerability curves
+    columns = [
+        col
+        for col in exposure_data.columns
+        if col.startswith(f"{MAX}_") and f"{FN}_{col[len(MAX) + 1 :]}" in exposure_data
+    ]
+    if len(columns) == 0:
+        raise ValueError(
+            "No maximum damage columns with corresponding vulnerability curves \
+found in the exposure data"
+        )
+    logger.info(f"Rasterizing {columns} of {len(exposure_data)} objects")
+
+    # Get the geometries in the same crs as the grid
+    geometry = exposure_data.geometry
+    if grid_like.raster.crs is not None and geometry.crs is not None:
+        crs = CRS.from_user_input(grid_like.raster.crs)
+        if not geometry.crs.equals(crs):
+            geometry = geometry.to_crs(crs)
+    transform = grid_like.raster.transform
+    shape = grid_like.raster.shape
+    ncell = shape[0] * shape[1]
+
+    # Set the layers, i.e. per object type and vulnerability curve
+    layers: dict[
+        str, tuple[np.ndarray, list[list[str]], list[np.ndarray], list[np.ndarray]]
+    ] = {}
+    for col in columns:
+        suffix = col[len(MAX) + 1 :]
+        curves = exposure_data[f"{FN}_{suffix}"].astype(str)
+        prefix = curves
+        if OBJECT__TYPE in exposure_data:
+            prefix = exposure_data[OBJECT__TYPE].astype(str)
+        codes, uniques = pd.factorize(prefix + "\0" + curves)
+        codes[exposure_data[col].isna().values] = -1
+        layers[col] = (
+            codes,
+            [item.split("\0") + [suffix] for item in uniques],
+            [np.zeros(0, dtype=np.int64)],
+            [np.zeros(0)],
+        )
+
+    # Go through the objects in batches
+    for start in range(0, len(geometry), batch_size):
+        part = slice(start, start + batch_size)
+        idx, cells, weight = _rasterize_weights(
+            geometry.iloc[part], transform=transform, shape=shape, split=split
+        )
+        for col, layer in layers.items():
+            code = layer[0][part][idx]
+            valid = code >= 0
+            keys, sums = _accumulate(
+                code[valid] * ncell + cells[valid],
+                exposure_data[col].values[part][idx][valid] * weight[valid],
+            )
+            layer[2].append(keys)
+            layer[3].append(sums)
+
+    # Create the data arrays
+    coords = {
+        grid_like.raster.y_dim: grid_like[grid_like.raster.y_dim].values,
+        grid_like.raster.x_dim: grid_like[grid_like.raster.x_dim].values,
+    }
+    # Object types linked to multiple curves get the curve in the layer name
+    counts = Counter(
+        (name, suffix) for layer in layers.values() for name, _, suffix in layer[1]
+    )
+    dataarrays = []
+    for _, names, batch_keys, batch_sums in layers.values():
+        keys, sums = _accumulate(np.concatenate(batch_keys), np.concatenate(batch_sums))
+        codes, cells = np.divmod(keys, ncell)
+        for code, (name, curve, suffix) in enumerate(names):
+            if counts[(name, suffix)] > 1:
+                name = f"{name}_{curve}"
+            data = np.zeros(ncell)
+            data[cells[codes == code]] = sums[codes == code]
+            da = xr.DataArray(
+                data.reshape(shape),
+                coords=coords,
+                dims=(grid_like.raster.y_dim, grid_like.raster.x_dim),
+            )
+            da.raster.set_crs(grid_like.raster.crs)
+            da = _process_dataarray(da=da, da_name=f"{name}_{suffix}")
+            da = da.assign_attrs({FN_CURVE: curve})
+            dataarrays.append(da)
+    ds = xr.merge(dataarrays)
+    ds.attrs = {}
+    return ds
@@ -1,18 +1,254 @@
 """Hazard workflows."""
 
 import logging
+from collections.abc import Hashable, Mapping
 from typing import Any
 
+import geopandas as gpd
+import numpy as np
+import numpy.typing as npt
 import xarray as xr
+from affine import Affine
+from pyproj.crs import CRS
 
-from hydromt_fiat.utils import ANALYSIS, EVENT, RISK, RP, TYPE, standard_unit
-from hydromt_fiat.workflows.utils import _merge_dataarrays, _process_dataarray
+from hydromt_fiat.gis.raster import cell_index, cell_window, coverage_fraction
+from hydromt_fiat.utils import (
+    ANALYSIS,
+    AREA,
+    EVENT,
+    HAZARD,
+    METHOD,
+    OBJECT,
+    OBJECT__ID,
+    RISK,
+    RP,
+    TYPE,
+    standard_unit,
+)
+from hydromt_fiat.workflows.utils import (
+    _merge_dataarrays,
+    _process_dataarray,
+    _reduce_dataarray,
+    _stack_dataarrays,
+)
 
-__all__ = ["hazard_setup"]
+__all__ = ["hazard_sample", "hazard_setup", "hazard_zonal"]
 
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
+def _event_values(
+    hazard: xr.Dataset,
+    nodata: Mapping[Hashable, Any],
+) -> tuple[npt.NDArray[np.floating], list[str]]:
+    """Load the hazard values with the events along the first axis."""
+    values = []
+    events: list[str] = []
+    for name, da in hazard.data_vars.items():
+        if nodata.get(name) is not None:
+            da = da.where(da != nodata[name])
+        # Stacked data, i.e. multiple events in one variable
+        if EVENT in da.dims:
+            da = da.transpose(EVENT, ...)
+            values.append(da.values)
+            events.extend([str(item) for item in da[EVENT].values])
+            continue
+        values.append(da.values[None])
+        events.append(str(name))
+    return np.concatenate(values, axis=0), events
+
+
+def _geometry_like(
+    hazard: xr.Dataset,
+    exposure_data: gpd.GeoDataFrame,
+) -> gpd.GeoSeries:
+    """Get the geometries in the same crs as the hazard data."""
+    geometry = exposure_data.geometry
+    if hazard.raster.crs is not None and geometry.crs is not None:
+        crs = CRS.from_user_input(hazard.raster.crs)
+        if not geometry.crs.equals(crs):
+            geometry = geometry.to_crs(crs)
+    return geometry
+
+
+def _object_ids(exposure_data: gpd.GeoDataFrame) -> np.ndarray:
+    """Get the object identifiers, falling back to the index."""
+    if OBJECT__ID in exposure_data:
+        return exposure_data[OBJECT__ID].values
+    return exposure_data.index.values
+
+
+def hazard_sample(
+    hazard: xr.Dataset,
+    exposure_data: gpd.GeoDataFrame,
+    *,
+    cells: npt.NDArray[np.int32 | np.int64] | None = None,
+) -> xr.DataArray:
+    """Sample the hazard data at the exposure objects.
+
+    The method per object follows the 'method' column of the exposure data, like
+    Delft-FIAT. By default (and for 'centroid'), the hazard value is taken from the
+    raster cell containing the centroid of the object. The cell index of all
+    objects is computed in bulk, after which the values of all events are gathered
+    at once. For the objects with the 'area' method, the area weighted mean of
+    the covered cells is taken (see :py:func:`hazard_zonal`).
+
+    Parameters
+    ----------
+    hazard : xr.Dataset
+        The hazard data, either one variable per event or stacked along the
+        'event' dimension.
+    exposure_data : gpd.GeoDataFrame
+        The exposure data.
+    cells : npt.NDArray[np.int32 | np.int64], optional
+        A precomputed flat cell index (row * number of columns + column) of the
+        objects in the hazard grid, -1 for outside. If None, it is computed from
+        the geometries. By default None.
+
+    Returns
+    -------
+    xr.DataArray
+        The hazard values per object and event, with dimensions (object, event).
+        Objects outside of the hazard grid or on nodata cells are set to NaN.
+    """
+    logger.info(f"Sampling the hazard data at {len(exposure_data)} objects")
+    if cells is None:
+        rows, cols = cell_index(
+            _geometry_like(hazard, exposure_data),
+            transform=hazard.raster.transform,
+            shape=hazard.raster.shape,
+        )
+    else:
+        rows, cols = np.divmod(cells, hazard.raster.shape[1])
+    valid = (rows >= 0) & (cols >= 0)
+
+    # Vectorized (pointwise) indexing, for all variables at once
+    sampled = hazard.isel(
+        {
+            hazard.raster.y_dim: xr.DataArray(np.where(valid, rows, 0), dims=OBJECT),
+            hazard.raster.x_dim: xr.DataArray(np.where(valid, cols, 0), dims=OBJECT),
+        }
+    ).compute()
+    nodata = {name: da.raster.nodata for name, da in hazard.data_vars.items()}
+    data, events = _event_values(sampled, nodata=nodata)
+    data = data.T
+    data[~valid] = np.nan
+
+    # The objects to sample over their area
+    if METHOD in exposure_data:
+        area = (exposure_data[METHOD] == AREA).values
+        if area.any():
+            zonal = hazard_zonal(hazard, exposure_data.loc[area])
+            data[area] = zonal["mean"].values
+
+    return xr.DataArray(
+        data,
+        coords={OBJECT: _object_ids(exposure_data), EVENT: events},
+        dims=(OBJECT, EVENT),
+        name=HAZARD,
+    )
+
+
+def hazard_zonal(
+    hazard: xr.Dataset,
+    exposure_data: gpd.GeoDataFrame,
+    *,
+    tile_size: int = 256,
+) -> xr.Dataset:
+    """Compute zonal statistics of the hazard data over the exposure objects.
+
+    The statistics are weighted by the exact fraction of the hazard cells covered
+    by the (polygon) objects, i.e. like the 'area' method of Delft-FIAT.
+    The objects are processed per raster-aligned tile of `tile_size` cells,
+    reading only the hazard data within the window of that tile, which keeps the
+    memory bounded for large numbers of objects.
+
+    Parameters
+    ----------
+    hazard : xr.Dataset
+        The hazard data, either one variable per event or stacked along the
+        'event' dimension.
+    exposure_data : gpd.GeoDataFrame
+        The exposure data.
+    tile_size : int, optional
+        The size of the tiles in number of cells, by default 256.
+
+    Returns
+    -------
+    xr.Dataset
+        The area weighted mean ('mean'), the maximum ('max') and the fraction of
+        the covered area with a hazard value above zero ('wet_fraction') per object
+        and event, with dimensions (object, event).
+    """
+    logger.info(f"Computing zonal hazard statistics for {len(exposure_data)} objects")
+    geometry = _geometry_like(hazard, exposure_data)
+    transform = hazard.raster.transform
+    y_dim, x_dim = hazard.raster.y_dim, hazard.raster.x_dim
+    nodata = {name: da.raster.nodata for name, da in hazard.data_vars.items()}
+    window = cell_window(geometry, transform=transform, shape=hazard.raster.shape)
+
+    # Assign the objects to tiles based on the start of their window
+    inside = (window[:, 1] > window[:, 0]) & (window[:, 3] > window[:, 2])
+    keys = (window[:, 0] // tile_size) * (
+        hazard.raster.shape[1] // tile_size + 1
+    ) + window[:, 2] // tile_size
+    keys[~inside] = -1
+
+    n_event = sum(
+        da.sizes[EVENT] if EVENT in da.dims else 1 for da in hazard.data_vars.values()
+    )
+    mean = np.full((len(geometry), n_event), np.nan)
+    maximum = np.full((len(geometry), n_event), np.nan)
+    wet = np.full((len(geometry), n_event), np.nan)
+    events: list[str] = []
+    for key in np.unique(keys[inside]):
+        idx = np.flatnonzero(keys == key)
+        # Read the hazard data of the window of this tile
+        r0, r1 = window[idx, 0].min(), window[idx, 1].max()
+        c0, c1 = window[idx, 2].min(), window[idx, 3].max()
+        values, events = _event_values(
+            hazard.isel({y_dim: slice(r0, r1), x_dim: slice(c0, c1)}).compute(),
+            nodata=nodata,
+        )
+        obj, row, col, frac = coverage_fraction(
+            geometry.iloc[idx],
+            transform=transform * Affine.translation(c0, r0),
+            shape=(r1 - r0, c1 - c0),
+        )
+
+        # Aggregate the covered cells per object
+        cells = values[:, row, col].T
+        valid = ~np.isnan(cells)
+        cover = np.bincount(obj, weights=frac, minlength=len(idx))
+        weight = np.zeros((len(idx), n_event))
+        np.add.at(weight, obj, frac[:, None] * valid)
+        total = np.zeros((len(idx), n_event))
+        np.add.at(total, obj, frac[:, None] * np.where(valid, cells, 0))
+        wet_area = np.zeros((len(idx), n_event))
+        np.add.at(wet_area, obj, frac[:, None] * (np.where(valid, cells, 0) > 0))
+        peak = np.full((len(idx), n_event), -np.inf)
+        np.maximum.at(peak, obj, np.where(valid, cells, -np.inf))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean[idx] = np.where(weight > 0, total / weight, np.nan)
+            wet[idx] = np.where(cover[:, None] > 0, wet_area / cover[:, None], np.nan)
+        maximum[idx] = np.where(np.isfinite(peak), peak, np.nan)
+
+    if not events:  # No object within the hazard grid
+        _, events = _event_values(
+            hazard.isel({y_dim: slice(0, 1), x_dim: slice(0, 1)}).compute(),
+            nodata=nodata,
+        )
+    return xr.Dataset(
+        {
+            "mean": ((OBJECT, EVENT), mean),
+            "max": ((OBJECT, EVENT), maximum),
+            "wet_fraction": ((OBJECT, EVENT), wet),
+        },
+        coords={OBJECT: _object_ids(exposure_data), EVENT: events},
+    )
+
+
 def hazard_setup(
     grid_like: xr.Dataset | None,
     hazard_data: dict[str, xr.DataArray],
@@ -21,6 +257,9 @@ def hazard_setup(
     return_periods: list[int] | None = None,
     risk: bool = False,
     unit: str = "m",
+    stack: bool = False,
+    time_dim: str = "time",
+    time_reduce: str = "max",
 ) -> xr.Dataset:
     """Read and transform hazard data.
 
@@ -38,6 +277,18 @@ def hazard_setup(
         Designate hazard files for risk analysis, by default False.
     unit : str, optional
         The unit which the hazard data is in, by default 'm'.
+    stack : bool, optional
+        Whether to stack the hazard data along an 'event' dimension in a single
+        variable (named after the `hazard_type`) instead of setting every map as a
+        separate variable. The stacked data is chunked per event, which is better
+        suited for large (stochastic) event sets. By default False.
+    time_dim : str, optional
+        The name of the time dimension of time-varying hazard data,
+        by default 'time'.
+    time_reduce : str, optional
+        The statistic used to reduce time-varying hazard data over the `time_dim`,
+        e.g. 'max' for the maximum depth. The reduction is done lazily per chunk.
+        By default 'max'.
 
     Returns
     -------
@@ -47,6 +298,8 @@ def hazard_setup(
     logger.info(f"Processing {hazard_type} hazard data")
     hazard_dataarrays = []
     for idx, (da_name, da) in enumerate(hazard_data.items()):
+        # Reduce time-varying data, nothing happens when there is no time dimension
+        da = _reduce_dataarray(da=da, dim=time_dim, method=time_reduce)
         da = _process_dataarray(da=da, da_name=da_name)
 
         # Check for unit
@@ -65,8 +318,19 @@ def hazard_setup(
         da = da.assign_attrs(attrs)
         hazard_dataarrays.append(da)
 
-    # Reproject to gridlike
-    ds = _merge_dataarrays(grid_like=grid_like, dataarrays=hazard_dataarrays)
+    # Reproject to gridlike, either as separate variables or stacked
+    if stack:
+        ds = _stack_dataarrays(
+            grid_like=grid_like,
+            dataarrays=hazard_dataarrays,
+            name=hazard_type,
+            dim=EVENT,
+        )
+        ds[hazard_type] = ds[hazard_type].assign_attrs({TYPE: hazard_type})
+        if risk:
+            ds = ds.assign_coords({RP: (EVENT, list(return_periods or []))})
+    else:
+        ds = _merge_dataarrays(grid_like=grid_like, dataarrays=hazard_dataarrays)
 
     attrs = {
         ANALYSIS: EVENT,
@@ -1,10 +1,16 @@
 """Workflow utilities."""
 
 import logging
+from collections.abc import Hashable
 
 import xarray as xr
 from hydromt.model.processes.grid import grid_from_rasterdataset
 
+from hydromt_fiat.gis.raster import conservative_regrid
+from hydromt_fiat.gis.raster_utils import grid_signature
+
+REDUCE_METHODS = ["max", "mean", "min", "sum"]
+
 logger = logging.getLogger(f"hydromt.{__name__}")
 
 
@@ -30,10 +36,44 @@ def _process_dataarray(
     return da
 
 
-def _merge_dataarrays(
+def _reduce_dataarray(
+    da: xr.DataArray,
+    dim: str,
+    method: str = "max",
+    chunksize: int = 100,
+) -> xr.DataArray:
+    # Nothing to reduce
+    if dim not in da.dims:
+        return da
+    if method not in REDUCE_METHODS:
+        raise ValueError(
+            f"Reduce method '{method}' not supported, choose from {REDUCE_METHODS}"
+        )
+    logger.info(f"Reducing '{da.name}' over the '{dim}' dimension using '{method}'")
+    # Chunk along the dimension (if not already chunked) to never load the
+    # full stack, the spatial chunks are sized by dask
+    if da.chunks is None:
+        chunks: dict[Hashable, int | str] = {item: "auto" for item in da.dims}
+        chunks[dim] = chunksize
+        da = da.chunk(chunks)
+    # Lazy (chunk-wise) reduction, ignoring the nodata
+    nodata = da.raster.nodata
+    if nodata is not None:
+        da = da.where(da != nodata)
+    kwargs = {"min_count": 1} if method == "sum" else {}
+    out = getattr(da, method)(dim=dim, skipna=True, keep_attrs=True, **kwargs)
+    # Cells without any valid value are nodata
+    if nodata is not None:
+        out = out.fillna(nodata)
+    out.raster.set_nodata(nodata)
+    return out
+
+
+def _regrid_dataarrays(
     grid_like: xr.Dataset | xr.DataArray | None,
     dataarrays: list[xr.DataArray],
-) -> xr.Dataset:
+    conservative: bool = False,
+) -> list[xr.DataArray]:
     if grid_like is None:
         logger.warning(
             "No known grid provided to reproject to, \
@@ -45,9 +85,39 @@ defaulting to first specified grid for transform and extent"
     if isinstance(grid_like, xr.DataArray):
         grid_like = grid_like.to_dataset()
 
-    # Reproject if necessary
+    # Reproject if necessary, i.e. only when the grids do not match
+    # A mask in the grid_like needs to be applied, therefore no reuse
+    signature = grid_signature(grid_like) if "mask" not in grid_like else None
+    xcoords, ycoords = grid_like.raster.xcoords, grid_like.raster.ycoords
+    reused = 0
     for idx, da in enumerate(dataarrays):
-        dataarrays[idx] = grid_from_rasterdataset(grid_like=grid_like, ds=da)
+        if grid_signature(da) == signature:
+            # Make sure the coordinates are identical for merging
+            dataarrays[idx] = da.assign_coords(
+                {xcoords.name: xcoords, ycoords.name: ycoords}
+            )
+            reused += 1
+            continue
+        if conservative:  # Conserve the totals, e.g. for exposure values
+            dataarrays[idx] = conservative_regrid(da=da, grid_like=grid_like)
+            continue
+        ds = grid_from_rasterdataset(grid_like=grid_like, ds=da)
+        dataarrays[idx] = ds[da.name]
+    logger.info(f"Reused {reused} out of {len(dataarrays)} grid(s) without regridding")
+    return dataarrays
+
+
+def _merge_dataarrays(
+    grid_like: xr.Dataset | xr.DataArray | None,
+    dataarrays: list[xr.DataArray],
+    conservative: bool = False,
+) -> xr.Dataset:
+    # Reproject if necessary
+    dataarrays = _regrid_dataarrays(
+        grid_like=grid_like,
+        dataarrays=dataarrays,
+        conservative=conservative,
+    )
 
     ds = xr.merge(dataarrays)
     ds.attrs = {}  # Ensure that the dataset doesnt copy a merged instance of
@@ -55,3 +125,29 @@ defaulting to first specified grid for transform and extent"
 
     # Return the data
     return ds
+
+
+def _stack_dataarrays(
+    grid_like: xr.Dataset | xr.DataArray | None,
+    dataarrays: list[xr.DataArray],
+    name: str,
+    dim: str,
+) -> xr.Dataset:
+    # Reproject if necessary
+    dataarrays = _regrid_dataarrays(grid_like=grid_like, dataarrays=dataarrays)
+
+    # Stack the data lazily along the new dimension, one chunk per entry
+    names = [str(da.name) for da in dataarrays]
+    da = xr.concat(
+        dataarrays,
+        dim=dim,
+        coords="minimal",
+        compat="override",
+        combine_attrs="drop",
+    )
+    da = da.assign_coords({dim: names}).chunk({dim: 1}).rename(name)
+    # Keep the nodata of the first entry
+    da.raster.set_nodata(dataarrays[0].raster.nodata)
+
+    # Return the data as a dataset
+    return da.to_dataset()
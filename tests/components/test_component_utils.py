@@ -1,5 +1,9 @@
 from pathlib import Path
 
+import geopandas as gpd
+import pandas as pd
+from shapely.geometry import Point
+
 from hydromt_fiat.components.utils import (
     _mount,
     _relpath,
@@ -8,6 +12,7 @@ from hydromt_fiat.components.utils import (
     make_config_paths_relative,
     pathing_config,
     pathing_expand,
+    read_vector,
 )
 
 
@@ -211,3 +216,26 @@ def test_pathing_config_none():
     out = pathing_config([None, None])
     # Assert the output
     assert out is None
+
+
+def test_read_vector(tmp_path: Path):
+    # Write a small vector file
+    gdf = gpd.GeoDataFrame(
+        {"a": [1, 2], "b": [3.0, 4.0]},
+        geometry=[Point(0, 0), Point(1, 1)],
+        crs=4326,
+    )
+    gdf.to_file(Path(tmp_path, "tmp.gpkg"))
+
+    # Call the function with a column selection
+    out = read_vector(Path(tmp_path, "tmp.gpkg"), columns=["b"])
+    # Assert the output
+    assert isinstance(out, gpd.GeoDataFrame)
+    assert out.columns.tolist() == ["b", "geometry"]
+
+    # Call the function without geometry
+    out = read_vector(Path(tmp_path, "tmp.gpkg"), columns=["a"], geometry=False)
+    # Assert the output
+    assert not isinstance(out, gpd.GeoDataFrame)
+    assert isinstance(out, pd.DataFrame)
+    assert out["a"].tolist() == [1, 2]
@@ -3,8 +3,11 @@ from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
 import geopandas as gpd
+import numpy as np
 import pytest
+import xarray as xr
 from hydromt.model import ModelRoot
+from shapely.geometry import Point, box
 
 from hydromt_fiat import FIATModel
 from hydromt_fiat.components import ExposureGeomsComponent
@@ -118,6 +121,84 @@ def test_exposure_geom_component_read_csv(
     assert "elevation" in component.data["foo"].columns
 
 
+def test_exposure_geom_component_read_csv_lazy(
+    tmp_path: Path,
+    mock_model_config: MagicMock,
+    exposure_vector_clipped_csv_path: Path,
+):
+    type(mock_model_config).root = PropertyMock(
+        side_effect=lambda: ModelRoot(tmp_path, mode="r"),
+    )
+    # Setup the component
+    component = ExposureGeomsComponent(model=mock_model_config)
+
+    # Calling read to read in the geometry and a selection of the columns
+    component.read(filename="{name}.fgb", columns=["elevation"], lazy=True)
+
+    # Assert the output
+    assert len(component.data["foo"]) == 12
+    assert sorted(component.data["foo"].columns) == [
+        "elevation",
+        "geometry",
+        "object_id",
+    ]
+
+    # Fetch a column from the csv file
+    component.fetch_columns("foo", columns=[f"{FN}_{DAMAGE}_structure"])
+
+    # Assert the output
+    assert f"{FN}_{DAMAGE}_structure" in component.data["foo"].columns
+    assert component.data["foo"][f"{FN}_{DAMAGE}_structure"].notna().all()
+
+
+def test_exposure_geom_component_read_lazy_write(
+    tmp_path: Path,
+    mock_model_config: MagicMock,
+    exposure_vector_clipped_csv_path: Path,
+):
+    type(mock_model_config).root = PropertyMock(
+        side_effect=lambda: ModelRoot(tmp_path, mode="r+"),
+    )
+    # Setup the component
+    component = ExposureGeomsComponent(model=mock_model_config)
+
+    # Read a selection of the columns and write it
+    component.read(filename="{name}.fgb", columns=["elevation"], lazy=True)
+    component.write("other/{name}.fgb")
+
+    # Assert the columns not read are written as well
+    gdf = gpd.read_file(Path(tmp_path, "other", "foo.fgb"))
+    assert f"{FN}_{DAMAGE}_structure" in gdf.columns
+    assert gdf[f"{FN}_{DAMAGE}_structure"].notna().all()
+    assert f"{FN}_{DAMAGE}_structure" in component.data["foo"].columns
+
+
+def test_exposure_geom_component_set_source(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    mock_model_config: MagicMock,
+    exposure_vector_clipped_csv_path: Path,
+):
+    caplog.set_level(logging.WARNING)
+    type(mock_model_config).root = PropertyMock(
+        side_effect=lambda: ModelRoot(tmp_path, mode="r"),
+    )
+    # Setup the component
+    component = ExposureGeomsComponent(model=mock_model_config)
+    component.read(filename="{name}.fgb", columns=["elevation"])
+
+    # Setting the same data keeps the source
+    component.set(component.data["foo"], name="foo")
+    assert "foo" in component._sources
+
+    # Replacing the data drops the source
+    component.set(component.data["foo"].iloc[::-1].copy(), name="foo")
+    assert "foo" not in component._sources
+    assert "'foo' was read with a column selection" in caplog.text
+    with pytest.raises(RuntimeError, match="No source file known for 'foo'"):
+        component.fetch_columns("foo", columns=[f"{FN}_{DAMAGE}_structure"])
+
+
 def test_exposure_geom_component_write(
     tmp_path: Path,
     mock_model_config: MagicMock,
@@ -385,3 +466,64 @@ def test_exposure_geom_component_update_cols(
     # Assert that the data is there
     assert "ref" in component.data["bag"].columns
     assert "method" in component.data["bag"].columns
+
+
+def test_exposure_geom_component_cell_index(
+    mock_model: MagicMock,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Setup the component
+    component = ExposureGeomsComponent(model=mock_model)
+    component.set(exposure_vector_clipped, name="buildings")
+
+    # Call the method
+    index = component.cell_index("buildings", grid=hazard_clipped)
+
+    # Assert the output, the data itself is untouched
+    assert index.dtype == np.int32
+    assert len(index) == len(exposure_vector_clipped)
+    assert list(component.data["buildings"].columns) == list(
+        exposure_vector_clipped.columns
+    )
+
+    # Assert that the stored index is reused for the same grid
+    assert component.cell_index("buildings", grid=hazard_clipped) is index
+
+    # Assert that a different grid invalidates the index
+    grid = hazard_clipped.isel(x=slice(1, None))
+    assert component.cell_index("buildings", grid=grid) is not index
+
+
+def test_exposure_geom_component_cell_index_edit(mock_model: MagicMock):
+    # Setup the component with some points
+    gdf = gpd.GeoDataFrame(
+        geometry=gpd.points_from_xy([0.5, 1.5], [0.5, 1.5]),
+        crs=28992,
+    )
+    grid = xr.DataArray(
+        data=np.zeros((2, 2)),
+        coords={"y": [1.5, 0.5], "x": [0.5, 1.5]},
+        dims=("y", "x"),
+    )
+    grid.raster.set_crs(28992)
+    component = ExposureGeomsComponent(model=mock_model)
+    component.set(gdf, name="buildings")
+    index = component.cell_index("buildings", grid=grid)
+    np.testing.assert_array_equal(index, [2, 1])
+
+    # Edit the geometry in place and set it back, the index is recomputed
+    gdf.loc[1, "geometry"] = Point(0.5, 1.5)
+    component.set(gdf, name="buildings")
+    index = component.cell_index("buildings", grid=grid)
+    np.testing.assert_array_equal(index, [2, 0])
+
+    # Set the same objects in reversed order, same length and bounds
+    component.set(gdf.iloc[::-1], name="buildings")
+    index = component.cell_index("buildings", grid=grid)
+    np.testing.assert_array_equal(index, [0, 2])
+
+    # Clip the data in place, the index is recomputed
+    component.clip(gpd.GeoDataFrame(geometry=[box(0, 1, 1, 2)], crs=28992), True)
+    index = component.cell_index("buildings", grid=grid)
+    np.testing.assert_array_equal(index, [0])
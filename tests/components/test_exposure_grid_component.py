@@ -1,6 +1,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
+import geopandas as gpd
 import pytest
 import xarray as xr
 from hydromt.model import ModelRoot
@@ -230,3 +231,32 @@ def test_exposure_grid_component_setup_errors(
             exposure_fnames="industrial_content",
             exposure_link_fname="",
         )
+
+
+def test_exposure_grid_component_setup_from_geoms(
+    model: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Set the data in the model
+    model.exposure_geoms.set(exposure_vector_clipped, name="buildings")
+    model.hazard.set(hazard_clipped)
+
+    # Call the method
+    model.exposure_grid.setup_from_geoms("buildings")
+
+    # Assert the output
+    assert len(model.exposure_grid.data.data_vars) != 0
+    assert model.exposure_grid.data.raster.identical_grid(hazard_clipped)
+    assert model.config.get(MODEL_TYPE) == GRID
+
+
+def test_exposure_grid_component_setup_from_geoms_errors(
+    model: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    model.exposure_geoms.set(exposure_vector_clipped, name="buildings")
+
+    # Assert the error without a grid to rasterize to
+    with pytest.raises(RuntimeError, match="Exposure or hazard grid data is required"):
+        model.exposure_grid.setup_from_geoms("buildings")
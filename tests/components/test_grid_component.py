@@ -272,3 +272,27 @@ def test_grid_component_set_errors(
         match="Wrong input data type: 'int'",
     ):
         component.set(2)
+
+
+def test_grid_component_set_orientation(
+    mock_model: MagicMock,
+    exposure_grid_clipped: xr.Dataset,
+):
+    # Set up the component
+    component = GridComponent(model=mock_model)
+    # Set south-north oriented data
+    component.set(exposure_grid_clipped.raster.flipud())
+
+    # Assert the state, nothing flipped yet, only recorded
+    assert not component._ns
+    assert component.data.raster.res[1] > 0
+
+    # Force the orientation
+    component._force_ns()
+    # Assert the state
+    assert component._ns
+    assert component.data.raster.res[1] < 0
+    # Calling it again does nothing
+    id_before = id(component.data)
+    component._force_ns()
+    assert id_before == id(component.data)
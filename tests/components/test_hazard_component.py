@@ -2,6 +2,7 @@ import logging
 from pathlib import Path
 from unittest.mock import MagicMock, PropertyMock
 
+import geopandas as gpd
 import pytest
 import xarray as xr
 from hydromt.model import ModelRoot
@@ -12,13 +13,16 @@ from hydromt_fiat import FIATModel
 from hydromt_fiat.components import HazardComponent
 from hydromt_fiat.errors import MissingRegionError
 from hydromt_fiat.utils import (
+    EVENT,
     HAZARD,
     HAZARD_FILE,
     HAZARD_RP,
     HAZARD_SETTINGS,
     MODEL_RISK,
+    RP,
     VAR_AS_BAND,
 )
+from hydromt_fiat.workflows import hazard_sample
 
 
 def test_hazard_component_empty(
@@ -182,6 +186,35 @@ def test_hazard_component_setup_risk(
     assert model_with_region.config.get(HAZARD_RP) == [50000]
 
 
+def test_hazard_component_setup_stack_twice(
+    model_with_region: FIATModel,
+):
+    # Setup the component
+    component = HazardComponent(model=model_with_region)
+
+    # Set up stacked hazard data twice, with different events
+    component.setup(
+        hazard_fnames=["flood_event", "flood_event_highres"],
+        risk=True,
+        return_periods=[10, 100],
+        stack=True,
+        expand=False,
+    )
+    component.setup(
+        hazard_fnames=["flood_event_highres"],
+        risk=True,
+        return_periods=[50],
+        stack=True,
+        expand=False,
+    )
+
+    # Assert the state, only the events of the second call are there
+    da = component.data["water_depth"]
+    assert da[EVENT].values.tolist() == ["flood_event_highres"]
+    assert da[RP].values.tolist() == [50]
+    assert da.notnull().any()
+
+
 def test_hazard_component_setup_errors(model: FIATModel):
     # Setup the component
     component = HazardComponent(model=model)
@@ -206,3 +239,27 @@ def test_hazard_component_setup_errors(model: FIATModel):
         match=("Region component is missing for setting up hazard data."),
     ):
         component.setup(hazard_fnames=["flood_event"])
+
+
+def test_hazard_component_sample(
+    model: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Set the data in the model
+    model.exposure_geoms.set(exposure_vector_clipped, name="buildings")
+    model.hazard.set(hazard_clipped)
+
+    # Call the method
+    da = model.hazard.sample("buildings")
+
+    # Assert the output, the cell index is stored and results are the same
+    assert "buildings" in model.exposure_geoms._cell_indices
+    ref = hazard_sample(hazard_clipped, exposure_data=exposure_vector_clipped)
+    xr.testing.assert_equal(da, ref)
+
+
+def test_hazard_component_sample_errors(model: FIATModel):
+    # Assert the error without hazard data
+    with pytest.raises(RuntimeError, match="No hazard data set, run `setup` first"):
+        model.hazard.sample("buildings")
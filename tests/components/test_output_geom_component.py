@@ -10,6 +10,7 @@ from hydromt.model import ModelRoot
 
 from hydromt_fiat import FIATModel
 from hydromt_fiat.components import OutputGeomsComponent
+from hydromt_fiat.utils import GEOMETRY, OBJECT__ID, SQUARE__ID
 
 
 def test_output_geom_component_empty(mock_model: MagicMock):
@@ -179,6 +180,67 @@ def test_output_geom_component_read_sig(
     assert len(component.data["buildings"]) == 12
 
 
+def test_output_geom_component_read_lazy(
+    mock_model_config: MagicMock,
+    model_data_clipped_path: Path,
+):
+    type(mock_model_config).root = PropertyMock(
+        side_effect=lambda: ModelRoot(model_data_clipped_path, mode="r"),
+    )
+    # Set up the component
+    component = OutputGeomsComponent(model=mock_model_config)
+
+    # Read only the geometry and the object identifier
+    component.read(filename="exposure/buildings.fgb", lazy=True)
+
+    # Assert the state after
+    assert len(component.data) == 1
+    assert component.data["buildings"].columns.tolist() == [OBJECT__ID, GEOMETRY]
+    assert len(component.data["buildings"]) == 12
+
+    # Fetch a column on demand
+    gdf = component.fetch_columns("buildings", columns="elevation")
+
+    # Assert the output
+    assert id(gdf) == id(component.data["buildings"])
+    assert "elevation" in gdf.columns
+    assert gdf["elevation"].notna().all()
+
+
+def test_output_geom_component_read_columns(
+    mock_model_config: MagicMock,
+    model_data_clipped_path: Path,
+):
+    type(mock_model_config).root = PropertyMock(
+        side_effect=lambda: ModelRoot(model_data_clipped_path, mode="r"),
+    )
+    # Set up the component
+    component = OutputGeomsComponent(model=mock_model_config)
+
+    # Read a selection of the columns
+    component.read(filename="exposure/buildings.fgb", columns=[OBJECT__ID])
+
+    # Assert the state after
+    assert component.data["buildings"].columns.tolist() == [OBJECT__ID, GEOMETRY]
+
+    # Fetch a column that isn't there
+    with pytest.raises(ValueError, match="not found in the 'buildings' source"):
+        component.fetch_columns("buildings", columns=["foo"])
+
+
+def test_output_geom_component_fetch_columns_errors(
+    mock_model_config: MagicMock,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    # Set up the component
+    component = OutputGeomsComponent(model=mock_model_config)
+    component.set(exposure_vector_clipped[[GEOMETRY]], name="buildings")
+
+    # Fetch without a known source
+    with pytest.raises(RuntimeError, match="No source file known for 'buildings'"):
+        component.fetch_columns("buildings", columns=["foo"])
+
+
 def test_output_geom_component_write(
     tmp_path: Path,
     mock_model_config: MagicMock,
@@ -277,6 +339,43 @@ def test_output_geom_component_spatial_aggregate(
     )
 
 
+def test_output_geom_component_spatial_stream_aggregate(
+    tmp_path: Path,
+    model_with_region: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Set up the component
+    component = OutputGeomsComponent(model=model_with_region)
+    # Write the output data
+    p = Path(tmp_path, "foo.gpkg")
+    exposure_vector_clipped.to_file(p)
+
+    # Call the method
+    component.spatial_stream_aggregate(
+        output_fname=p,
+        aggregation_areas_fname=vector_grid,
+        batch_size=5,
+    )
+
+    # Assert the output, same as the in memory aggregation
+    assert "foo_sp_aggr" in component.processed_data
+    data = component.processed_data["foo_sp_aggr"]
+    assert len(data) == 20
+    np.testing.assert_almost_equal(
+        data["max_damage_content"].iloc[0],
+        desired=155730,
+        decimal=0,
+    )
+
+    # Assert the error for a missing file
+    with pytest.raises(FileNotFoundError, match="bar.gpkg"):
+        component.spatial_stream_aggregate(
+            output_fname=Path(tmp_path, "bar.gpkg"),
+            aggregation_areas_fname=vector_grid,
+        )
+
+
 def test_output_geom_component_spatial_square_aggregate(
     model_with_region: FIATModel,
     exposure_vector_clipped: gpd.GeoDataFrame,
@@ -292,6 +391,7 @@ def test_output_geom_component_spatial_square_aggregate(
         output_name="foo",
         res=0.1,
         unit="km",
+        keep_empty=True,
     )
 
     # Assert the output
@@ -325,6 +425,7 @@ def test_output_geom_component_spatial_square_aggregate_no_clip(
         output_name="foo",
         res=0.1,
         unit="km",
+        keep_empty=True,
     )
 
     # Assert the output
@@ -341,3 +442,76 @@ def test_output_geom_component_spatial_square_aggregate_no_clip(
         desired=796843,
         decimal=0,
     )
+
+
+def test_output_geom_component_spatial_square_aggregate_occupied(
+    model: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    # Set up the component
+    component = OutputGeomsComponent(model=model)
+
+    # Set data like a dummy
+    component._data = {"foo": exposure_vector_clipped}
+
+    # Call the method, by default only keeping the occupied cells
+    component.spatial_square_aggregate(
+        output_name="foo",
+        res=0.1,
+        unit="km",
+    )
+    component.spatial_square_aggregate(
+        output_name="foo",
+        res=0.1,
+        unit="km",
+        keep_empty=True,
+        name="full",
+    )
+
+    # Assert the output, the occupied cells of the full grid
+    data = component.processed_data["foo_sq_aggr"]
+    full = component.processed_data["full"]
+    occupied = full[full["max_damage_content"].notna()]
+    assert len(full) == 20
+    assert len(data) == len(occupied)
+    assert SQUARE__ID in data.columns
+    np.testing.assert_array_equal(data[SQUARE__ID], occupied[SQUARE__ID])
+    assert data["max_damage_content"].notna().all()
+    np.testing.assert_almost_equal(
+        np.mean(data["max_damage_content"]),
+        desired=796843,
+        decimal=0,
+    )
+
+
+def test_output_geom_component_spatial_multi_aggregate(
+    model_with_region: FIATModel,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Set up the component
+    component = OutputGeomsComponent(model=model_with_region)
+
+    # Set data like a dummy
+    component._data = {"foo": exposure_vector_clipped}
+
+    # Call the method
+    component.spatial_multi_aggregate(
+        output_name="foo",
+        aggregation_areas_fnames={
+            "grid": vector_grid,
+            "region": model_with_region.region,
+        },
+        methods=["mean", "max"],
+    )
+
+    # Assert the output
+    assert "foo_grid_sp_aggr" in component.processed_data
+    assert "foo_region_sp_aggr" in component.processed_data
+    data = component.processed_data["foo_grid_sp_aggr"]
+    assert len(data) == 20
+    np.testing.assert_almost_equal(
+        np.nanmean(data["max_damage_content_mean"]),
+        desired=796843,
+        decimal=0,
+    )
@@ -1,10 +1,19 @@
+import hashlib
 import json
+import re
 import tarfile
+import threading
 import zipfile
+from collections.abc import Generator
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 import pytest
+import urllib3
+from minio import Minio
 
+from hydromt_fiat.data import get
 from hydromt_fiat.data.get import LIB_DATA_DIR
 
 
@@ -56,9 +65,115 @@ def tmp_zipfile(
     return p
 
 
+@pytest.fixture
+def tmp_mirror(
+    tmp_path: Path,
+    tmp_tarfile: Path,
+) -> Path:
+    p = Path(tmp_path, "mirror")
+    Path(p, "foo", "v1").mkdir(parents=True)
+    data = tmp_tarfile.read_bytes()
+    Path(p, "foo", "v1", "foo.tar.gz").write_bytes(data)
+    registry = {
+        "foo.tar.gz": {
+            "path": "foo",
+            "version": "v1",
+            "hash": hashlib.md5(data).hexdigest(),
+        }
+    }
+    with open(Path(p, "registry.json"), "w") as writer:
+        json.dump(registry, writer)
+    return p
+
+
 # Data
 @pytest.fixture(scope="session")
 def registry() -> dict[str, dict[str, str]]:
     with open(Path(LIB_DATA_DIR, "registry.json"), "r") as reader:
         data = json.loads(reader.read())
     return data
+
+
+## Local S3 stand-in
+class S3StandIn:
+    """State of the local S3 stand-in server."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.etag = hashlib.md5(data).hexdigest()
+        self.ranges: list[str] = []  # The received range requests
+        self.fail: set[str] = set()  # Ranges to fail (once)
+        self.access_keys: list[str | None] = []  # The access key per request
+        self.endpoint: str = ""
+
+
+@pytest.fixture
+def s3_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[S3StandIn, None, None]:
+    state = S3StandIn(bytes(range(256)) * 1000)
+
+    class Handler(BaseHTTPRequestHandler):
+        def _credentials(self):
+            auth = re.search(
+                r"Credential=([^/]+)/", self.headers.get("Authorization", "")
+            )
+            state.access_keys.append(auth.group(1) if auth else None)
+
+        def _headers(self, status: int, length: int):
+            self.send_response(status)
+            self.send_header("ETag", f'"{state.etag}"')
+            self.send_header("Content-Length", str(length))
+            self.send_header("Last-Modified", formatdate(usegmt=True))
+            self.send_header("Content-Type", "application/octet-stream")
+            self.end_headers()
+
+        def do_HEAD(self):
+            self._credentials()
+            self._headers(200, len(state.data))
+
+        def do_GET(self):
+            self._credentials()
+            if self.path.endswith("?location="):
+                body = b"<LocationConstraint>eu-west-1</LocationConstraint>"
+                self._headers(200, len(body))
+                self.wfile.write(body)
+                return
+            rng = self.headers.get("Range")
+            if rng is None:
+                self._headers(200, len(state.data))
+                self.wfile.write(state.data)
+                return
+            if rng in state.fail:
+                state.fail.remove(rng)
+                self.send_error(503)
+                return
+            state.ranges.append(rng)
+            start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", rng).groups())
+            body = state.data[start : end + 1]
+            self._headers(206, len(body))
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state.endpoint = f"127.0.0.1:{server.server_port}"
+    client = Minio(
+        endpoint=state.endpoint,
+        access_key="foo",
+        secret_key="bar",
+        http_client=urllib3.PoolManager(retries=False),
+        secure=False,
+        region="eu-west-1",
+    )
+    # Only the default client is replaced, mirrors get their own
+    get_client = get.get_client
+    monkeypatch.setattr(
+        get, "get_client", lambda *args: get_client(*args) if args else client
+    )
+    yield state
+    server.shutdown()
+    server.server_close()
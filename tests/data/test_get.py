@@ -1,21 +1,32 @@
+import logging
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 import requests
+from minio import Minio
+from minio.error import MinioException
+from pytest_mock import MockerFixture
 
-from hydromt_fiat.data import fetch_data
+from hydromt_fiat.data import fetch_data, get
 from hydromt_fiat.data.get import (
     BUCKET,
-    CLIENT,
+    MIRRORS_ENV,
     assert_remote_hash,
     check_local_hash,
     download,
+    fetch_file,
+    get_client,
     get_entry,
+    get_mirrors,
     get_registry,
+    select_mirrors,
+    write_stamp,
 )
 from hydromt_fiat.utils import PATH, VERSION
 from tests.conftest import CACHE_DIR, check_connection
+from tests.data.conftest import S3StandIn
 
 
 def test_get_registry_local():
@@ -37,6 +48,42 @@ def test_get_registry_remote():
     assert "fiat-model.tar.gz" in db
 
 
+def test_get_registry_mirror(tmp_mirror: Path):
+    # Call the function with a local mirror
+    db = get_registry(local=False, mirrors=[tmp_mirror.as_posix()])
+    # Assert the output
+    assert list(db) == ["foo.tar.gz"]
+
+    # Call the function with a file url to the registry itself
+    db = get_registry(local=False, mirrors=Path(tmp_mirror, "registry.json").as_uri())
+    # Assert the output
+    assert list(db) == ["foo.tar.gz"]
+
+
+def test_get_mirrors(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(MIRRORS_ENV, "/data/mirror, s3://minio.local:9000")
+    # Call the function
+    mirrors = get_mirrors("file:///other/mirror")
+
+    # Assert the output, the given ones take precedence
+    assert mirrors == [
+        "file:///other/mirror",
+        "/data/mirror",
+        "s3://minio.local:9000",
+    ]
+
+
+def test_select_mirrors(tmp_path: Path, tmp_mirror: Path):
+    # Call the function
+    mirrors = select_mirrors(
+        "foo/v1/foo.tar.gz",
+        [tmp_path.as_posix(), tmp_mirror.as_uri()],
+    )
+
+    # Assert the output, the unreachable one is left out
+    assert mirrors == [tmp_mirror.as_uri(), "s3://s3.deltares.nl"]
+
+
 def test_get_entry(
     registry: dict[str, dict[str, str]],
 ):
@@ -75,7 +122,7 @@ def test_assert_remote_hash(registry: dict[str, dict[str, str]]):
     file = "global-data.tar.gz"
     entry = registry[file]
     # Get the stats from the bucket
-    stat = CLIENT.stat_object(
+    stat = get_client().stat_object(
         BUCKET,
         Path(entry[PATH], entry[VERSION], file).as_posix(),
     )
@@ -89,7 +136,7 @@ def test_assert_remote_hash_errors(registry: dict[str, dict[str, str]]):
     file = "global-data.tar.gz"
     entry = registry[file]
     # Get the stats from the bucket
-    stat = CLIENT.stat_object(
+    stat = get_client().stat_object(
         BUCKET,
         Path(entry[PATH], entry[VERSION], file).as_posix(),
     )
@@ -125,6 +172,40 @@ def test_check_local_hash_unequal(
     assert not tmp_tarfile.exists()
 
 
+def test_check_local_hash_stamp(
+    mocker: MockerFixture,
+    tmp_txt: Path,
+):
+    file_hash = mocker.spy(get, "file_hash")
+    # Call the function without a stamp
+    f = check_local_hash(file=tmp_txt, hash="8b4f6e2b9c4f3ddb2e5fa4a8fa0b2d11")
+
+    # Assert the output, not equal so removed
+    assert not f
+    assert not tmp_txt.exists()
+    assert file_hash.call_count == 1
+
+    # Write a file with a stamp
+    tmp_txt.write_text("Spooky ghost!")
+    write_stamp(tmp_txt, hash="foo")
+
+    # Call the function, the stamp is valid
+    f = check_local_hash(file=tmp_txt, hash="foo")
+
+    # Assert the output, no hashing needed
+    assert f
+    assert file_hash.call_count == 1
+
+    # Change the file, the stamp becomes stale
+    tmp_txt.write_text("Spooky ghost!!")
+    f = check_local_hash(file=tmp_txt, hash="foo")
+
+    # Assert the output
+    assert not f
+    assert file_hash.call_count == 2
+    assert not Path(tmp_txt.parent, "tmp.txt.stamp").exists()
+
+
 def test_check_local_hash_not_exist(tmp_path: Path):
     # Call the function on a file that doesnt exist
     f = check_local_hash(
@@ -152,6 +233,185 @@ def test_download(
     assert p.is_file()
 
 
+def test_download_ranged(
+    tmp_path: Path,
+    s3_server: S3StandIn,
+):
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # Call the function
+    digest = download(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        part_size=100000,
+    )
+
+    # Assert the output
+    assert digest == s3_server.etag
+    assert p.read_bytes() == s3_server.data
+    assert len(s3_server.ranges) == 3
+    assert Path(tmp_path, "foo.tar.gz.stamp").is_file()
+    assert not Path(tmp_path, "foo.tar.gz.part").exists()
+    assert not Path(tmp_path, "foo.tar.gz.part.json").exists()
+
+
+def test_download_ranged_many(
+    tmp_path: Path,
+    s3_server: S3StandIn,
+):
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # Call the function, many small parts finishing out of order
+    digest = download(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        part_size=1000,
+        max_workers=8,
+    )
+
+    # Assert the output, the hash is computed over the parts in order
+    assert digest == s3_server.etag
+    assert len(s3_server.ranges) == 256
+
+
+def test_download_no_size(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    s3_server: S3StandIn,
+):
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # The server does not report the size
+    stat_object = Minio.stat_object
+
+    def _stat_object(self, *args, **kwargs):
+        stat = stat_object(self, *args, **kwargs)
+        return SimpleNamespace(etag=stat.etag, size=None)
+
+    mocker.patch.object(Minio, "stat_object", _stat_object)
+    # Call the function
+    digest = download(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        part_size=100000,
+    )
+
+    # Assert the output, downloaded in a single request
+    assert digest == s3_server.etag
+    assert p.read_bytes() == s3_server.data
+    assert len(s3_server.ranges) == 0
+    assert Path(tmp_path, "foo.tar.gz.stamp").is_file()
+    assert not Path(tmp_path, "foo.tar.gz.part").exists()
+
+
+def test_download_resume(
+    tmp_path: Path,
+    s3_server: S3StandIn,
+):
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # Let the last part fail
+    s3_server.fail.add("bytes=200000-255999")
+    with pytest.raises(MinioException, match="503"):
+        download(
+            file="foo.tar.gz",
+            entry=entry,
+            write_path=p,
+            part_size=100000,
+            max_workers=1,
+        )
+
+    # Assert the partial state
+    assert not p.exists()
+    assert Path(tmp_path, "foo.tar.gz.part").stat().st_size == len(s3_server.data)
+    assert Path(tmp_path, "foo.tar.gz.part.json").is_file()
+    assert len(s3_server.ranges) == 2
+
+    # Call the function again, only the remaining part is downloaded
+    digest = download(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        part_size=100000,
+    )
+
+    # Assert the output, the hash includes the resumed parts
+    assert digest == s3_server.etag
+    assert p.read_bytes() == s3_server.data
+    assert s3_server.ranges[-1] == "bytes=200000-255999"
+    assert len(s3_server.ranges) == 3
+    assert not Path(tmp_path, "foo.tar.gz.part.json").exists()
+
+
+def test_fetch_file_fallback(
+    tmp_path: Path,
+    tmp_mirror: Path,
+    s3_server: S3StandIn,
+):
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # Call the function, the local mirror has a different file
+    digest = fetch_file(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        mirrors=[tmp_mirror.as_posix(), f"s3+http://{s3_server.endpoint}"],
+    )
+
+    # Assert the output, fetched from the S3 mirror (anonymously)
+    assert digest == s3_server.etag
+    assert p.read_bytes() == s3_server.data
+    assert not Path(tmp_path, "foo.tar.gz.part").exists()
+    assert set(s3_server.access_keys) == {None}
+
+
+def test_fetch_file_credentials(
+    tmp_path: Path,
+    s3_server: S3StandIn,
+    caplog: pytest.LogCaptureFixture,
+):
+    caplog.set_level(logging.INFO)
+    p = Path(tmp_path, "foo.tar.gz")
+    entry = {"path": "foo", "version": "v1", "hash": s3_server.etag}
+    # Call the function with a mirror with its own credentials
+    fetch_file(
+        file="foo.tar.gz",
+        entry=entry,
+        write_path=p,
+        mirrors=f"s3+http://mirror-key:mirror%2Fsecret@{s3_server.endpoint}",
+    )
+
+    # Assert only the credentials of the mirror were used, not the bundled ones
+    assert p.read_bytes() == s3_server.data
+    assert set(s3_server.access_keys) == {"mirror-key"}
+    assert "mirror%2Fsecret" not in caplog.text
+
+
+def test_fetch_data_mirror(
+    tmp_path: Path,
+    tmp_mirror: Path,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv(MIRRORS_ENV, tmp_mirror.as_posix())
+    spy = mocker.spy(get, "get_client")
+    # Call the function, everything from the mirror
+    path = fetch_data(
+        name="foo",
+        local_registry=False,
+        cache_dir=Path(tmp_path, "cache"),
+    )
+
+    # Assert the output
+    assert spy.call_count == 0
+    assert path == Path(tmp_path, "cache", "foo")
+    assert Path(path, "tmp.txt").is_file()
+    assert Path(tmp_path, "cache", "foo.tar.gz.stamp").is_file()
+
+
 @check_connection()
 def test_fetch_data():
     # Call the function in it's default state
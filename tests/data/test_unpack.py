@@ -1,9 +1,13 @@
+import json
 import tarfile
 import zipfile
+import zlib
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
+from hydromt_fiat.data import unpack
 from hydromt_fiat.data.unpack import _is_archive, untar, unzip
 
 
@@ -38,6 +42,70 @@ def test_untar(tmp_path: Path, tmp_tarfile: Path):
     assert Path(p, "tmp.json").is_file()
 
 
+def test_untar_members(tmp_path: Path, tmp_tarfile: Path, mocker: MockerFixture):
+    p = Path(tmp_path, "untar")
+    # Call the function, only the text file
+    untar(tmp_tarfile, output_dir=p, members="*.txt")
+    # Assert the output, the manifest holds all files
+    assert Path(p, "tmp.txt").is_file()
+    assert not Path(p, "tmp.json").is_file()
+    with open(Path(p, f".{tmp_tarfile.name}.manifest.json")) as reader:
+        manifest = json.load(reader)
+    assert sorted(manifest["members"]) == ["tmp.json", "tmp.txt"]
+
+    # The same selection is known to be unpacked, without reading the archive
+    spy = mocker.spy(tarfile.TarFile, "getmembers")
+    untar(tmp_tarfile, output_dir=p, members="*.txt")
+    assert spy.call_count == 0
+
+    # The rest is extracted when asked for
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 1
+    assert Path(p, "tmp.json").is_file()
+
+
+def test_untar_unpacked(tmp_path: Path, tmp_tarfile: Path, mocker: MockerFixture):
+    p = Path(tmp_path, "untar")
+    untar(tmp_tarfile, output_dir=p)
+    spy = mocker.spy(tarfile.TarFile, "getmembers")
+    # Call the function again, the archive is not read
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 0
+
+    # A file is missing, extract again
+    Path(p, "tmp.txt").unlink()
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 1
+    assert Path(p, "tmp.txt").is_file()
+
+    # A file has changed, but kept its size
+    data = Path(p, "tmp.txt").read_bytes()
+    Path(p, "tmp.txt").write_bytes(bytes([data[0] ^ 1]) + data[1:])
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 2
+    assert Path(p, "tmp.txt").read_bytes() == data
+
+
+def test_untar_unpacked_stamp(
+    tmp_path: Path,
+    tmp_tarfile: Path,
+    mocker: MockerFixture,
+):
+    p = Path(tmp_path, "untar")
+    untar(tmp_tarfile, output_dir=p)
+    spy = mocker.spy(unpack, "_crc32")
+    # Call the function again, the files are not checksummed
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 0
+
+    # Only the file with a new modification time is checksummed
+    path = Path(p, "tmp.txt")
+    path.touch()
+    untar(tmp_tarfile, output_dir=p)
+    assert spy.call_count == 1
+    assert spy.call_args.args[0] == path
+
+
 def test_untar_errors(tmp_json):
     # This is not a valid tarfile
     with pytest.raises(
@@ -56,6 +124,61 @@ def test_unzip(tmp_path: Path, tmp_zipfile: Path):
     assert Path(p, "tmp.json").is_file()
 
 
+def test_unzip_members(tmp_path: Path, tmp_zipfile: Path):
+    p = Path(tmp_path, "unzip")
+    # Call the function, only the json file
+    unzip(tmp_zipfile, output_dir=p, members=["*.json"])
+    # Assert the output
+    assert Path(p, "tmp.json").is_file()
+    assert not Path(p, "tmp.txt").is_file()
+    with open(Path(p, f".{tmp_zipfile.name}.manifest.json")) as reader:
+        manifest = json.load(reader)
+    entry = manifest["members"]["tmp.json"]
+    assert entry["size"] == Path(p, "tmp.json").stat().st_size
+    assert entry["crc"] == zlib.crc32(Path(p, "tmp.json").read_bytes())
+    assert entry["mtime_ns"] == Path(p, "tmp.json").stat().st_mtime_ns
+
+
+def test_unzip_unpacked(tmp_path: Path, tmp_zipfile: Path, mocker: MockerFixture):
+    p = Path(tmp_path, "unzip")
+    unzip(tmp_zipfile, output_dir=p, max_workers=2)
+    spy = mocker.spy(zipfile.ZipFile, "open")
+    # Call the function again, nothing to extract
+    unzip(tmp_zipfile, output_dir=p)
+    assert spy.call_count == 0
+
+    # A file has changed, extract again
+    with open(Path(p, "tmp.txt"), "a") as writer:
+        writer.write("foo")
+    unzip(tmp_zipfile, output_dir=p)
+    assert spy.call_count == 2
+
+    # A file has changed, but kept its size
+    data = Path(p, "tmp.txt").read_bytes()
+    Path(p, "tmp.txt").write_bytes(bytes([data[0] ^ 1]) + data[1:])
+    unzip(tmp_zipfile, output_dir=p)
+    assert spy.call_count == 4
+    assert Path(p, "tmp.txt").read_bytes() == data
+
+
+def test_unzip_directories(tmp_path: Path):
+    # Multiple members in new (nested) directories
+    file = Path(tmp_path, "nested.zip")
+    with zipfile.ZipFile(file, mode="w") as archive:
+        for idx in range(8):
+            archive.writestr(f"foo/bar/{idx}.txt", f"Spooky {idx}")
+        archive.writestr("../escape.txt", "Boo!")
+    p = Path(tmp_path, "unzip")
+
+    # Call the function
+    unzip(file, output_dir=p, max_workers=4)
+
+    # Assert the output
+    assert Path(p, "foo", "bar", "7.txt").read_text() == "Spooky 7"
+    assert Path(p, "escape.txt").is_file()
+    assert not Path(tmp_path, "escape.txt").exists()
+
+
 def test_unzip_errors(tmp_json):
     # This is not a valid zipfile
     with pytest.raises(
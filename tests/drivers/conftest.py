@@ -0,0 +1,76 @@
+import json
+import threading
+from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import osmnx as ox
+import pytest
+
+from hydromt_fiat.drivers import osm_driver
+
+# Two buildings, one on the border of two tiles and one further away
+OVERPASS_ELEMENTS = {
+    "elements": [
+        {"type": "node", "id": 1, "lat": 0.04, "lon": 0.04},
+        {"type": "node", "id": 2, "lat": 0.04, "lon": 0.06},
+        {"type": "node", "id": 3, "lat": 0.045, "lon": 0.06},
+        {"type": "node", "id": 4, "lat": 0.01, "lon": 0.01},
+        {"type": "node", "id": 5, "lat": 0.01, "lon": 0.011},
+        {"type": "node", "id": 6, "lat": 0.011, "lon": 0.011},
+        {
+            "type": "way",
+            "id": 10,
+            "nodes": [1, 2, 3, 1],
+            "tags": {"building": "yes"},
+        },
+        {
+            "type": "way",
+            "id": 11,
+            "nodes": [4, 5, 6, 4],
+            "tags": {"building": "house"},
+        },
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def osm_cache_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Keep the cached results per test
+    monkeypatch.setattr(
+        osm_driver, "OSM_RESULT_CACHE_DIR", Path(tmp_path, "osm_results")
+    )
+    monkeypatch.setattr(osm_driver, "OSM_TILE_CACHE_DIR", Path(tmp_path, "osm_tiles"))
+
+
+@pytest.fixture
+def overpass_server(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[list[bytes], None, None]:
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            requests.append(self.rfile.read(int(self.headers["Content-Length"])))
+            body = json.dumps(OVERPASS_ELEMENTS).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # Point osmnx to the local server
+    monkeypatch.setattr(
+        ox.settings, "overpass_url", f"http://127.0.0.1:{server.server_port}/api"
+    )
+    monkeypatch.setattr(ox.settings, "overpass_rate_limit", False)
+    monkeypatch.setattr(ox.settings, "use_cache", False)
+    yield requests
+    server.shutdown()
+    server.server_close()
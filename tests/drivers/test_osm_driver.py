@@ -1,21 +1,26 @@
 import logging
+import os
 import re
+import time
 from pathlib import Path
 
 import geopandas as gpd
-import osmnx as ox
+import numpy as np
 import pandas as pd
 import pytest
+import shapely
 from hydromt import DataCatalog
 from hydromt.data_catalog.sources import GeoDataFrameSource
 from osmnx._errors import InsufficientResponseError
 from pytest_mock import MockerFixture
+from shapely.geometry import GeometryCollection, LineString, Point, box
 
 from hydromt_fiat.drivers import OSMDriver, osm_driver
-from hydromt_fiat.drivers.osm_driver import osm_request
+from hydromt_fiat.drivers.osm_driver import _geometry_parts, osm_request
 from tests.conftest import CACHE_DIR
 
-ox.settings.cache_folder = CACHE_DIR / "osmnx"
+# Configure OSMnx for the package first, then redirect its cache
+osm_driver._osmnx().settings.cache_folder = CACHE_DIR / "osmnx"
 
 
 @pytest.mark.parametrize("tag_name", ["building", "highway", "landuse", "amenity"])
@@ -91,7 +96,7 @@ def test_osm_reqeust_empty(
     tags = {"building": True}
     caplog.set_level(logging.WARNING)
     mocker.patch(
-        "hydromt_fiat.drivers.osm_driver.ox.features.features_from_polygon",
+        "osmnx.features.features_from_polygon",
         returns=gpd.GeoDataFrame(),
     )
     osm_data = osm_request(build_region.geometry[0], tags=tags, geom_type=geom_type)
@@ -99,6 +104,169 @@ def test_osm_reqeust_empty(
     assert "No ['building'] features found for polygon" in caplog.text
 
 
+def test_osm_request_tiled(
+    overpass_server: list[bytes],
+):
+    polygon = box(0.02, 0.02, 0.08, 0.045)
+    # Call the function
+    osm_data = osm_request(
+        polygon=polygon,
+        tags={"building": True},
+        geom_type=["Polygon"],
+        tile_size=0.05,
+        max_workers=2,
+    )
+
+    # Assert the output, the building on the tile border only once
+    assert len(overpass_server) == 2  # Two tiles
+    assert len(osm_data) == 1
+    assert osm_data.columns.to_list() == ["building", "geometry"]
+    assert osm_data["building"].iloc[0] == "yes"
+    assert len(list(osm_driver.OSM_TILE_CACHE_DIR.glob("*.parquet"))) == 2
+
+    # Call again for a different region, the overlapping tile is cached
+    osm_data = osm_request(
+        polygon=box(0.0, 0.0, 0.03, 0.03),
+        tags={"building": True},
+        geom_type=["Polygon"],
+        tile_size=0.05,
+    )
+
+    # Assert the output
+    assert len(overpass_server) == 2
+    assert len(osm_data) == 1
+    assert osm_data["building"].iloc[0] == "house"
+
+
+def test_osm_request_tiled_empty(
+    caplog: pytest.LogCaptureFixture,
+    overpass_server: list[bytes],
+):
+    caplog.set_level(logging.ERROR)
+    # Call the function on a tile without features, same error as a single request
+    with pytest.raises(
+        InsufficientResponseError,
+        match="No matching features. Check query location, tags, and log.",
+    ):
+        osm_request(
+            polygon=box(1.01, 1.01, 1.02, 1.02),
+            tags={"building": True},
+            tile_size=0.05,
+            cache=False,
+        )
+
+    # Assert the output
+    assert len(overpass_server) == 1
+    assert "No OSM data retrieved with the following tags" in caplog.text
+    assert not osm_driver.OSM_TILE_CACHE_DIR.exists()
+
+
+def test_osm_request_cache(
+    overpass_server: list[bytes],
+):
+    polygon = box(0.0, 0.0, 0.03, 0.03)
+    # Call the function
+    osm_data = osm_request(polygon=polygon, tags={"building": True})
+
+    # Assert the output and the cache
+    assert len(overpass_server) == 1
+    assert len(list(osm_driver.OSM_RESULT_CACHE_DIR.glob("*.parquet"))) == 1
+
+    # Call again with an equal (but differently ordered) polygon
+    cached = osm_request(polygon=polygon.reverse(), tags={"building": True})
+
+    # Assert that the result came from the cache
+    assert len(overpass_server) == 1
+    assert cached.equals(osm_data)
+
+    # Other options result in a new request
+    osm_request(polygon=polygon, tags={"building": True}, reduce=False)
+    assert len(overpass_server) == 2
+    osm_request(polygon=polygon, tags={"building": True}, cache=False)
+    assert len(overpass_server) == 3
+
+
+def test_osm_request_cache_expired(
+    tmp_path: Path,
+    overpass_server: list[bytes],
+):
+    polygon = box(0.0, 0.0, 0.03, 0.03)
+    # Call the function with its own cache directory
+    osm_request(polygon=polygon, tags={"building": True}, cache_dir=tmp_path)
+    files = list(Path(tmp_path, "osm_results").glob("*.parquet"))
+    assert len(files) == 1
+
+    # Make the cached result two hours old
+    old = time.time() - 7200
+    os.utime(files[0], (old, old))
+
+    # Assert that the result is only taken from the cache when not expired
+    osm_request(polygon, {"building": True}, cache_dir=tmp_path, max_age=None)
+    assert len(overpass_server) == 1
+    osm_request(polygon, {"building": True}, cache_dir=tmp_path, max_age=3600)
+    assert len(overpass_server) == 2
+    # The refreshed result is valid again
+    osm_request(polygon, {"building": True}, cache_dir=tmp_path, max_age=3600)
+    assert len(overpass_server) == 2
+
+
+def test_osm_driver_read_cache_options(
+    tmp_path: Path,
+    overpass_server: list[bytes],
+):
+    cache_dir = Path(tmp_path, "custom")
+    driver = OSMDriver(options={"cache_dir": cache_dir.as_posix(), "max_age": 3600})
+    mask = gpd.GeoDataFrame(geometry=[box(0.0, 0.0, 0.03, 0.03)], crs=4326)
+    # Call the method twice, the second time from the cache
+    driver.read(uris=["building"], mask=mask)
+    driver.read(uris=["building"], mask=mask)
+
+    # Assert the output
+    assert len(overpass_server) == 1
+    assert len(list(Path(cache_dir, "osm_results").glob("*.parquet"))) == 1
+    assert not osm_driver.OSM_RESULT_CACHE_DIR.exists()
+
+    # Without the cache
+    driver = OSMDriver(options={"cache": False})
+    driver.read(uris=["building"], mask=mask)
+    assert len(overpass_server) == 2
+    assert not osm_driver.OSM_RESULT_CACHE_DIR.exists()
+
+
+def test_osm_request_precision(
+    overpass_server: list[bytes],
+):
+    # Call the function
+    osm_data = osm_request(
+        polygon=box(0.0, 0.0, 0.03, 0.03),
+        tags={"building": True},
+        precision=0.001,
+    )
+
+    # Assert the output, coordinates are on the grid
+    coords = shapely.get_coordinates(osm_data.geometry.values)
+    np.testing.assert_array_almost_equal(coords / 0.001, np.round(coords / 0.001))
+
+
+def test__geometry_parts():
+    # Collections with polygons and lines
+    geometry = np.array(
+        [
+            GeometryCollection([box(0, 0, 1, 1), LineString([(0, 0), (1, 1)])]),
+            GeometryCollection([box(0, 0, 1, 1), box(2, 2, 3, 3), Point(0, 0)]),
+            GeometryCollection([Point(0, 0)]),
+            box(0, 0, 1, 1),
+        ]
+    )
+
+    # Call the function
+    out = _geometry_parts(geometry, geom_type=["Polygon", "MultiPolygon"])
+
+    # Assert the output
+    assert shapely.get_type_id(out).tolist() == [3, 6, 7, 3]
+    assert out[3] is geometry[3]
+
+
 def test_osm_driver_read_raise_errors(
     build_region: gpd.GeoDataFrame,
     osm_data_path: Path,
@@ -128,7 +296,15 @@ def test_osm_driver_read(
     mock_method = mocker.patch.object(osm_driver, "osm_request")
     driver.read(uris=["building"], mask=build_region)
     mock_method.assert_called_with(
-        polygon=build_region.geometry[0], tags={"building": True}, geom_type=None
+        polygon=build_region.geometry[0],
+        tags={"building": True},
+        geom_type=None,
+        tile_size=None,
+        max_workers=2,
+        cache=True,
+        precision=None,
+        cache_dir=None,
+        max_age=osm_driver.OSM_CACHE_MAX_AGE,
     )
     # Test with a mask geodataframe containing two geometries
     mask = build_region.copy()
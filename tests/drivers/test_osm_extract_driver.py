@@ -0,0 +1,195 @@
+import logging
+import re
+from pathlib import Path
+
+import geopandas as gpd
+import pytest
+from hydromt import DataCatalog
+from hydromt.data_catalog.sources import GeoDataFrameSource
+from shapely.geometry import box
+
+from hydromt_fiat.drivers import OSMExtractDriver
+from hydromt_fiat.drivers.osm_extract_driver import osm_extract_read
+
+OSM_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6" generator="test">
+  <node id="1" lat="0.01" lon="0.01" version="1"/>
+  <node id="2" lat="0.01" lon="0.02" version="1"/>
+  <node id="3" lat="0.02" lon="0.02" version="1"/>
+  <node id="4" lat="0.5" lon="0.5" version="1"/>
+  <node id="5" lat="0.5" lon="0.51" version="1"/>
+  <node id="6" lat="0.51" lon="0.51" version="1"/>
+  <node id="7" lat="0.015" lon="0.012" version="1">
+    <tag k="amenity" v="school"/>
+  </node>
+  <way id="10" version="1">
+    <nd ref="1"/><nd ref="2"/><nd ref="3"/><nd ref="1"/>
+    <tag k="building" v="yes"/><tag k="roof:shape" v="flat"/>
+  </way>
+  <way id="11" version="1">
+    <nd ref="4"/><nd ref="5"/><nd ref="6"/><nd ref="4"/>
+    <tag k="building" v="house"/>
+  </way>
+  <way id="12" version="1">
+    <nd ref="1"/><nd ref="3"/>
+    <tag k="highway" v="residential"/>
+  </way>
+</osm>
+"""
+
+
+@pytest.fixture
+def osm_extract_path(tmp_path: Path) -> Path:
+    p = Path(tmp_path, "extract.osm")
+    p.write_text(OSM_XML)
+    return p
+
+
+@pytest.fixture
+def osm_extract_parquet_path(tmp_path: Path) -> Path:
+    p = Path(tmp_path, "extract.parquet")
+    gdf = gpd.GeoDataFrame(
+        {"building": ["yes", "house", None], "amenity": [None, None, "school"]},
+        geometry=[
+            box(0.01, 0.01, 0.02, 0.02),
+            box(0.5, 0.5, 0.51, 0.51),
+            box(0, 0, 1, 1),
+        ],
+        crs=4326,
+    )
+    gdf.to_parquet(p)
+    return p
+
+
+def test_osm_extract_read(osm_extract_path: Path):
+    # Call the function
+    osm_data = osm_extract_read(
+        path=osm_extract_path,
+        polygon=box(0, 0, 0.1, 0.1),
+        tags={"building": True},
+        geom_type=["MultiPolygon", "Polygon"],
+    )
+
+    # Assert the output, only the building within the polygon
+    assert osm_data.columns.to_list() == ["building", "geometry"]
+    assert len(osm_data) == 1
+    assert osm_data.geometry.type.iloc[0] == "Polygon"
+
+    # Tags without a column of their own and other geometry types
+    osm_data = osm_extract_read(
+        path=osm_extract_path,
+        polygon=box(0, 0, 0.1, 0.1),
+        tags={"roof:shape": "flat", "amenity": ["school"]},
+    )
+
+    # Assert the output
+    assert len(osm_data) == 2
+    assert sorted(osm_data.geometry.type) == ["Point", "Polygon"]
+
+
+def test_osm_extract_read_parquet(osm_extract_parquet_path: Path):
+    # Call the function
+    osm_data = osm_extract_read(
+        path=osm_extract_parquet_path,
+        polygon=box(0, 0, 0.1, 0.1),
+        tags={"building": True},
+        batch_size=1,
+    )
+
+    # Assert the output
+    assert osm_data.columns.to_list() == ["building", "geometry"]
+    assert osm_data["building"].to_list() == ["yes"]
+    assert osm_data.crs.to_epsg() == 4326
+
+    # With another predicate
+    osm_data = osm_extract_read(
+        path=osm_extract_parquet_path,
+        polygon=box(0, 0, 0.1, 0.1),
+        tags={"amenity": True},
+        predicate="within",
+    )
+
+    # Assert the output
+    assert osm_data is None
+
+
+def test_osm_extract_read_parquet_crs(
+    tmp_path: Path,
+    osm_extract_parquet_path: Path,
+):
+    # The same extract, stored in another crs
+    p = Path(tmp_path, "extract_3857.parquet")
+    gpd.read_parquet(osm_extract_parquet_path).to_crs(3857).to_parquet(p)
+
+    # Call the function
+    osm_data = osm_extract_read(
+        path=p,
+        polygon=box(0, 0, 0.1, 0.1),
+        tags={"building": True},
+    )
+
+    # Assert the output, filtered in the crs of the file and returned in WGS84
+    assert osm_data["building"].to_list() == ["yes"]
+    assert osm_data.crs.to_epsg() == 4326
+    assert osm_data.geometry.iloc[0].equals_exact(box(0.01, 0.01, 0.02, 0.02), 1e-9)
+
+
+def test_osm_extract_read_errors(tmp_path: Path):
+    # Assert the errors
+    with pytest.raises(
+        TypeError,
+        match=re.escape("Given geometry is not a (multi)polygon"),
+    ):
+        osm_extract_read(tmp_path, polygon=None, tags={"building": True})
+
+    with pytest.raises(FileNotFoundError, match="foo.parquet"):
+        osm_extract_read(
+            Path(tmp_path, "foo.parquet"),
+            polygon=box(0, 0, 1, 1),
+            tags={"building": True},
+        )
+
+
+def test_osm_extract_driver_read(
+    caplog: pytest.LogCaptureFixture,
+    osm_extract_parquet_path: Path,
+):
+    driver = OSMExtractDriver(options={"path": osm_extract_parquet_path.as_posix()})
+    mask = gpd.GeoDataFrame(geometry=[box(0, 0, 0.1, 0.1)] * 2, crs=4326)
+    caplog.set_level(logging.WARNING)
+    # Call the method
+    osm_data = driver.read(uris=["building"], mask=mask.to_crs(3857))
+
+    # Assert the output
+    assert "Received multiple geometries for mask" in caplog.text
+    assert osm_data["building"].to_list() == ["yes"]
+
+    # Assert the error without a path
+    driver = OSMExtractDriver()
+    with pytest.raises(ValueError, match="The path to the OSM extract is required"):
+        driver.read(uris=["building"], mask=mask)
+
+
+def test_osm_extract_driver_datacatalog(osm_extract_parquet_path: Path):
+    dc = DataCatalog()
+    # Same uri as with the OSM API driver, only a different driver
+    osm_source = GeoDataFrameSource(
+        name="osm_buildings",
+        uri="building",
+        driver={
+            "name": "osm_extract",
+            "options": {"path": osm_extract_parquet_path.as_posix()},
+        },
+        uri_resolver="osm_resolver",
+    )
+    dc.add_source(name="osm_buildings", source=osm_source)
+
+    # Read osm data from data catalog
+    building_data = dc.get_geodataframe(
+        "osm_buildings",
+        geom=gpd.GeoDataFrame(geometry=[box(0, 0, 0.1, 0.1)], crs=4326),
+    )
+
+    # Assert the output
+    assert isinstance(building_data, gpd.GeoDataFrame)
+    assert building_data["building"].to_list() == ["yes"]
@@ -1,10 +1,17 @@
 import logging
 
+import geopandas as gpd
 import numpy as np
 import pytest
 import xarray as xr
+from shapely.geometry import Point, box
 
-from hydromt_fiat.gis.raster import expand_raster_to_bounds
+from hydromt_fiat.gis.raster import (
+    cell_index,
+    conservative_regrid,
+    coverage_fraction,
+    expand_raster_to_bounds,
+)
 
 
 def test_expand_raster_to_bounds(
@@ -67,3 +74,135 @@ def test_expand_raster_to_bounds_nothing(
     assert da.shape == (10, 10)
     assert "Checking raster extent versus region bounding box" in caplog.text
     assert "Raster smaller than the region bounding box" not in caplog.text
+
+
+def test_cell_index(raster: xr.DataArray):
+    # Points in the grid, on the edge and outside of it
+    geometry = gpd.GeoSeries(
+        [
+            Point(0.5, 9.5),
+            Point(3.2, 4.7),
+            Point(10.0, 0.0),
+            Point(-1.0, 5.0),
+            box(1, 1, 3, 3),
+        ],
+        crs=4326,
+    )
+
+    # Call the function
+    rows, cols = cell_index(
+        geometry,
+        transform=raster.raster.transform,
+        shape=raster.raster.shape,
+    )
+
+    # Assert the output
+    assert rows.dtype == np.int32
+    np.testing.assert_array_equal(rows, [0, 5, -1, -1, 8])
+    np.testing.assert_array_equal(cols, [0, 3, -1, -1, 2])
+
+
+def test_coverage_fraction(raster: xr.DataArray):
+    # Polygons partially covering cells and one outside of the raster
+    geometry = gpd.GeoSeries(
+        [box(0, 9, 1.5, 10), box(2.5, 2.5, 3.5, 3.5), box(20, 20, 21, 21)],
+        crs=4326,
+    )
+
+    # Call the function
+    idx, rows, cols, fraction = coverage_fraction(
+        geometry,
+        transform=raster.raster.transform,
+        shape=raster.raster.shape,
+    )
+
+    # Assert the output
+    np.testing.assert_array_equal(idx, [0, 0, 1, 1, 1, 1])
+    np.testing.assert_array_equal(rows, [0, 0, 6, 6, 7, 7])
+    np.testing.assert_array_equal(cols, [0, 1, 2, 3, 2, 3])
+    np.testing.assert_array_almost_equal(fraction, [1, 0.5, 0.25, 0.25, 0.25, 0.25])
+
+
+def test_conservative_regrid_block(raster: xr.DataArray):
+    raster[0, 0] = -9999
+    # A grid with cells twice the size
+    grid_like = xr.DataArray(
+        data=np.zeros((5, 5)),
+        coords={"y": np.arange(9, 0, -2.0), "x": np.arange(1, 10, 2.0)},
+        dims=("y", "x"),
+    )
+    grid_like.raster.set_crs(4326)
+
+    # Call the function
+    da = conservative_regrid(raster.chunk(5), grid_like=grid_like)
+
+    # Assert the output, lazy and with the totals conserved
+    assert da.chunks is not None
+    assert da.raster.identical_grid(grid_like)
+    assert da.sum().values == 99
+    assert da.values[0, 0] == 3
+    assert da.raster.nodata == -9999
+
+
+def test_conservative_regrid_area(raster: xr.DataArray):
+    # A grid with cells 2.5 times the size, extending beyond the raster
+    grid_like = xr.DataArray(
+        data=np.zeros((5, 5)),
+        coords={"y": np.arange(11.25, -1, -2.5), "x": np.arange(1.25, 13, 2.5)},
+        dims=("y", "x"),
+    )
+    grid_like.raster.set_crs(4326)
+
+    # Call the function
+    da = conservative_regrid(raster, grid_like=grid_like)
+
+    # Assert the output
+    assert da.raster.identical_grid(grid_like)
+    valid = da.values != -9999
+    assert np.isclose(da.values[valid].sum(), 100)
+    assert np.isclose(da.values[1, 0], 6.25)
+    assert (~valid).sum() == 9
+
+
+def test_conservative_regrid_crs():
+    # A raster of 100 m cells in UTM
+    raster = xr.DataArray(
+        data=np.ones((50, 50)),
+        coords={
+            "y": np.arange(5_800_000 - 50, 5_795_000, -100.0),
+            "x": np.arange(500_050, 505_000, 100.0),
+        },
+        dims=("y", "x"),
+    )
+    raster.raster.set_crs(32631)
+    raster.raster.set_nodata(-9999)
+    # A geographic grid covering the raster
+    xmin, ymin, xmax, ymax = raster.raster.transform_bounds(4326)
+    grid_like = xr.DataArray(
+        data=np.zeros((20, 20)),
+        coords={
+            "y": np.linspace(ymax + 0.01, ymin - 0.01, 20),
+            "x": np.linspace(xmin - 0.01, xmax + 0.01, 20),
+        },
+        dims=("y", "x"),
+    )
+    grid_like.raster.set_crs(4326)
+
+    # Call the function
+    da = conservative_regrid(raster, grid_like=grid_like)
+
+    # Assert the totals are conserved
+    valid = da.values != -9999
+    assert np.isclose(da.values[valid].sum(), 2500)
+
+    # Assert the totals are conserved per layer
+    layers = xr.concat([raster, raster * 2], dim="layer")
+    layers.raster.set_nodata(-9999)
+    da = conservative_regrid(layers, grid_like=grid_like)
+    totals = da.where(da != -9999).sum(("y", "x")).values
+    np.testing.assert_allclose(totals, [2500, 5000])
+
+    # Only the part within the grid is accounted for
+    grid_like = grid_like.isel(x=slice(0, 10))
+    da = conservative_regrid(raster, grid_like=grid_like)
+    assert np.isclose(da.where(da != -9999).sum().values, 1250, rtol=0.05)
@@ -1,6 +1,6 @@
 import xarray as xr
 
-from hydromt_fiat.gis.raster_utils import force_ns
+from hydromt_fiat.gis.raster_utils import GridSignature, force_ns, grid_signature
 
 
 def test_force_ns(ns_raster: xr.DataArray):
@@ -22,3 +22,21 @@ def test_force_ns_flip(ns_raster: xr.DataArray):
     # Assert the output
     assert da.raster.res[1] < 1
     assert da.raster.res[1] != raster.raster.res[1]  # It got flipped
+
+
+def test_grid_signature(ns_raster: xr.DataArray):
+    # Call the function
+    sig = grid_signature(ns_raster)
+
+    # Assert the output
+    assert isinstance(sig, GridSignature)
+    assert sig.transform == (1.0, 0.0, -0.5, 0.0, -1.0, 7.5)
+    assert sig.shape == (8, 8)
+    assert hash(sig) == hash(grid_signature(ns_raster.copy()))
+
+
+def test_grid_signature_differ(ns_raster: xr.DataArray):
+    # Assert signature differs for another orientation or shape
+    sig = grid_signature(ns_raster)
+    assert sig != grid_signature(ns_raster.raster.flipud())
+    assert sig != grid_signature(ns_raster.isel(x=slice(0, 4)))
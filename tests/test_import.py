@@ -0,0 +1,41 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Budget (in seconds) of importing the plugin, not counting hydromt itself
+IMPORT_BUDGET = 0.5
+# Like the plugin discovery of hydromt
+IMPORT_CODE = """
+import sys
+import hydromt
+import hydromt_fiat
+import hydromt_fiat.drivers
+import hydromt_fiat.drivers.resolvers
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def test_import(tmp_path: Path):
+    env = {**os.environ, "HOME": tmp_path.as_posix()}
+    # Call it in a clean interpreter
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CODE],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=Path(__file__).parents[1],
+        check=True,
+    )
+    # Assert the heavy (unused) dependencies are not imported
+    modules = p.stdout.strip().split(",")
+    assert "osmnx" not in modules
+    assert "minio" not in modules
+    # The core of pyarrow is imported by pandas, the parquet module is not
+    assert "pyarrow.parquet" not in modules
+    # Assert there are no side effects
+    assert not Path(tmp_path, ".cache").exists()
+    # Assert the import time of the top level plugin modules
+    cumulative = re.findall(r"\|\s+(\d+) \| hydromt_fiat", p.stderr)
+    assert sum(int(item) for item in cumulative) / 1e6 < IMPORT_BUDGET
@@ -55,3 +55,16 @@ def test_standard_unit_length(caplog: pytest.LogCaptureFixture):
     assert (
         "Given unit (foot) does not match the standard/ default unit (meter)"
     ) in caplog.text
+
+
+def test_standard_unit_cached(caplog: pytest.LogCaptureFixture):
+    caplog.set_level(logging.WARNING)
+    # Call the function twice with the same unit
+    quantity = standard_unit("cm", default="m")
+    caplog.clear()
+    quantity2 = standard_unit("cm", default="m")
+
+    # Assert the conversion is reused, but still warned about
+    assert quantity2 is quantity
+    assert np.isclose(quantity2.magnitude, 0.01)
+    assert "Given unit (centimeter) does not match" in caplog.text
@@ -173,6 +173,26 @@ def rotated_grid() -> xr.DataArray:
     return da
 
 
+@pytest.fixture
+def hazard_time_data() -> xr.DataArray:
+    # Time-varying hazard data, the maximum is 2 * 9 = 18
+    data = np.ones((10, 5, 5)) * np.arange(10)[:, None, None]
+    data[4, 2, 2] = 18
+    da = xr.DataArray(
+        data=data,
+        coords={
+            "time": pd.date_range("2020-01-01", periods=10, freq="h"),
+            "y": np.arange(4.5, 0.0, -1),
+            "x": np.arange(0.5, 5.0, 1),
+        },
+        dims=("time", "y", "x"),
+        name="flood",
+    )
+    da.raster.set_crs(28992)
+    da.raster.set_nodata(-9999)
+    return da
+
+
 @pytest.fixture
 def vulnerability_identifiers_dummy() -> pd.DataFrame:
     df = pd.DataFrame(
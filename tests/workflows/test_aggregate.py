@@ -1,8 +1,16 @@
+from pathlib import Path
+
 import geopandas as gpd
 import numpy as np
+import pytest
+from shapely.geometry import box
 
+from hydromt_fiat.utils import AREA__SQM, GEOMETRY, SQUARE__ID
 from hydromt_fiat.workflows.aggregate import (
+    aggregate_layers,
     aggregate_spatially,
+    aggregate_square,
+    aggregate_stream,
     prep_data_for_aggregation,
 )
 
@@ -121,3 +129,208 @@ def test_aggregate_spatially_areal_mean_per(
         desired=84.1,
         decimal=1,
     )
+
+
+def test_aggregate_spatially_input(
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    geom_types = prepped_aggr_data.geom_type.unique().tolist()
+    columns = prepped_aggr_data.columns.tolist()
+    # Call the function
+    vg = aggregate_spatially(
+        output_data=prepped_aggr_data,
+        aggregation_areas=vector_grid,
+        method="max",
+    )
+
+    # Assert the output and that the input data is left untouched
+    assert len(vg) == 20
+    assert AREA__SQM in vg
+    assert prepped_aggr_data.geom_type.unique().tolist() == geom_types
+    assert prepped_aggr_data.columns.tolist() == columns
+
+
+def test_aggregate_square(
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Call the function, keeping the empty cells
+    sq = aggregate_square(
+        output_data=prepped_aggr_data,
+        res=100,
+        unit="m",
+        method="mean",
+        keep_empty=True,
+    )
+    vg = aggregate_spatially(
+        output_data=prepped_aggr_data,
+        aggregation_areas=vector_grid,
+        method="mean",
+    )
+
+    # Assert the output is the same as on the vector grid
+    assert len(sq) == 20
+    np.testing.assert_array_equal(sq[SQUARE__ID], vector_grid[SQUARE__ID])
+    assert sq.geom_equals(vector_grid.geometry).all()
+    np.testing.assert_array_almost_equal(
+        sq["max_damage_content"], vg["max_damage_content"]
+    )
+
+
+def test_aggregate_square_occupied(
+    prepped_aggr_data: gpd.GeoDataFrame,
+):
+    # Call the function
+    sq = aggregate_square(
+        output_data=prepped_aggr_data,
+        res=100,
+        unit="m",
+        method="sum",
+    )
+
+    full = aggregate_square(
+        output_data=prepped_aggr_data,
+        res=100,
+        unit="m",
+        method="sum",
+        keep_empty=True,
+    )
+
+    # Assert the output, only the occupied cells of the full grid
+    occupied = full[full["max_damage_content"].notna()]
+    assert len(sq) == len(occupied)
+    assert sq.columns.tolist() == full.columns.tolist()
+    np.testing.assert_array_equal(sq[SQUARE__ID], occupied[SQUARE__ID])
+    assert sq["max_damage_content"].notna().all()
+    np.testing.assert_almost_equal(
+        sq["max_damage_content"].sum(),
+        prepped_aggr_data["max_damage_content"].sum(),
+    )
+
+
+def test_aggregate_square_default():
+    # Two objects in the lower left cell and one in the upper right cell
+    gdf = gpd.GeoDataFrame(
+        {"max_damage_content": [1.0, 2.0, 5.0]},
+        geometry=[box(0, 0, 1, 1), box(0.5, 0.5, 1.5, 1.5), box(3, 3, 4, 4)],
+        crs=28992,
+    )
+
+    # Call the function, with the default of only the occupied cells
+    sq = aggregate_square(output_data=gdf, res=2, unit="m", method="sum")
+
+    # Assert the output, 2 out of 4 cells with their number in the grid
+    assert len(sq) == 2
+    assert sq.columns.tolist()[:2] == [GEOMETRY, SQUARE__ID]
+    assert sq[SQUARE__ID].tolist() == [1, 2]
+    assert sq["max_damage_content"].tolist() == [5, 3]
+    assert sq.geom_equals(gpd.GeoSeries([box(2, 2, 4, 4), box(0, 0, 2, 2)])).all()
+
+
+def test_aggregate_layers(
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Call the function with two sets of areas
+    coarse = vector_grid.dissolve(vector_grid[SQUARE__ID] // 4).reset_index(drop=True)
+    out = aggregate_layers(
+        output_data=prepped_aggr_data,
+        aggregation_areas={"fine": vector_grid, "coarse": coarse},
+        methods=["sum", "mean", "count"],
+    )
+
+    # Assert the output
+    assert list(out) == ["fine", "coarse"]
+    assert len(out["fine"]) == 20
+    assert len(out["coarse"]) == 5
+    assert "max_damage_content_count" in out["fine"]
+    # Same as aggregating one by one
+    vg = aggregate_spatially(
+        output_data=prepped_aggr_data,
+        aggregation_areas=vector_grid,
+        method="sum",
+    )
+    np.testing.assert_array_almost_equal(
+        out["fine"]["max_damage_content_sum"],
+        vg["max_damage_content"],
+    )
+
+
+def test_aggregate_spatially_split(
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Call the function
+    vg = aggregate_spatially(
+        output_data=prepped_aggr_data,
+        aggregation_areas=vector_grid,
+        method="sum",
+        split=True,
+    )
+
+    # Assert the output, the total is conserved when all objects are covered
+    assert len(vg) == 20
+    np.testing.assert_almost_equal(
+        vg["max_damage_content"].sum(),
+        prepped_aggr_data["max_damage_content"].sum(),
+        decimal=0,
+    )
+
+
+def test_aggregate_spatially_split_errors(
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Assert the error for unsupported methods
+    with pytest.raises(ValueError, match="Method 'max' not supported for splitting"):
+        aggregate_spatially(
+            output_data=prepped_aggr_data,
+            aggregation_areas=vector_grid,
+            method="max",
+            split=True,
+        )
+
+
+def test_aggregate_stream(
+    tmp_path: Path,
+    prepped_aggr_data: gpd.GeoDataFrame,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Write the data to a file
+    p = Path(tmp_path, "foo.gpkg")
+    prepped_aggr_data.to_file(p)
+
+    # Call the function with a batch size smaller than the data
+    out = aggregate_stream(
+        path=p,
+        aggregation_areas=vector_grid,
+        method=["sum", "count", "max", "mean"],
+        batch_size=5,
+    )
+
+    # Assert the output, same as in memory
+    assert len(out) == 20
+    ref = aggregate_layers(
+        output_data=prepped_aggr_data,
+        aggregation_areas={"fine": vector_grid},
+        methods=["sum", "count", "max", "mean"],
+    )["fine"]
+    for item in ["sum", "count", "max", "mean"]:
+        np.testing.assert_array_almost_equal(
+            out[f"max_damage_content_{item}"],
+            ref[f"max_damage_content_{item}"],
+        )
+
+
+def test_aggregate_stream_errors(
+    tmp_path: Path,
+    vector_grid: gpd.GeoDataFrame,
+):
+    # Assert the error for unsupported methods
+    with pytest.raises(ValueError, match=r"Method\(s\) \['median'\] not supported"):
+        aggregate_stream(
+            path=Path(tmp_path, "foo.gpkg"),
+            aggregation_areas=vector_grid,
+            method="median",
+        )
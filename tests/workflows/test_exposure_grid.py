@@ -1,11 +1,15 @@
 import logging
 
+import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 import xarray as xr
+from shapely.geometry import Point, box
 
-from hydromt_fiat.utils import EXPOSURE__TYPE, FN_CURVE, OBJECT__TYPE
-from hydromt_fiat.workflows import exposure_grid_setup
+from hydromt_fiat.gis.raster import cell_index
+from hydromt_fiat.utils import EXPOSURE__TYPE, FN_CURVE, MAX, OBJECT__TYPE
+from hydromt_fiat.workflows import exposure_grid_rasterize, exposure_grid_setup
 
 
 def test_exposure_grid_setup(
@@ -60,6 +64,36 @@ def test_exposure_grid_setup_link_no(
     assert ds.industrial_content.attrs.get(FN_CURVE) == "in2"
 
 
+def test_exposure_grid_setup_conservative(
+    exposure_grid_data_ind: xr.DataArray,
+    vulnerability_link: pd.DataFrame,
+):
+    # A grid with cells twice the size
+    da = exposure_grid_data_ind
+    dims = {da.raster.x_dim: 2, da.raster.y_dim: 2}
+    grid_like = da.coarsen(dims, boundary="trim").mean()
+
+    # Call the function
+    ds = exposure_grid_setup(
+        grid_like=grid_like.to_dataset(name="grid"),
+        exposure_data={"industrial_content": exposure_grid_data_ind},
+        vulnerability=vulnerability_link,
+        conservative=True,
+    )
+
+    # Assert the output, totals within the grid are conserved
+    da = ds.industrial_content
+    nodata = exposure_grid_data_ind.raster.nodata
+    ref = exposure_grid_data_ind.isel(
+        {dim: slice(0, grid_like[dim].size * 2) for dim in dims}
+    )
+    assert da.raster.identical_grid(grid_like)
+    assert np.isclose(
+        da.where(da != nodata).sum().values,
+        ref.where(ref != nodata).sum().values,
+    )
+
+
 def test_exposure_grid_setup_alt(
     caplog: pytest.LogCaptureFixture,
     exposure_grid_data_ind: xr.DataArray,
@@ -121,3 +155,126 @@ def test_exposure_grid_setup_errors(
             vulnerability=vulnerability_link,
             exposure_link=pd.DataFrame(),
         )
+
+
+def test_exposure_grid_rasterize(
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Call the function
+    ds = exposure_grid_rasterize(
+        exposure_data=exposure_vector_clipped,
+        grid_like=hazard_clipped,
+        batch_size=100,
+    )
+
+    # Assert the output
+    assert ds.raster.identical_grid(hazard_clipped)
+    assert len(ds.data_vars) != 0
+    assert all(FN_CURVE in da.attrs for da in ds.data_vars.values())
+    # The total value of the objects within the grid is conserved
+    rows, _ = cell_index(
+        exposure_vector_clipped.to_crs(hazard_clipped.raster.crs).geometry,
+        transform=hazard_clipped.raster.transform,
+        shape=hazard_clipped.raster.shape,
+    )
+    ref = exposure_vector_clipped[rows >= 0].filter(like=f"{MAX}_").sum().sum()
+    assert np.isclose(ds.to_array().sum().values, ref)
+
+
+def test_exposure_grid_rasterize_split(
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Call the function, with and without splitting
+    ds = exposure_grid_rasterize(
+        exposure_data=exposure_vector_clipped,
+        grid_like=hazard_clipped,
+        split=True,
+    )
+    ref = exposure_grid_rasterize(
+        exposure_data=exposure_vector_clipped,
+        grid_like=hazard_clipped,
+    )
+
+    # Assert the totals are roughly the same, but the spread differs
+    assert list(ds.data_vars) == list(ref.data_vars)
+    assert np.isclose(
+        ds.to_array().sum().values, ref.to_array().sum().values, rtol=0.05
+    )
+    assert (ds.to_array() > 0).sum() >= (ref.to_array() > 0).sum()
+
+
+def test_exposure_grid_rasterize_partial():
+    # One polygon half outside of the grid, one point and one object to skip
+    gdf = gpd.GeoDataFrame(
+        {
+            OBJECT__TYPE: ["res", "res", "com"],
+            f"{MAX}_damage_structure": [100.0, 10.0, np.nan],
+            "fn_damage_structure": ["c1", "c1", "c2"],
+        },
+        geometry=[box(-1, 0, 1, 1), Point(2.5, 2.5), box(0, 0, 4, 4)],
+        crs=28992,
+    )
+    grid_like = xr.DataArray(
+        data=np.zeros((4, 4)),
+        coords={"y": np.arange(3.5, 0, -1), "x": np.arange(0.5, 4, 1)},
+        dims=("y", "x"),
+    )
+    grid_like.raster.set_crs(28992)
+
+    # Call the function
+    ds = exposure_grid_rasterize(gdf, grid_like=grid_like, split=True, batch_size=1)
+
+    # Assert the output, only the part inside the grid is accounted for
+    assert ds["com_damage_structure"].values.sum() == 0
+    da = ds["res_damage_structure"]
+    assert da.values[3, 0] == 50
+    assert da.values[1, 2] == 10
+    assert da.values.sum() == 60
+
+
+def test_exposure_grid_rasterize_shared_type():
+    # One object type linked to two vulnerability curves
+    gdf = gpd.GeoDataFrame(
+        {
+            OBJECT__TYPE: ["res", "res", "com"],
+            f"{MAX}_damage_structure": [100.0, 10.0, 1.0],
+            "fn_damage_structure": ["c1", "c2", "c3"],
+        },
+        geometry=[Point(0.5, 0.5), Point(2.5, 2.5), Point(3.5, 3.5)],
+        crs=28992,
+    )
+    grid_like = xr.DataArray(
+        data=np.zeros((4, 4)),
+        coords={"y": np.arange(3.5, 0, -1), "x": np.arange(0.5, 4, 1)},
+        dims=("y", "x"),
+    )
+    grid_like.raster.set_crs(28992)
+
+    # Call the function
+    ds = exposure_grid_rasterize(gdf, grid_like=grid_like, batch_size=2)
+
+    # Assert the output, the shared object type gets a layer per curve
+    assert sorted(ds.data_vars) == [
+        "com_damage_structure",
+        "res_c1_damage_structure",
+        "res_c2_damage_structure",
+    ]
+    assert ds["res_c1_damage_structure"].attrs[FN_CURVE] == "c1"
+    assert ds["res_c1_damage_structure"].values.sum() == 100
+    assert ds["res_c2_damage_structure"].attrs[FN_CURVE] == "c2"
+    assert ds["res_c2_damage_structure"].values[1, 2] == 10
+    assert ds["com_damage_structure"].values[0, 3] == 1
+
+
+def test_exposure_grid_rasterize_errors(
+    exposure_vector_clipped: gpd.GeoDataFrame,
+    hazard_clipped: xr.Dataset,
+):
+    # Assert the error when there is no maximum damage
+    with pytest.raises(ValueError, match="No maximum damage columns"):
+        exposure_grid_rasterize(
+            exposure_data=exposure_vector_clipped[["geometry"]],
+            grid_like=hazard_clipped,
+        )
@@ -1,9 +1,11 @@
+import geopandas as gpd
 import numpy as np
 import pytest
 import xarray as xr
+from shapely.geometry import box
 
-from hydromt_fiat.utils import EVENT, RISK
-from hydromt_fiat.workflows import hazard_setup
+from hydromt_fiat.utils import EVENT, METHOD, OBJECT, RISK
+from hydromt_fiat.workflows import hazard_sample, hazard_setup, hazard_zonal
 
 
 def test_hazard_setup_risk(hazard_event_data_highres: xr.DataArray):
@@ -98,3 +100,138 @@ def test_hazard_setup_unit_differ(
         in caplog.text
     )
     assert np.isclose(avg_level_ft, 0.547029)
+
+
+def test_hazard_setup_stack(
+    hazard_event_data: xr.DataArray,
+    hazard_event_data_highres: xr.DataArray,
+):
+    # Call the function with the stack option
+    hazard_data = {"event1": hazard_event_data, "event2": hazard_event_data_highres}
+    ds = hazard_setup(
+        grid_like=None,
+        hazard_data=hazard_data,
+        hazard_type="flooding",
+        return_periods=[10, 100],
+        risk=True,
+        stack=True,
+    )
+
+    # Assert the output
+    assert list(ds.data_vars) == ["flooding"]
+    assert ds.flooding.dims == (EVENT, "y", "x")
+    assert ds.flooding.shape == (2, 5, 4)
+    assert ds.flooding.chunks[0] == (1, 1)
+    assert ds.event.values.tolist() == ["event1", "event2"]
+    assert ds.rp.values.tolist() == [10, 100]
+    assert ds.analysis == RISK
+
+
+def test_hazard_setup_time(hazard_time_data: xr.DataArray):
+    # Call the function with time-varying data
+    hazard_data = {"flood": hazard_time_data}
+    ds = hazard_setup(
+        grid_like=None,
+        hazard_data=hazard_data,
+        hazard_type="flooding",
+    )
+
+    # Assert the output, reduced to the maximum
+    assert ds.flood.dims == ("y", "x")
+    assert ds.flood.max().values == 18
+    assert ds.flood.min().values == 9
+
+
+def test_hazard_sample(
+    hazard_clipped: xr.Dataset,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    # Call the function
+    da = hazard_sample(hazard=hazard_clipped, exposure_data=exposure_vector_clipped)
+
+    # Assert the output
+    assert da.dims == (OBJECT, EVENT)
+    assert da.shape == (len(exposure_vector_clipped), len(hazard_clipped.data_vars))
+    assert da[EVENT].values.tolist() == list(hazard_clipped.data_vars)
+    # Compare with sampling the centroids one by one
+    centroids = exposure_vector_clipped.to_crs(hazard_clipped.raster.crs).centroid
+    name = list(hazard_clipped.data_vars)[0]
+    ref = hazard_clipped[name].sel(
+        x=xr.DataArray(centroids.x.values, dims=OBJECT),
+        y=xr.DataArray(centroids.y.values, dims=OBJECT),
+        method="nearest",
+    )
+    ref = ref.where(ref != hazard_clipped[name].raster.nodata)
+    np.testing.assert_array_equal(da.sel({EVENT: name}).values, ref.values)
+
+
+def test_hazard_sample_stack(
+    hazard_clipped: xr.Dataset,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    # Stack the hazard data along the event dimension
+    names = list(hazard_clipped.data_vars)
+    stacked = xr.concat(
+        [hazard_clipped[name] for name in names],
+        dim=xr.DataArray(names, dims=EVENT),
+    ).to_dataset(name="flooding")
+    stacked["flooding"].raster.set_nodata(hazard_clipped[names[0]].raster.nodata)
+
+    # Call the function
+    da = hazard_sample(hazard=stacked, exposure_data=exposure_vector_clipped)
+    ref = hazard_sample(hazard=hazard_clipped, exposure_data=exposure_vector_clipped)
+
+    # Assert the output is the same as the unstacked data
+    assert da[EVENT].values.tolist() == names
+    np.testing.assert_array_equal(da.values, ref.values)
+
+
+def test_hazard_sample_method():
+    # Hazard with a different value per column
+    hazard = xr.DataArray(
+        data=np.tile(np.arange(4.0), (4, 1)),
+        coords={"y": np.arange(3.5, 0, -1), "x": np.arange(0.5, 4, 1)},
+        dims=("y", "x"),
+        name="flood",
+    )
+    hazard.raster.set_crs(28992)
+    hazard.raster.set_nodata(-9999)
+    # Twice the same object, sampled with both methods
+    exposure = gpd.GeoDataFrame(
+        {METHOD: ["centroid", "area"]},
+        geometry=[box(0, 0, 2.2, 1), box(0, 0, 2.2, 1)],
+        crs=28992,
+    )
+
+    # Call the function
+    da = hazard_sample(hazard=hazard.to_dataset(), exposure_data=exposure)
+
+    # Assert the output, the area is the weighted mean of the covered cells
+    assert da.values[0, 0] == 1
+    assert np.isclose(da.values[1, 0], (0 + 1 + 0.2 * 2) / 2.2)
+
+
+def test_hazard_zonal(
+    hazard_clipped: xr.Dataset,
+    exposure_vector_clipped: gpd.GeoDataFrame,
+):
+    # Call the function, with small tiles
+    ds = hazard_zonal(
+        hazard=hazard_clipped,
+        exposure_data=exposure_vector_clipped,
+        tile_size=8,
+    )
+
+    # Assert the output
+    assert list(ds.data_vars) == ["mean", "max", "wet_fraction"]
+    assert ds["mean"].dims == (OBJECT, EVENT)
+    assert ds[EVENT].values.tolist() == list(hazard_clipped.data_vars)
+    assert not (ds["mean"] > ds["max"] + 1e-6).any()
+    assert not ((ds.wet_fraction < 0) | (ds.wet_fraction > 1)).any()
+    # Same as a single tile
+    ref = hazard_zonal(
+        hazard=hazard_clipped,
+        exposure_data=exposure_vector_clipped,
+        tile_size=10000,
+    )
+    xr.testing.assert_allclose(ds, ref)
@@ -3,7 +3,11 @@ import logging
 import pytest
 import xarray as xr
 
-from hydromt_fiat.workflows.utils import _merge_dataarrays, _process_dataarray
+from hydromt_fiat.workflows.utils import (
+    _merge_dataarrays,
+    _process_dataarray,
+    _reduce_dataarray,
+)
 
 
 def test__process_dataarray(
@@ -49,3 +53,76 @@ def test__merge_dataarrays(
 defaulting to first specified grid for transform and extent"
     assert warning_msg in caplog.text
     assert isinstance(ds, xr.Dataset)
+
+
+def test__merge_dataarrays_reuse(
+    caplog: pytest.LogCaptureFixture,
+    hazard_event_data: xr.DataArray,
+    hazard_event_data_highres: xr.DataArray,
+):
+    caplog.set_level(logging.INFO)
+    # One matching grid and one that needs regridding
+    das = [hazard_event_data.rename("foo"), hazard_event_data_highres.rename("bar")]
+    # Call the function
+    ds = _merge_dataarrays(grid_like=hazard_event_data, dataarrays=das)
+
+    # Assert the logging and the output
+    assert "Reused 1 out of 2 grid(s) without regridding" in caplog.text
+    assert ds.foo.shape == ds.bar.shape == (5, 4)
+
+
+def test__reduce_dataarray(hazard_time_data: xr.DataArray):
+    # Call the function
+    da = _reduce_dataarray(hazard_time_data, dim="time", chunksize=3)
+
+    # Assert the output, lazy and reduced
+    assert da.chunks is not None
+    assert da.dims == ("y", "x")
+    assert da.max().values == 18
+    assert da.min().values == 9
+
+
+def test__reduce_dataarray_method(hazard_time_data: xr.DataArray):
+    # Call the function with another reduce method
+    da = _reduce_dataarray(hazard_time_data, dim="time", method="mean")
+
+    # Assert the output
+    assert da.dims == ("y", "x")
+    assert da.min().values == 4.5
+
+
+@pytest.mark.parametrize(
+    ("method", "expected"), [("max", 4), ("mean", 3.5), ("min", 3), ("sum", 7)]
+)
+def test__reduce_dataarray_nodata(
+    hazard_time_data: xr.DataArray,
+    method: str,
+    expected: float,
+):
+    # Nodata in some of the timesteps, all of them for one cell
+    da = hazard_time_data.isel(time=slice(2, 6)).copy()
+    da[[0, 3], 0, 0] = -9999
+    da[:, 1, 1] = -9999
+
+    # Call the function
+    da = _reduce_dataarray(da, dim="time", method=method)
+
+    # Assert the output, the nodata is ignored
+    assert da.values[0, 0] == expected
+    assert da.values[1, 1] == -9999
+    assert da.raster.nodata == -9999
+
+
+def test__reduce_dataarray_nothing(hazard_time_data: xr.DataArray):
+    # Nothing to reduce
+    da = hazard_time_data.isel(time=0)
+    da_out = _reduce_dataarray(da, dim="time")
+
+    # Assert that it is the same object
+    assert id(da) == id(da_out)
+
+
+def test__reduce_dataarray_errors(hazard_time_data: xr.DataArray):
+    # Unknown method
+    with pytest.raises(ValueError, match="Reduce method 'foo' not supported"):
+        _reduce_dataarray(hazard_time_data, dim="time", method="foo")